@@ -12,6 +12,7 @@ if [ "$ENV" = "development" ] ; then
 fi
 
 python src/manage.py migrate                  # Apply database migrations
+python src/manage.py createcachetable         # Create the shared cache table
 python src/manage.py collectstatic --noinput  # Collect static files
 
 if [ "$ENV" = "development" ] ; then
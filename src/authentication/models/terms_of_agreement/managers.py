@@ -9,6 +9,13 @@ class TermsOfAgreementManager(models.Manager):
         except ObjectDoesNotExist:
             return None
 
+    def get_latest_version(self) -> tuple | None:
+        """
+        Returns: The id and modified time of the row get_latest returns, without
+        reading the terms
+        """
+        return self.order_by("created").values_list("id", "modified").first()
+
 
 class UserTermsOfAgreementManager(models.Manager):
     def accept_term_of_agreement(self, user, terms_of_agreement):
@@ -0,0 +1,61 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from authentication.models import TermsOfAgreement
+
+
+def get_terms(client, **headers):
+    """
+    Make a request to the terms of agreement endpoint
+    Args:
+        client: HTTP Client
+        headers: Extra request headers
+    Returns: Terms of agreement endpoint response
+    """
+    return client.get(path=reverse("auth:terms-of-agreement"), **headers)
+
+
+@pytest.fixture
+def terms(db):
+    return TermsOfAgreement.objects.create(terms_of_agreement="Be nice")
+
+
+def test_get_terms_successfully(client, terms):
+    """Check if the terms are returned with an ETag and a Last-Modified"""
+    response = get_terms(client)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"]["terms"]["id"] == str(terms.id)
+    assert response["ETag"]
+    assert response["Last-Modified"]
+
+
+def test_get_terms_not_modified(client, terms):
+    """Check if a client with the current ETag gets an empty 304"""
+    etag = get_terms(client)["ETag"]
+
+    response = get_terms(client, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+
+
+def test_get_terms_modified(client, terms):
+    """Check if a changed row gets a new ETag"""
+    etag = get_terms(client)["ETag"]
+    terms.terms_of_agreement = "Be very nice"
+    terms.save()
+
+    response = get_terms(client, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["ETag"] != etag
+
+
+def test_get_terms_not_found(client, db):
+    """Check if there is no ETag without terms"""
+    response = get_terms(client)
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert not response.has_header("ETag")
@@ -1,3 +1,5 @@
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from drf_spectacular.utils import extend_schema
 from rest_framework import status
 from rest_framework.permissions import AllowAny
@@ -6,19 +8,43 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from authentication.enums.messages import TermsMessages
+from authentication.models import TermsOfAgreement
+from core.utils.http.etag import make_etag
 
 from .docs import get_latest
 from .serializers import TermsGetResponseSerializer
 from .use_case import GetLastAgreementUseCase
 
 
+def get_terms_version(request: Request) -> tuple | None:
+    # Read once for both the ETag and the Last-Modified of the request
+    if not hasattr(request, "terms_version"):
+        request.terms_version = TermsOfAgreement.objects.get_latest_version()
+    return request.terms_version
+
+
+def get_terms_etag(request: Request, *args, **kwargs) -> str | None:
+    version = get_terms_version(request)
+    if version is None:
+        return None
+    return make_etag(*version, request.META.get("HTTP_ACCEPT", ""))
+
+
+def get_terms_last_modified(request: Request, *args, **kwargs):
+    version = get_terms_version(request)
+    return version[1] if version is not None else None
+
+
 class TermsOfAgreements(APIView):
     permission_classes = [AllowAny]
 
     @extend_schema(**get_latest)
+    @method_decorator(
+        condition(etag_func=get_terms_etag, last_modified_func=get_terms_last_modified)
+    )
     def get(self, request: Request) -> Response:
         """
-        Get the latest Terms of Agreement.
+        Get the latest Terms of Agreement, answering 304 when the client copy is current.
         """
         terms_of_agreement = GetLastAgreementUseCase().execute()
         response_body = TermsGetResponseSerializer(
@@ -0,0 +1,19 @@
+import os
+
+import pytest
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "benchmark: slow test seeding large tables, run with RUN_BENCHMARKS=1"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if os.environ.get("RUN_BENCHMARKS"):
+        return
+
+    skip_benchmark = pytest.mark.skip(reason="Set RUN_BENCHMARKS=1 to run benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
@@ -0,0 +1,188 @@
+import time
+import zlib
+from typing import Iterator
+
+import brotli
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.regex_helper import _lazy_re_compile
+
+from core.utils.metrics.registry import metrics
+
+re_no_transform = _lazy_re_compile(r"\bno-transform\b")
+
+
+class GzipCompressor:
+    encoding = "gzip"
+
+    def __init__(self):
+        # wbits 31 writes the gzip header and trailer
+        self._compressor = zlib.compressobj(
+            settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31
+        )
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        compressed = self._compressor.compress(data)
+        if flush:
+            compressed += self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        return compressed
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliCompressor:
+    encoding = "br"
+
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        compressed = self._compressor.process(data)
+        if flush:
+            compressed += self._compressor.flush()
+        return compressed
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+COMPRESSORS = {
+    GzipCompressor.encoding: GzipCompressor,
+    BrotliCompressor.encoding: BrotliCompressor,
+}
+
+
+def get_accepted_encoding(accept_encoding: str) -> str | None:
+    """
+    Get the encoding a response is compressed with
+    Params:
+        accept_encoding: The Accept-Encoding header of the request
+    Returns: The available encoding with the highest quality, brotli on ties, or None
+    when the client accepts none of them
+    """
+    qualities = {}
+    for item in accept_encoding.lower().split(","):
+        name, *params = [part.strip() for part in item.split(";")]
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name] = quality
+
+    candidates = [
+        (qualities.get(encoding, qualities.get("*", 0.0)), encoding == "br", encoding)
+        for encoding in COMPRESSORS
+    ]
+    quality, _, encoding = max(candidates)
+    return encoding if quality > 0 else None
+
+
+class CompressionMiddleware:
+    """
+    Compress the API responses with brotli or gzip. Bodies below COMPRESSION_MIN_SIZE
+    are sent as they are, they would barely shrink for the CPU spent. Streaming
+    responses are compressed chunk by chunk as they are sent.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        if not self.is_compressible(response):
+            return response
+        if (
+            not response.streaming
+            and len(response.content) < settings.COMPRESSION_MIN_SIZE
+        ):
+            metrics.increment("compression.skipped_small")
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = get_accepted_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if encoding is None:
+            return response
+
+        compressor = COMPRESSORS[encoding]()
+        if response.streaming:
+            response.streaming_content = self.compress_stream(
+                compressor, response.streaming_content
+            )
+            # The length is unknown until the stream ends
+            del response["Content-Length"]
+        else:
+            response.content = self.compress_content(compressor, response.content)
+            response["Content-Length"] = str(len(response.content))
+
+        # The compressed bytes differ from the ones the ETag was computed on
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = "W/" + etag
+        response["Content-Encoding"] = encoding
+        return response
+
+    @staticmethod
+    def is_compressible(response) -> bool:
+        if response.status_code in (204, 304) or response.has_header("Content-Encoding"):
+            return False
+        if re_no_transform.search(response.get("Cache-Control", "")):
+            return False
+        content_type = response.get("Content-Type", "").split(";")[0].strip().lower()
+        return content_type in settings.COMPRESSION_CONTENT_TYPES
+
+    @staticmethod
+    def compress_content(compressor, content: bytes) -> bytes:
+        start = time.thread_time()
+        compressed = compressor.compress(content) + compressor.finish()
+        report(
+            compressor.encoding,
+            len(content),
+            len(compressed),
+            time.thread_time() - start,
+        )
+        return compressed
+
+    @staticmethod
+    def compress_stream(compressor, content: Iterator[bytes]) -> Iterator[bytes]:
+        size = compressed_size = 0
+        cpu_time = 0.0
+        try:
+            for chunk in content:
+                start = time.thread_time()
+                compressed = compressor.compress(chunk, flush=True)
+                cpu_time += time.thread_time() - start
+                size += len(chunk)
+                compressed_size += len(compressed)
+                if compressed:
+                    yield compressed
+
+            start = time.thread_time()
+            compressed = compressor.finish()
+            cpu_time += time.thread_time() - start
+            compressed_size += len(compressed)
+            yield compressed
+        finally:
+            report(compressor.encoding, size, compressed_size, cpu_time)
+
+
+def report(encoding: str, size: int, compressed_size: int, cpu_time: float) -> None:
+    """
+    Report the compression of a response
+    Params:
+        encoding: The content encoding
+        size: The bytes before compression
+        compressed_size: The bytes sent
+        cpu_time: The CPU seconds spent compressing
+    """
+    metrics.increment(f"compression.{encoding}.responses")
+    metrics.increment(f"compression.{encoding}.bytes_in", size)
+    metrics.increment(f"compression.{encoding}.bytes_out", compressed_size)
+    if size:
+        metrics.gauge(f"compression.{encoding}.ratio", compressed_size / size)
+    metrics.timing(f"compression.{encoding}.cpu", cpu_time)
@@ -0,0 +1,138 @@
+import gzip
+import json
+
+import brotli
+import pytest
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.test import RequestFactory
+
+from core.middleware.compression_middleware import (
+    CompressionMiddleware,
+    get_accepted_encoding,
+)
+from core.utils.metrics.registry import metrics
+
+DATA = {"data": [{"id": index, "source_currency": "EUR"} for index in range(100)]}
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    metrics.reset()
+
+
+def compress(response, accept_encoding="gzip"):
+    """
+    Run a response through the compression middleware
+    Args:
+        response: The response returned by the view
+        accept_encoding: The Accept-Encoding header of the request
+    Returns: The response sent to the client
+    """
+    request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING=accept_encoding)
+    return CompressionMiddleware(lambda request: response)(request)
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        ("gzip, deflate, br", "br"),
+        ("gzip;q=1.0, br;q=0.5", "gzip"),
+        ("br;q=0, gzip", "gzip"),
+        ("*", "br"),
+        ("deflate, identity", None),
+        ("", None),
+    ],
+)
+def test_negotiates_the_encoding(accept_encoding, expected):
+    """Check if the accepted encoding with the highest quality is picked"""
+    assert get_accepted_encoding(accept_encoding) == expected
+
+
+def test_compresses_json():
+    """Check if a JSON body is gzip encoded and the compression is reported"""
+    view_response = JsonResponse(DATA)
+    view_response["ETag"] = '"abc"'
+    size = len(view_response.content)
+
+    response = compress(view_response)
+
+    assert response["Content-Encoding"] == "gzip"
+    assert response["Vary"] == "Accept-Encoding"
+    assert response["ETag"] == 'W/"abc"'
+    assert response["Content-Length"] == str(len(response.content))
+    assert json.loads(gzip.decompress(response.content)) == DATA
+    assert metrics.get_counter("compression.gzip.bytes_in") == size
+    assert metrics.get_counter("compression.gzip.bytes_out") == len(response.content)
+    assert metrics.get_gauge("compression.gzip.ratio") < 0.5
+    assert metrics.as_dict()["timings"]["compression.gzip.cpu"]["count"] == 1
+
+
+def test_compresses_json_with_brotli():
+    """Check if brotli is used when the client accepts it"""
+    response = compress(JsonResponse(DATA), "gzip, br")
+
+    assert response["Content-Encoding"] == "br"
+    assert json.loads(brotli.decompress(response.content)) == DATA
+
+
+def test_small_bodies_are_not_compressed(settings):
+    """Check if bodies below the threshold are sent as they are"""
+    settings.COMPRESSION_MIN_SIZE = 10_000
+
+    response = compress(JsonResponse(DATA))
+
+    assert not response.has_header("Content-Encoding")
+    assert json.loads(response.content) == DATA
+    assert metrics.get_counter("compression.skipped_small") == 1
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        HttpResponse("<p>page</p>" * 500),
+        JsonResponse(DATA, headers={"Cache-Control": "no-transform"}),
+        HttpResponse(gzip.compress(b"{}"), headers={"Content-Encoding": "gzip"}),
+    ],
+)
+def test_other_responses_are_not_compressed(response):
+    """Check if other content types, no-transform and encoded bodies are left alone"""
+    content = response.content
+
+    assert compress(response).content == content
+
+
+def test_compresses_streams_chunk_by_chunk():
+    """Check if every chunk of a stream is sent once compressed, without buffering"""
+    produced = []
+
+    def rows():
+        for index in range(3):
+            produced.append(index)
+            yield json.dumps({"id": index}).encode() + b"\n"
+
+    response = compress(
+        StreamingHttpResponse(rows(), content_type="application/x-ndjson")
+    )
+    chunks = iter(response.streaming_content)
+    first = next(chunks)
+
+    assert produced == [0]
+    assert response["Content-Encoding"] == "gzip"
+    assert not response.has_header("Content-Length")
+    assert gzip.decompress(first + b"".join(chunks)).splitlines() == [
+        b'{"id": 0}',
+        b'{"id": 1}',
+        b'{"id": 2}',
+    ]
+    assert metrics.get_counter("compression.gzip.responses") == 1
+
+
+def test_streams_are_not_compressed_without_an_accepted_encoding():
+    """Check if a stream is sent as it is to clients that do not accept compression"""
+    response = compress(
+        StreamingHttpResponse([b"a,b\n"], content_type="text/csv"), "identity"
+    )
+
+    assert not response.has_header("Content-Encoding")
+    assert response["Vary"] == "Accept-Encoding"
+    assert b"".join(response.streaming_content) == b"a,b\n"
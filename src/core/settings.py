@@ -56,6 +56,7 @@ THIRD_PARTY_APPS = [
     "corsheaders",
     "drf_spectacular",
     "django_extensions",
+    "django_filters",
     "rest_framework_simplejwt.token_blacklist",
 ]
 
@@ -67,6 +68,7 @@ INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + PROJECT_APPS
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "core.middleware.compression_middleware.CompressionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -113,6 +115,15 @@ if ENVIRONMENT == "development":
 
 DATABASES = {"default": env.db()}
 
+# Cache
+# The default database cache is shared by every gunicorn worker, set CACHE_URL to use
+# another backend (e.g. memcache://127.0.0.1:11211)
+
+CACHES = {"default": env.cache("CACHE_URL", default="dbcache://django_cache")}
+# Set TRANSACTIONS_CACHE_URL to keep the cached transaction lists in their own backend
+if env.str("TRANSACTIONS_CACHE_URL", default=""):
+    CACHES["transactions"] = env.cache("TRANSACTIONS_CACHE_URL")
+
 # Password validation
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -175,6 +186,19 @@ REST_FRAMEWORK = {
         "rest_framework.authentication.SessionAuthentication",
     ],
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    # Same bodies as the DRF JSON renderer and parser, encoded and decoded by orjson.
+    # JSON stays the default, MessagePack is picked with Accept and Content-Type.
+    "DEFAULT_RENDERER_CLASSES": [
+        "core.utils.renderers.fast_json.FastJSONRenderer",
+        "core.utils.renderers.msgpack.MessagePackRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "core.utils.parsers.fast_json.FastJSONParser",
+        "core.utils.parsers.msgpack.MessagePackParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
 }
 
 # Auth
@@ -267,3 +291,121 @@ SIMPLE_JWT = {
 
 EXCHANGERATES_API_URL = env.str("EXCHANGERATES_API_URL", default=None)
 EXCHANGERATES_API_KEY = env.str("EXCHANGERATES_API_KEY", default=None)
+# Seconds a worker serves the cached snapshot before looking for a newer one
+EXCHANGERATES_CACHE_TTL = env.int("EXCHANGERATES_CACHE_TTL", default=10 * 60)
+# Seconds a stale snapshot may still be served while it is being reloaded
+EXCHANGERATES_CACHE_STALE_TTL = env.int(
+    "EXCHANGERATES_CACHE_STALE_TTL", default=24 * 60 * 60
+)
+# Shortest number of seconds between two snapshots stored by the refresh_exchange_rates
+# command, the actual interval is planned from the provider quota left
+EXCHANGERATES_REFRESH_INTERVAL = env.int(
+    "EXCHANGERATES_REFRESH_INTERVAL", default=60 * 60
+)
+# Seconds a stored snapshot can still be used to convert currencies
+EXCHANGERATES_SNAPSHOT_MAX_AGE = env.int(
+    "EXCHANGERATES_SNAPSHOT_MAX_AGE", default=24 * 60 * 60
+)
+# Rates provider HTTP client
+EXCHANGERATES_API_POOL_SIZE = env.int("EXCHANGERATES_API_POOL_SIZE", default=4)
+EXCHANGERATES_API_CONNECT_TIMEOUT = env.float(
+    "EXCHANGERATES_API_CONNECT_TIMEOUT", default=3.05
+)
+EXCHANGERATES_API_READ_TIMEOUT = env.float("EXCHANGERATES_API_READ_TIMEOUT", default=10)
+EXCHANGERATES_API_MAX_RETRIES = env.int("EXCHANGERATES_API_MAX_RETRIES", default=2)
+# Base and maximum seconds of the jittered exponential backoff between attempts
+EXCHANGERATES_API_RETRY_BACKOFF = env.float(
+    "EXCHANGERATES_API_RETRY_BACKOFF", default=0.5
+)
+EXCHANGERATES_API_RETRY_BACKOFF_MAX = env.float(
+    "EXCHANGERATES_API_RETRY_BACKOFF_MAX", default=4
+)
+# No attempt is started once this many seconds have passed since the first one
+EXCHANGERATES_API_RETRY_BUDGET = env.float("EXCHANGERATES_API_RETRY_BUDGET", default=20)
+# Seconds a caller waits for a rates fetch already in flight in its process
+EXCHANGERATES_SINGLE_FLIGHT_TIMEOUT = env.float(
+    "EXCHANGERATES_SINGLE_FLIGHT_TIMEOUT", default=30
+)
+# Let a single process at a time refresh the rates through a lock in the shared cache
+EXCHANGERATES_REFRESH_LOCK = env.bool("EXCHANGERATES_REFRESH_LOCK", default=True)
+# Monthly request quota of the rates provider plan
+EXCHANGERATES_MONTHLY_QUOTA = env.int("EXCHANGERATES_MONTHLY_QUOTA", default=250)
+# Day of the month the provider billing period starts (1 to 28)
+EXCHANGERATES_BILLING_DAY = env.int("EXCHANGERATES_BILLING_DAY", default=1)
+# Requests kept for essential refreshes, e.g. when the latest snapshot is about to expire
+EXCHANGERATES_QUOTA_RESERVE = env.int("EXCHANGERATES_QUOTA_RESERVE", default=10)
+# Rates providers in order of preference: exchangeratesapi, open_er_api and fixture
+EXCHANGERATES_PROVIDERS = env.list(
+    "EXCHANGERATES_PROVIDERS", default=["exchangeratesapi"]
+)
+OPEN_ER_API_URL = env.str("OPEN_ER_API_URL", default="https://open.er-api.com/v6/latest")
+# JSON file with a base currency and its rates read by the fixture provider
+EXCHANGERATES_FIXTURE_PATH = env.str(
+    "EXCHANGERATES_FIXTURE_PATH",
+    default=os.path.join(
+        BASE_DIR, "transactions", "services", "providers", "data", "exchange_rates.json"
+    ),
+)
+# Consecutive failures that open the circuit of a provider and seconds it stays open
+EXCHANGERATES_BREAKER_FAILURE_THRESHOLD = env.int(
+    "EXCHANGERATES_BREAKER_FAILURE_THRESHOLD", default=5
+)
+EXCHANGERATES_BREAKER_RESET_TIMEOUT = env.float(
+    "EXCHANGERATES_BREAKER_RESET_TIMEOUT", default=60
+)
+# The next provider is asked when the ones in flight are slower than this percentile of
+# the past latencies, or than the fixed delay while there are too few of them
+EXCHANGERATES_HEDGE_PERCENTILE = env.float("EXCHANGERATES_HEDGE_PERCENTILE", default=95)
+EXCHANGERATES_HEDGE_DELAY = env.float("EXCHANGERATES_HEDGE_DELAY", default=2)
+# Rows read from the database and encoded at a time by the rate history endpoint
+EXCHANGERATES_HISTORY_CHUNK_SIZE = env.int(
+    "EXCHANGERATES_HISTORY_CHUNK_SIZE", default=500
+)
+# Seconds between two polls of the in-memory rate history index for new snapshots,
+# lookups after the latest loaded snapshot can lag this much behind the database
+EXCHANGERATES_RATE_INDEX_SYNC_INTERVAL = env.float(
+    "EXCHANGERATES_RATE_INDEX_SYNC_INTERVAL", default=60
+)
+# Seconds before the latest loaded row that every sync reads again, so rows that
+# committed late with an earlier creation time are not missed
+EXCHANGERATES_RATE_INDEX_SYNC_OVERLAP = env.float(
+    "EXCHANGERATES_RATE_INDEX_SYNC_OVERLAP", default=300
+)
+# Most conversions answered by a single batch conversion request
+EXCHANGERATES_BATCH_MAX_ITEMS = env.int("EXCHANGERATES_BATCH_MAX_ITEMS", default=100)
+# Most items of a bulk transaction creation and rows inserted by each atomic batch
+TRANSACTIONS_BULK_MAX_ITEMS = env.int("TRANSACTIONS_BULK_MAX_ITEMS", default=5000)
+TRANSACTIONS_BULK_CHUNK_SIZE = env.int("TRANSACTIONS_BULK_CHUNK_SIZE", default=500)
+# Seconds a quote token can be redeemed by create-transaction, counted from the start
+# of the cache window it was issued in, and seconds a quote response can be cached
+EXCHANGERATES_QUOTE_TTL = env.int("EXCHANGERATES_QUOTE_TTL", default=120)
+EXCHANGERATES_QUOTE_CACHE_MAX_AGE = env.int(
+    "EXCHANGERATES_QUOTE_CACHE_MAX_AGE", default=30
+)
+# List the transactions from the selected columns instead of model instances, formatted
+# by FastTransactionSerializer
+TRANSACTIONS_FAST_SERIALIZER = env.bool("TRANSACTIONS_FAST_SERIALIZER", default=False)
+# Rows read from the database and encoded at a time by the transactions export
+TRANSACTIONS_EXPORT_CHUNK_SIZE = env.int("TRANSACTIONS_EXPORT_CHUNK_SIZE", default=2000)
+# Cache alias of the first TRANSACTIONS_LIST_CACHE_PAGES pages of every user list,
+# kept TRANSACTIONS_LIST_CACHE_TTL seconds at most, 0 pages disables the cache
+TRANSACTIONS_LIST_CACHE_ALIAS = env.str(
+    "TRANSACTIONS_LIST_CACHE_ALIAS",
+    default="transactions" if "transactions" in CACHES else "default",
+)
+TRANSACTIONS_LIST_CACHE_PAGES = env.int("TRANSACTIONS_LIST_CACHE_PAGES", default=3)
+TRANSACTIONS_LIST_CACHE_TTL = env.int("TRANSACTIONS_LIST_CACHE_TTL", default=300)
+# Responses of these content types are compressed with brotli or gzip, unless their
+# body is below COMPRESSION_MIN_SIZE bytes. Streaming responses are always compressed.
+COMPRESSION_CONTENT_TYPES = env.list(
+    "COMPRESSION_CONTENT_TYPES",
+    default=[
+        "application/json",
+        "application/msgpack",
+        "application/x-ndjson",
+        "text/csv",
+    ],
+)
+COMPRESSION_MIN_SIZE = env.int("COMPRESSION_MIN_SIZE", default=1024)
+COMPRESSION_GZIP_LEVEL = env.int("COMPRESSION_GZIP_LEVEL", default=6)
+COMPRESSION_BROTLI_QUALITY = env.int("COMPRESSION_BROTLI_QUALITY", default=4)
@@ -4,7 +4,7 @@ from django.urls import include, path
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
 from authentication import urls as auth_urls
-from core.views import health_check
+from core.views import health_check, metrics
 from transactions import urls as transactions_urls
 
 urlpatterns = [
@@ -12,6 +12,7 @@ urlpatterns = [
     # Enables the DRF browsable API page
     path("api-auth/", include("rest_framework.urls", namespace="rest_framework")),
     path("health_check/", health_check, name="health_check"),
+    path("metrics/", metrics, name="metrics"),
     path("docs/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui"),
     path("docs/schema/", SpectacularAPIView.as_view(), name="schema"),
     path("auth/", include(auth_urls)),
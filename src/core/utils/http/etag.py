@@ -0,0 +1,11 @@
+import hashlib
+
+
+def make_etag(*parts) -> str:
+    """
+    Build an ETag from the version markers of a response, without rendering it
+    Params:
+        parts: Everything the body depends on, e.g. a row version and the query string
+    Returns: The unquoted ETag
+    """
+    return hashlib.sha1("\x00".join(str(part) for part in parts).encode()).hexdigest()
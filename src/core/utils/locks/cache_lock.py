@@ -0,0 +1,26 @@
+import uuid
+from contextlib import contextmanager
+from typing import Iterator
+
+from django.core.cache import caches
+
+
+@contextmanager
+def cache_lock(key: str, timeout: int, alias: str = "default") -> Iterator[bool]:
+    """
+    Try to take a lock shared by every process using the same cache
+    Params:
+        key: The key of the lock
+        timeout: Seconds after which the lock is released even if never released
+        alias: The cache holding the lock
+    Returns: Whether the lock was acquired
+    """
+    cache = caches[alias]
+    token = uuid.uuid4().hex
+    acquired = cache.add(key, token, timeout=timeout)
+    try:
+        yield acquired
+    finally:
+        # Never release a lock that expired and was taken by another process
+        if acquired and cache.get(key) == token:
+            cache.delete(key)
@@ -0,0 +1,65 @@
+import threading
+from typing import Any, Callable, Hashable
+
+from core.utils.metrics.registry import metrics
+
+
+class SingleFlightTimeout(TimeoutError):
+    pass
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls of this process: while a call for a key is in flight,
+    other callers with the same key wait for its result instead of running it again.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+
+    def do(
+        self, key: Hashable, fn: Callable[[], Any], timeout: float | None = None
+    ) -> Any:
+        """
+        Run fn unless a call with the same key is already running
+        Params:
+            key: The key identifying calls that can share a result
+            fn: The function that is going to be run
+            timeout: Seconds a waiting caller waits for the running call
+        Returns: The result of the running call, raising its error if it failed
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = self._calls[key] = _Call()
+
+        if not is_leader:
+            metrics.increment(f"single_flight.{self.name}.shared")
+            if not call.done.wait(timeout):
+                metrics.increment(f"single_flight.{self.name}.timeouts")
+                raise SingleFlightTimeout(f"Timed out waiting for {self.name} {key}")
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        metrics.increment(f"single_flight.{self.name}.calls")
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
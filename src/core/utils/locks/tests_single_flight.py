@@ -0,0 +1,83 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from core.utils.locks.single_flight import SingleFlight, SingleFlightTimeout
+from core.utils.metrics.registry import metrics
+
+
+def test_concurrent_callers_share_a_single_call():
+    """Check if callers arriving while a call is in flight reuse its result"""
+    single_flight = SingleFlight("test-shared")
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "rates"
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        leader = executor.submit(single_flight.do, "EUR", fetch, 5)
+        started.wait(5)
+        followers = [executor.submit(single_flight.do, "EUR", fetch, 5) for _ in range(4)]
+        while metrics.get_counter("single_flight.test-shared.shared") < 4:
+            time.sleep(0.001)
+        release.set()
+
+        assert leader.result() == "rates"
+        assert [follower.result() for follower in followers] == ["rates"] * 4
+    assert len(calls) == 1
+
+
+def test_waiting_callers_get_the_error():
+    """Check if the error of the running call is raised to every waiting caller"""
+    single_flight = SingleFlight("test")
+    started = threading.Event()
+    release = threading.Event()
+
+    def fetch():
+        started.set()
+        release.wait(5)
+        raise ValueError("provider is down")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(single_flight.do, "EUR", fetch, 5)
+        started.wait(5)
+        follower = executor.submit(single_flight.do, "EUR", fetch, 5)
+        release.set()
+
+        with pytest.raises(ValueError):
+            leader.result()
+        with pytest.raises(ValueError):
+            follower.result()
+
+
+def test_waiting_caller_times_out():
+    """Check if a waiting caller gives up after its deadline"""
+    single_flight = SingleFlight("test")
+    started = threading.Event()
+    release = threading.Event()
+
+    def fetch():
+        started.set()
+        release.wait(5)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(single_flight.do, "EUR", fetch)
+        started.wait(5)
+        with pytest.raises(SingleFlightTimeout):
+            single_flight.do("EUR", fetch, timeout=0.01)
+        release.set()
+
+
+def test_calls_with_different_keys_do_not_wait():
+    """Check if only calls with the same key are coalesced"""
+    single_flight = SingleFlight("test")
+
+    assert single_flight.do("EUR", lambda: "EUR rates") == "EUR rates"
+    assert single_flight.do("USD", lambda: "USD rates") == "USD rates"
@@ -0,0 +1,108 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+logger = logging.getLogger("metrics")
+
+
+class MetricsRegistry:
+    """
+    Process local registry of counters, gauges and timings.
+    Every gunicorn worker keeps its own registry, so values are per process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: dict[str, float] = {}
+        self._gauges: dict[str, float] = {}
+        self._timings: dict[str, dict[str, float]] = {}
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """
+        Increment a counter
+        Params:
+            name: The name of the counter
+            value: The amount added to the counter
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+        logger.debug("%s +%s", name, value)
+
+    def gauge(self, name: str, value: float) -> None:
+        """
+        Set the current value of a gauge
+        Params:
+            name: The name of the gauge
+            value: The current value
+        """
+        with self._lock:
+            self._gauges[name] = value
+        logger.debug("%s = %s", name, value)
+
+    def timing(self, name: str, seconds: float) -> None:
+        """
+        Record a duration
+        Params:
+            name: The name of the timing
+            seconds: The measured duration in seconds
+        """
+        with self._lock:
+            timing = self._timings.setdefault(
+                name, {"count": 0, "total": 0.0, "max": 0.0, "last": 0.0}
+            )
+            timing["count"] += 1
+            timing["total"] += seconds
+            timing["max"] = max(timing["max"], seconds)
+            timing["last"] = seconds
+        logger.debug("%s took %.6fs", name, seconds)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """
+        Record the duration of the wrapped block as a timing
+        Params:
+            name: The name of the timing
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timing(name, time.perf_counter() - start)
+
+    def get_counter(self, name: str) -> float:
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def get_gauge(self, name: str) -> float | None:
+        with self._lock:
+            return self._gauges.get(name)
+
+    def as_dict(self) -> dict:
+        """
+        Returns: A copy of every metric recorded by this process
+        """
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+                "timings": {
+                    name: {
+                        **timing,
+                        "avg": (
+                            timing["total"] / timing["count"] if timing["count"] else 0
+                        ),
+                    }
+                    for name, timing in self._timings.items()
+                },
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._timings.clear()
+
+
+metrics = MetricsRegistry()
@@ -0,0 +1,134 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import OrderedDict
+from functools import reduce
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetCursorPagination(BasePagination):
+    """
+    Keyset pagination: a page starts right after the ordering values of the last row of
+    the previous one, so every page costs an index range scan without COUNT or OFFSET.
+    The cursors are opaque and the response keeps the page number envelope, with total
+    and current_page set to None.
+    """
+
+    page_size = 10
+    max_page_size = 50
+    page_size_query_param = "page_size"
+    cursor_query_param = "cursor"
+    # Every field must have the same direction and the last one must be unique
+    ordering = ("-created", "-id")
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.fields = [field.lstrip("-") for field in self.ordering]
+        self.descending = self.ordering[0].startswith("-")
+
+        cursor = self.decode_cursor(request, queryset.model)
+        reverse = cursor is not None and cursor["previous"]
+        ordering = self.ordering
+        if reverse:
+            ordering = [self._reverse(field) for field in ordering]
+
+        queryset = queryset.order_by(*ordering)
+        if cursor is not None:
+            queryset = queryset.filter(
+                self._after(cursor["position"], descending=self.descending != reverse)
+            )
+
+        rows = list(queryset[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+
+        self.has_next = has_more if not reverse else True
+        self.has_previous = cursor is not None and (has_more if reverse else True)
+        self.page = rows
+        return rows
+
+    def get_page_size(self, request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_paginated_data(self, data):
+        return OrderedDict(
+            [
+                ("total", None),
+                ("current_page", None),
+                ("next", self.get_next_link()),
+                ("previous", self.get_previous_link()),
+                ("data", data),
+            ]
+        )
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+    def get_next_link(self) -> str | None:
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_link(self.page[-1], previous=False)
+
+    def get_previous_link(self) -> str | None:
+        if not self.has_previous:
+            return None
+        if not self.page:
+            # Past the last row, the previous page ends wherever the data ends
+            return remove_query_param(
+                self.request.build_absolute_uri(), self.cursor_query_param
+            )
+        return self.encode_link(self.page[0], previous=True)
+
+    def encode_link(self, row, previous: bool) -> str:
+        payload = {
+            "p": [str(getattr(row, field)) for field in self.fields],
+            "r": previous,
+        }
+        cursor = urlsafe_b64encode(json.dumps(payload).encode()).decode()
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, cursor
+        )
+
+    def decode_cursor(self, request, model) -> dict | None:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            payload = json.loads(urlsafe_b64decode(encoded.encode()))
+            position = [
+                model._meta.get_field(field).to_python(value)
+                for field, value in zip(self.fields, payload["p"], strict=True)
+            ]
+            return {"position": position, "previous": bool(payload["r"])}
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+
+    def _after(self, position: list, descending: bool) -> Q:
+        """
+        Rows strictly after the position: (a, b) < (x, y) is a < x or (a = x and b < y)
+        """
+        lookup = "lt" if descending else "gt"
+        conditions = []
+        for index, field in enumerate(self.fields):
+            equal = {name: value for name, value in zip(self.fields[:index], position)}
+            conditions.append(Q(**equal, **{f"{field}__{lookup}": position[index]}))
+        return reduce(lambda left, right: left | right, conditions)
+
+    @staticmethod
+    def _reverse(field: str) -> str:
+        return field[1:] if field.startswith("-") else f"-{field}"
@@ -15,14 +15,17 @@ def get_paginated_response(
     request: Request,
     view: APIView | None,
     message: str,
+    count: int | None = None,
+    serializer_kwargs: dict[str, Any] | None = None,
 ):
-    paginator = pagination_class()
+    # A known count saves the COUNT(*) of the page number pagination
+    paginator = pagination_class() if count is None else pagination_class(count=count)
 
     page = paginator.paginate_queryset(queryset, request, view=view)
 
     if page is not None:
-        serializer = serializer_class(page, many=True)
+        serializer = serializer_class(page, many=True, **(serializer_kwargs or {}))
         return paginator.get_paginated_response(serializer.data)
 
-    serializer = serializer_class(queryset, many=True)
+    serializer = serializer_class(queryset, many=True, **(serializer_kwargs or {}))
     return Response(data={**serializer.data, "message": message})
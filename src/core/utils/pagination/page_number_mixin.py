@@ -1,15 +1,75 @@
 from collections import OrderedDict
 
+from django.core.paginator import Paginator as DjangoPaginator
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination as _PageNumberPagination
 from rest_framework.response import Response
 
 
+class CountedPaginator(DjangoPaginator):
+    """
+    Paginator that uses an already known number of rows instead of running COUNT(*).
+    """
+
+    def __init__(self, *args, count: int | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.known_count = count
+
+    @cached_property
+    def count(self):
+        if self.known_count is not None:
+            return self.known_count
+        return super().count
+
+
 class PageNumberPagination(_PageNumberPagination):
     page_size = 10
     max_page_size = 50
     page_size_query_param = "page_size"
+    count_query_param = "count"
+
+    def __init__(self, count: int | None = None):
+        self.known_count = count
+
+    def django_paginator_class(self, *args, **kwargs):
+        return CountedPaginator(*args, count=self.known_count, **kwargs)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.with_total = request.query_params.get(
+            self.count_query_param, ""
+        ).lower() not in (
+            "false",
+            "0",
+        )
+        if self.with_total:
+            return super().paginate_queryset(queryset, request, view=view)
+        return self.paginate_queryset_without_total(queryset, request)
+
+    def paginate_queryset_without_total(self, queryset, request):
+        """
+        Read the page without counting the rows
+        """
+        self.request = request
+        page_size = self.get_page_size(request)
+        try:
+            page_number = int(request.query_params.get(self.page_query_param, 1))
+        except ValueError:
+            page_number = 0
+        if page_number < 1:
+            raise NotFound(self.invalid_page_message)
+
+        offset = (page_number - 1) * page_size
+        limit = offset + page_size
+        self.page = None
+        self.page_number = page_number
+        return list(queryset[offset:limit])
 
     def get_paginated_data(self, data):
+        if not self.with_total:
+            return OrderedDict(
+                [("total", None), ("current_page", self.page_number), ("data", data)]
+            )
         return OrderedDict(
             [
                 ("total", self.page.paginator.count),
@@ -19,12 +79,4 @@ class PageNumberPagination(_PageNumberPagination):
         )
 
     def get_paginated_response(self, data):
-        return Response(
-            OrderedDict(
-                [
-                    ("total", self.page.paginator.count),
-                    ("current_page", self.page.number),
-                    ("data", data),
-                ]
-            )
-        )
+        return Response(self.get_paginated_data(data))
@@ -0,0 +1,20 @@
+import msgpack
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+from core.utils.renderers.msgpack import MessagePackRenderer
+
+
+class MessagePackParser(BaseParser):
+    """
+    Parse MessagePack request bodies
+    """
+
+    media_type = "application/msgpack"
+    renderer_class = MessagePackRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except (ValueError, TypeError, msgpack.UnpackException) as e:
+            raise ParseError("MessagePack parse error - %s" % str(e))
@@ -0,0 +1,49 @@
+import io
+
+import pytest
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from core.utils.parsers.fast_json import FastJSONParser
+
+
+def parse(parser, body, encoding="utf-8"):
+    """
+    Parse a request body
+    Args:
+        parser: The parser class
+        body: The raw body
+        encoding: The charset of the request
+    Returns: The parsed data
+    """
+    return parser().parse(io.BytesIO(body), parser_context={"encoding": encoding})
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b'{"source_currency": "EUR", "source_amount": 10.5, "note": "caf\\u00e9"}',
+        b'[1, 2, {"nested": [true, false, null]}]',
+        '{"note": "café"}'.encode(),
+    ],
+)
+def test_parses_the_same_data_as_drf(body):
+    """Check if the fast parser output is the same as JSONParser"""
+    assert parse(FastJSONParser, body) == parse(JSONParser, body)
+
+
+def test_parses_other_charsets():
+    """Check if a body in another charset is decoded with it"""
+    body = '{"note": "café"}'.encode("latin-1")
+    assert parse(FastJSONParser, body, encoding="latin-1") == {"note": "café"}
+
+
+@pytest.mark.parametrize("body", [b'{"source_amount": ', b'{"rate": NaN}'])
+def test_invalid_json_is_rejected_like_drf(body):
+    """Check if invalid bodies raise the same error as JSONParser"""
+    with pytest.raises(ParseError) as fast_error:
+        parse(FastJSONParser, body)
+    with pytest.raises(ParseError) as expected_error:
+        parse(JSONParser, body)
+
+    assert str(fast_error.value) == str(expected_error.value)
@@ -0,0 +1,35 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer encoding with orjson. The types orjson does not encode like DRF go
+    through the DRF encoder, so the output is the same bytes. Indented output, only
+    asked by the browsable API or an indent media type parameter, is left to
+    JSONRenderer. Unlike JSONRenderer, NaN and infinity are rendered as null instead of
+    raising, the API only sends decimals.
+    """
+
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent is not None or not self.compact or self.ensure_ascii:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data, default=self.encoder_class().default, option=self.options
+            )
+        except orjson.JSONEncodeError:
+            # e.g. integers over 64 bits, that the standard library encodes
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Escaped like JSONRenderer, so the output is a strict javascript subset
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
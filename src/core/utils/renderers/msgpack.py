@@ -0,0 +1,29 @@
+from decimal import Decimal
+
+import msgpack
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Render the same data as the JSON renderer as MessagePack. Decimals are packed as
+    strings so they keep every digit, the other types DRF encodes go through its
+    encoder.
+    """
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+    encoder_class = JSONEncoder
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=self.default, use_bin_type=True)
+
+    def default(self, obj):
+        if isinstance(obj, Decimal):
+            return str(obj)
+        return self.encoder_class().default(obj)
@@ -0,0 +1,53 @@
+import uuid
+from collections import OrderedDict
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+
+from core.utils.renderers.fast_json import FastJSONRenderer
+
+DATA = [
+    OrderedDict(
+        [
+            ("id", uuid.UUID("8c5e2b8e-3e0b-4a4e-9d8e-2f9a7c1b6d10")),
+            ("amount", Decimal("10.50")),
+            ("rate", 0.1),
+            ("created", datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc)),
+            ("modified", datetime(2024, 1, 1, 12, 30, 0, 7, tzinfo=timezone.utc)),
+            ("naive", datetime(2024, 1, 1, 12, 30)),
+            ("day", date(2024, 1, 1)),
+            ("at", time(12, 30, 1, 500)),
+            ("duration", timedelta(hours=1, microseconds=5)),
+            ("message", gettext_lazy("Not found.")),
+            ("text", 'café \u2028 \u2029 "quoted" </script>'),
+            ("nested", {1: [True, None, (1, 2)], "big": 2**70}),
+        ]
+    ),
+    [],
+    {},
+    "",
+    0,
+]
+
+
+@pytest.mark.parametrize("data", DATA)
+def test_renders_the_same_bytes_as_drf(data):
+    """Check if the fast renderer output is the same as JSONRenderer"""
+    assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_renders_nothing_for_none():
+    """Check if an empty body is rendered for None like JSONRenderer"""
+    assert FastJSONRenderer().render(None) == b""
+
+
+def test_indented_output_is_left_to_drf():
+    """Check if the indent media type parameter is honoured"""
+    media_type = "application/json; indent=2"
+    assert FastJSONRenderer().render(DATA[0], media_type) == JSONRenderer().render(
+        DATA[0], media_type
+    )
+    assert b"\n  " in FastJSONRenderer().render(DATA[0], media_type)
@@ -0,0 +1,53 @@
+import io
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import msgpack
+import pytest
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+
+from core.utils.parsers.msgpack import MessagePackParser
+from core.utils.renderers.msgpack import MessagePackRenderer
+
+
+def test_renders_the_json_types():
+    """Check if the values are packed like the JSON renderer, decimals as strings"""
+    data = OrderedDict(
+        [
+            ("id", uuid.UUID("8c5e2b8e-3e0b-4a4e-9d8e-2f9a7c1b6d10")),
+            ("amount", Decimal("12345678901234567890.123456")),
+            ("created", datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc)),
+            ("message", gettext_lazy("Not found.")),
+            ("data", [1, None, True, (1, 2)]),
+        ]
+    )
+
+    assert msgpack.unpackb(MessagePackRenderer().render(data)) == {
+        "id": "8c5e2b8e-3e0b-4a4e-9d8e-2f9a7c1b6d10",
+        "amount": "12345678901234567890.123456",
+        "created": "2024-01-01T12:30:00Z",
+        "message": "Not found.",
+        "data": [1, None, True, [1, 2]],
+    }
+
+
+def test_renders_nothing_for_none():
+    """Check if an empty body is rendered for None like the JSON renderer"""
+    assert MessagePackRenderer().render(None) == b""
+
+
+def test_parses_what_is_rendered():
+    """Check if a rendered body is parsed back"""
+    body = MessagePackRenderer().render({"source_amount": Decimal("10.50")})
+
+    assert MessagePackParser().parse(io.BytesIO(body)) == {"source_amount": "10.50"}
+
+
+@pytest.mark.parametrize("body", [b"\x82\xa1a", b"\xc1", b"\x81\x01\x02\x03"])
+def test_invalid_bodies_are_rejected(body):
+    """Check if truncated or invalid bodies raise a parse error"""
+    with pytest.raises(ParseError):
+        MessagePackParser().parse(io.BytesIO(body))
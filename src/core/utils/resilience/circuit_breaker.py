@@ -0,0 +1,98 @@
+import threading
+import time
+from typing import Any, Callable
+
+from core.utils.metrics.registry import metrics
+
+
+class CircuitBreakerOpen(Exception):
+    pass
+
+
+class CircuitBreaker:
+    """
+    Stop calling a failing dependency: after failure_threshold consecutive failures the
+    circuit opens and calls are rejected until reset_timeout seconds pass, then a single
+    trial call decides whether it closes again.
+    """
+
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+    STATE_GAUGES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 60):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._report_state()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and self._can_try_again():
+                return self.HALF_OPEN
+            return self._state
+
+    def allows_calls(self) -> bool:
+        return self.state != self.OPEN
+
+    def call(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Call fn unless the circuit is open
+        Params:
+            fn: The function calling the dependency
+        Returns: The result of fn
+        """
+        with self._lock:
+            if self._state == self.OPEN and self._can_try_again():
+                self._set_state(self.HALF_OPEN)
+            if self._state == self.OPEN or (
+                self._state == self.HALF_OPEN and self._trial_in_flight
+            ):
+                metrics.increment(f"circuit_breaker.{self.name}.rejected")
+                raise CircuitBreakerOpen(f"The {self.name} circuit is open")
+            if self._state == self.HALF_OPEN:
+                self._trial_in_flight = True
+
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            self._record_failure()
+            raise
+        self._record_success()
+        return result
+
+    def _can_try_again(self) -> bool:
+        return time.monotonic() - self._opened_at >= self.reset_timeout
+
+    def _record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._trial_in_flight = False
+            self._set_state(self.CLOSED)
+
+    def _record_failure(self) -> None:
+        metrics.increment(f"circuit_breaker.{self.name}.failures")
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                self._set_state(self.OPEN)
+
+    def _set_state(self, state: str) -> None:
+        if state != self._state:
+            metrics.increment(f"circuit_breaker.{self.name}.{state}")
+        self._state = state
+        self._report_state()
+
+    def _report_state(self) -> None:
+        metrics.gauge(
+            f"circuit_breaker.{self.name}.state", self.STATE_GAUGES[self._state]
+        )
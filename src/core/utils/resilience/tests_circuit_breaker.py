@@ -0,0 +1,64 @@
+import pytest
+from freezegun import freeze_time
+
+from core.utils.metrics.registry import metrics
+from core.utils.resilience.circuit_breaker import CircuitBreaker, CircuitBreakerOpen
+
+
+def fail():
+    raise ConnectionError()
+
+
+def open_breaker(breaker):
+    for _ in range(breaker.failure_threshold):
+        with pytest.raises(ConnectionError):
+            breaker.call(fail)
+
+
+def test_breaker_opens_after_consecutive_failures():
+    """Check if the circuit opens once the failure threshold is reached"""
+    breaker = CircuitBreaker("test-open", failure_threshold=3, reset_timeout=60)
+    open_breaker(breaker)
+
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitBreakerOpen):
+        breaker.call(lambda: "rates")
+    assert metrics.get_counter("circuit_breaker.test-open.rejected") == 1
+    assert metrics.get_gauge("circuit_breaker.test-open.state") == 2
+
+
+def test_success_resets_the_failures():
+    """Check if only consecutive failures open the circuit"""
+    breaker = CircuitBreaker("test-reset", failure_threshold=2)
+    with pytest.raises(ConnectionError):
+        breaker.call(fail)
+    breaker.call(lambda: "rates")
+    with pytest.raises(ConnectionError):
+        breaker.call(fail)
+
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_breaker_closes_after_a_successful_trial():
+    """Check if a trial call is let through after the reset timeout"""
+    with freeze_time("2024-01-01 00:00:00") as frozen_time:
+        breaker = CircuitBreaker("test-trial", failure_threshold=1, reset_timeout=60)
+        open_breaker(breaker)
+        frozen_time.tick(61)
+
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.call(lambda: "rates") == "rates"
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert metrics.get_gauge("circuit_breaker.test-trial.state") == 0
+
+
+def test_breaker_reopens_after_a_failed_trial():
+    """Check if a failed trial call opens the circuit again"""
+    with freeze_time("2024-01-01 00:00:00") as frozen_time:
+        breaker = CircuitBreaker("test-reopen", failure_threshold=3, reset_timeout=60)
+        open_breaker(breaker)
+        frozen_time.tick(61)
+
+        with pytest.raises(ConnectionError):
+            breaker.call(fail)
+        assert breaker.state == CircuitBreaker.OPEN
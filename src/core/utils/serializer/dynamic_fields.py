@@ -0,0 +1,12 @@
+class DynamicFieldsMixin:
+    """
+    Serializer mixin taking a fields argument that keeps only those fields, in the
+    order they are declared
+    """
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop("fields", None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
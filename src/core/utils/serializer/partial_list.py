@@ -0,0 +1,39 @@
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.settings import api_settings
+
+
+class PartialListSerializer(serializers.ListSerializer):
+    """
+    List serializer that validates every item on its own: the valid items are kept
+    and the invalid ones are None in validated_data, with their errors in item_errors.
+    """
+
+    def to_internal_value(self, data):
+        if not isinstance(data, list):
+            message = self.error_messages["not_a_list"].format(
+                input_type=type(data).__name__
+            )
+            raise ValidationError(
+                {api_settings.NON_FIELD_ERRORS_KEY: [message]}, code="not_a_list"
+            )
+        if not self.allow_empty and len(data) == 0:
+            message = self.error_messages["empty"]
+            raise ValidationError(
+                {api_settings.NON_FIELD_ERRORS_KEY: [message]}, code="empty"
+            )
+        if self.max_length is not None and len(data) > self.max_length:
+            message = self.error_messages["max_length"].format(max_length=self.max_length)
+            raise ValidationError(
+                {api_settings.NON_FIELD_ERRORS_KEY: [message]}, code="max_length"
+            )
+
+        self.item_errors = {}
+        items = []
+        for index, item in enumerate(data):
+            try:
+                items.append(self.child.run_validation(item))
+            except ValidationError as exc:
+                self.item_errors[index] = exc.detail
+                items.append(None)
+        return items
@@ -0,0 +1,30 @@
+import csv
+from itertools import islice
+from typing import Any, Iterable, Iterator, Sequence
+
+
+class _Echo:
+    """
+    File-like object handing back what csv.writer writes instead of storing it
+    """
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def stream_csv(
+    header: Sequence[str], rows: Iterable[dict[str, Any]], chunk_size: int = 500
+) -> Iterator[str]:
+    """
+    Encode rows as CSV piece by piece, so a long table is never held in memory
+    Params:
+        header: The columns, in order
+        rows: The rows, encoded as they are consumed
+        chunk_size: The number of rows encoded in each piece
+    Returns: The pieces of the encoded table
+    """
+    writer = csv.DictWriter(_Echo(), fieldnames=header)
+    yield writer.writeheader()
+    rows = iter(rows)
+    while chunk := list(islice(rows, chunk_size)):
+        yield "".join(writer.writerow(row) for row in chunk)
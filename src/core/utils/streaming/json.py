@@ -0,0 +1,30 @@
+import json
+from itertools import islice
+from typing import Any, Iterable, Iterator
+
+from rest_framework.utils.encoders import JSONEncoder
+
+ITEMS_PLACEHOLDER = "\x00items\x00"
+
+
+def stream_json(
+    envelope: dict[str, Any], items: Iterable[Any], chunk_size: int = 500
+) -> Iterator[str]:
+    """
+    Encode a JSON document piece by piece, so a long list is never held in memory
+    Params:
+        envelope: The document, with ITEMS_PLACEHOLDER where the list goes
+        items: The items of the list, encoded as they are consumed
+        chunk_size: The number of items encoded in each piece
+    Returns: The pieces of the encoded document
+    """
+    encoder = JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    head, tail = encoder.encode(envelope).split(json.dumps(ITEMS_PLACEHOLDER))
+
+    yield head + "["
+    items = iter(items)
+    separator = ""
+    while chunk := list(islice(items, chunk_size)):
+        yield separator + ",".join(encoder.encode(item) for item in chunk)
+        separator = ","
+    yield "]" + tail
@@ -0,0 +1,18 @@
+from itertools import islice
+from typing import Any, Iterable, Iterator
+
+from rest_framework.utils.encoders import JSONEncoder
+
+
+def stream_ndjson(items: Iterable[Any], chunk_size: int = 500) -> Iterator[str]:
+    """
+    Encode items as newline delimited JSON piece by piece
+    Params:
+        items: The items, one JSON document per line, encoded as they are consumed
+        chunk_size: The number of items encoded in each piece
+    Returns: The pieces of the encoded lines
+    """
+    encoder = JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    items = iter(items)
+    while chunk := list(islice(items, chunk_size)):
+        yield "".join(encoder.encode(item) + "\n" for item in chunk)
@@ -1,6 +1,18 @@
 from django.contrib import admin
 
-from transactions.models import Transaction
+from transactions.models import (
+    DailyTransactionSummary,
+    ExchangeRateSnapshot,
+    HistoricalExchangeRate,
+    ProviderQuotaUsage,
+    Transaction,
+    UserTransactionCounter,
+)
+from transactions.services.bookkeeping import (
+    delete_transactions,
+    insert_transaction,
+    update_transaction,
+)
 
 
 @admin.register(Transaction)
@@ -17,3 +29,56 @@ class TransactionAdmin(admin.ModelAdmin):
         "exchange_rate",
     )
     list_filter = ("created", "modified", "user")
+
+    def save_model(self, request, obj, form, change):
+        # The counters, summaries and cached pages follow the rows saved here too
+        if change:
+            update_transaction(obj)
+        else:
+            insert_transaction(obj)
+
+    def delete_model(self, request, obj):
+        delete_transactions(Transaction.objects.filter(id=obj.id))
+
+    def delete_queryset(self, request, queryset):
+        delete_transactions(queryset)
+
+
+@admin.register(UserTransactionCounter)
+class UserTransactionCounterAdmin(admin.ModelAdmin):
+    list_display = ("user", "count", "modified")
+    raw_id_fields = ("user",)
+
+
+@admin.register(DailyTransactionSummary)
+class DailyTransactionSummaryAdmin(admin.ModelAdmin):
+    list_display = (
+        "day",
+        "user",
+        "source_currency",
+        "target_currency",
+        "count",
+        "source_amount",
+        "converted_amount",
+    )
+    list_filter = ("day", "source_currency", "target_currency")
+    raw_id_fields = ("user",)
+
+
+@admin.register(ExchangeRateSnapshot)
+class ExchangeRateSnapshotAdmin(admin.ModelAdmin):
+    list_display = ("created", "id", "base_currency")
+    list_filter = ("created", "base_currency")
+
+
+@admin.register(HistoricalExchangeRate)
+class HistoricalExchangeRateAdmin(admin.ModelAdmin):
+    list_display = ("timestamp", "base_currency", "quote_currency", "rate")
+    list_filter = ("base_currency", "quote_currency")
+    raw_id_fields = ("snapshot",)
+
+
+@admin.register(ProviderQuotaUsage)
+class ProviderQuotaUsageAdmin(admin.ModelAdmin):
+    list_display = ("period_start", "provider", "calls")
+    list_filter = ("provider",)
@@ -0,0 +1,59 @@
+from typing import Callable
+
+import factory
+import pytest
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+
+from authentication.utils.jwt import AccessToken
+from core.models import User
+from core.utils.metrics.registry import metrics
+from transactions.services.rate_index import rate_index
+
+RATES = {"BRL": 5.8, "USD": 1.08, "EUR": 1, "JPY": 170.5}
+
+
+class UserFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = User
+
+    full_name = factory.Faker("name")
+    email = factory.Faker("email")
+    password = factory.Faker("password")
+
+    @classmethod
+    def _create(cls, model_class, *args, **kwargs):
+        kwargs["password"] = make_password(kwargs["password"])
+        return super(UserFactory, cls)._create(model_class, *args, **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def local_cache(settings):
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    cache.clear()
+    metrics.reset()
+    rate_index.reset()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def user_factory(db):
+    return UserFactory
+
+
+@pytest.fixture
+def user_1(user_factory: Callable) -> User:
+    return user_factory()
+
+
+@pytest.fixture
+def user_1_token(user_1: User) -> AccessToken:
+    return AccessToken.for_user(user_1)
+
+
+@pytest.fixture
+def rates() -> dict:
+    return dict(RATES)
@@ -4,3 +4,10 @@ from enum import Enum
 class ErrorCodes(Enum):
     NOT_VALID_CURRENCY = "not_valid_currency"
     SOURCE_AMOUNT_MUST_BE_POSITIVE = "source_amount_must_be_positive"
+    EXCHANGE_RATES_UNAVAILABLE = "exchange_rates_unavailable"
+    INVALID_DATE_RANGE = "invalid_date_range"
+    HISTORICAL_RATE_NOT_FOUND = "historical_rate_not_found"
+    INVALID_QUOTE_TOKEN = "invalid_quote_token"
+    EXPIRED_QUOTE_TOKEN = "expired_quote_token"
+    REDEEMED_QUOTE_TOKEN = "redeemed_quote_token"
+    UNKNOWN_FIELDS = "unknown_fields"
@@ -3,3 +3,4 @@ from enum import Enum
 
 class Tags(Enum):
     TRANSACTION = "Transaction"
+    EXCHANGE_RATES = "Exchange Rates"
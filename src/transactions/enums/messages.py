@@ -5,3 +5,22 @@ class TransactionMessages(Enum):
     CREATE_TRANSACTION_SUCCESSFULLY = "Transaction was created successfully"
     GET_USER_TRANSACTION_SUCCESFULLY = "Get user transactions request was successfull"
     SOURCE_AMOUNT_MUST_BE_POSITIVE = "Source amount must be positive"
+    EXCHANGE_RATES_UNAVAILABLE = "Exchange rates are temporarily unavailable"
+    BULK_CREATE_TRANSACTIONS_SUCCESSFULLY = "Transactions were created successfully"
+    BULK_CREATE_TRANSACTIONS_PARTIALLY = "Some transactions could not be created"
+    BULK_CREATE_TRANSACTIONS_FAILED = "The transactions could not be stored"
+    GET_TRANSACTIONS_SUMMARY_SUCCESSFULLY = "Transactions summary was found successfully"
+    UNKNOWN_FIELDS = "Unknown fields: {fields}"
+
+
+class ExchangeRateMessages(Enum):
+    GET_QUOTA_SUCCESSFULLY = "Provider quota state was found successfully"
+    GET_RATE_HISTORY_SUCCESSFULLY = "Exchange rate history was found successfully"
+    INVALID_DATE_RANGE = "The start of the range must be before its end"
+    GET_QUOTE_SUCCESSFULLY = "Quote was created successfully"
+    HISTORICAL_RATE_NOT_FOUND = "No exchange rates were in effect at the requested time"
+    BATCH_CONVERT_SUCCESSFULLY = "Amounts were converted successfully"
+    BATCH_TOO_LARGE = "A batch can have at most {max_length} items"
+    INVALID_QUOTE_TOKEN = "The quote token is not valid"
+    EXPIRED_QUOTE_TOKEN = "The quote token has expired, request a new quote"
+    REDEEMED_QUOTE_TOKEN = "The quote token was already redeemed"
@@ -1,7 +1,25 @@
 # integrations/exceptions.py
+from rest_framework import status
+from rest_framework.exceptions import APIException, NotFound, ValidationError
 
+from transactions.enums.codes import ErrorCodes
+from transactions.enums.messages import ExchangeRateMessages, TransactionMessages
 
-class ExchangeRatesAPIException(Exception):
+
+class RateProviderException(Exception):
+    pass
+
+
+class RateProvidersUnavailableException(RateProviderException):
+    def __init__(self, errors: list[Exception]):
+        self.errors = errors
+        super().__init__(
+            "No rates provider could be reached: "
+            + "; ".join(f"{type(error).__name__}: {error}" for error in errors)
+        )
+
+
+class ExchangeRatesAPIException(RateProviderException):
     ERROR_CODES = {
         101: "No API Key was specified or an invalid API Key was specified.",
         102: "The account this API request is coming from is inactive.",
@@ -26,3 +44,35 @@ class ExchangeRatesAPIException(Exception):
         self.error_code = error_code
         self.message = self.ERROR_CODES.get(error_code, "An unknown error occurred.")
         super().__init__(self.message)
+
+
+class ExchangeRatesUnavailableException(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+    def __init__(self, detail=TransactionMessages.EXCHANGE_RATES_UNAVAILABLE.value):
+        super().__init__(detail, ErrorCodes.EXCHANGE_RATES_UNAVAILABLE.value)
+
+
+class InvalidDateRangeException(ValidationError):
+    def __init__(self, detail=ExchangeRateMessages.INVALID_DATE_RANGE.value):
+        super().__init__(detail, ErrorCodes.INVALID_DATE_RANGE.value)
+
+
+class HistoricalRateNotFoundException(NotFound):
+    def __init__(self, detail=ExchangeRateMessages.HISTORICAL_RATE_NOT_FOUND.value):
+        super().__init__(detail, ErrorCodes.HISTORICAL_RATE_NOT_FOUND.value)
+
+
+class InvalidQuoteTokenException(ValidationError):
+    def __init__(self, detail=ExchangeRateMessages.INVALID_QUOTE_TOKEN.value):
+        super().__init__(detail, ErrorCodes.INVALID_QUOTE_TOKEN.value)
+
+
+class ExpiredQuoteTokenException(ValidationError):
+    def __init__(self, detail=ExchangeRateMessages.EXPIRED_QUOTE_TOKEN.value):
+        super().__init__(detail, ErrorCodes.EXPIRED_QUOTE_TOKEN.value)
+
+
+class RedeemedQuoteTokenException(ValidationError):
+    def __init__(self, detail=ExchangeRateMessages.REDEEMED_QUOTE_TOKEN.value):
+        super().__init__(detail, ErrorCodes.REDEEMED_QUOTE_TOKEN.value)
@@ -7,3 +7,9 @@ from transactions.enums.messages import TransactionMessages
 class TransactionSourceAmountMustBePositiveException(ValidationError):
     def __init__(self, detail=TransactionMessages.SOURCE_AMOUNT_MUST_BE_POSITIVE.value):
         super().__init__(detail, ErrorCodes.SOURCE_AMOUNT_MUST_BE_POSITIVE.value)
+
+
+class UnknownTransactionFieldsException(ValidationError):
+    def __init__(self, fields: list[str]):
+        detail = TransactionMessages.UNKNOWN_FIELDS.value.format(fields=", ".join(fields))
+        super().__init__({"fields": [detail]}, ErrorCodes.UNKNOWN_FIELDS.value)
@@ -0,0 +1,41 @@
+from typing import Mapping
+
+import django_filters
+
+from transactions.models import CURRENCY_CHOICES, Transaction
+
+
+class TransactionFilter(django_filters.FilterSet):
+    """
+    Filters of the transaction lists, every combination is answered by a range scan of
+    one of the Transaction indexes
+    """
+
+    start = django_filters.IsoDateTimeFilter(field_name="created", lookup_expr="gte")
+    end = django_filters.IsoDateTimeFilter(field_name="created", lookup_expr="lte")
+    source_currency = django_filters.ChoiceFilter(choices=CURRENCY_CHOICES)
+    target_currency = django_filters.ChoiceFilter(choices=CURRENCY_CHOICES)
+    min_source_amount = django_filters.NumberFilter(
+        field_name="source_amount", lookup_expr="gte"
+    )
+    max_source_amount = django_filters.NumberFilter(
+        field_name="source_amount", lookup_expr="lte"
+    )
+
+    class Meta:
+        model = Transaction
+        fields = (
+            "start",
+            "end",
+            "source_currency",
+            "target_currency",
+            "min_source_amount",
+            "max_source_amount",
+        )
+
+    @classmethod
+    def is_filtering(cls, params: Mapping) -> bool:
+        """
+        Whether the parameters apply any filter, so the rows are a subset of the user rows
+        """
+        return any(params.get(name) not in (None, "") for name in cls.base_filters)
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from transactions.models import ExchangeRateSnapshot
+from transactions.services.history import record_exchange_rate_history
+
+
+class Command(BaseCommand):
+    help = "Store the rate history of the snapshots taken before it was recorded"
+
+    def handle(self, *args, **options):
+        snapshots = ExchangeRateSnapshot.objects.filter(
+            historical_rates__isnull=True
+        ).order_by("created")
+
+        count = 0
+        for snapshot in snapshots.iterator(chunk_size=100):
+            with transaction.atomic():
+                record_exchange_rate_history(snapshot)
+            count += 1
+        self.stdout.write(f"Recorded the rate history of {count} snapshots")
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from transactions.services.summaries import rebuild_daily_summaries
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the daily transaction summaries from the transactions, the writes of "
+        "the rebuilt users should be paused while it runs"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", help="Only rebuild the summaries of this user id")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Summaries inserted by each query",
+        )
+
+    def handle(self, *args, **options):
+        created = rebuild_daily_summaries(
+            user_id=options["user"], batch_size=options["batch_size"]
+        )
+        self.stdout.write(f"{created} daily summaries rebuilt")
@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+
+from core.utils.metrics.registry import metrics
+from transactions.models import Transaction, UserTransactionCounter
+
+
+class Command(BaseCommand):
+    help = "Repair the per-user transaction counters that drifted from the real counts"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Report the drift without repairing it"
+        )
+
+    def handle(self, *args, **options):
+        counts = dict(
+            Transaction.objects.order_by()
+            .values("user_id")
+            .annotate(count=Count("id"))
+            .values_list("user_id", "count")
+        )
+        counters = dict(UserTransactionCounter.objects.values_list("user_id", "count"))
+        drifted = [
+            user_id
+            for user_id in counts.keys() | counters.keys()
+            if counts.get(user_id, 0) != counters.get(user_id)
+        ]
+
+        for user_id in drifted:
+            self.stdout.write(
+                f"User {user_id}: counter {counters.get(user_id)}, "
+                f"{counts.get(user_id, 0)} transactions"
+            )
+            if not options["dry_run"]:
+                self._repair(user_id)
+
+        metrics.gauge("transaction_counters.drifted", len(drifted))
+        self.stdout.write(f"{len(drifted)} drifted counters")
+
+    @staticmethod
+    def _repair(user_id) -> None:
+        with transaction.atomic():
+            # Recounted under the counter lock, the first pass may be outdated by now
+            counter, _ = UserTransactionCounter.objects.select_for_update().get_or_create(
+                user_id=user_id
+            )
+            counter.count = Transaction.objects.filter(user_id=user_id).count()
+            counter.save(update_fields=["count", "modified"])
@@ -0,0 +1,78 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from transactions.exceptions.exchangerate import RateProviderException
+from transactions.models import ExchangeRateSnapshot
+from transactions.services.exchangerate import ExchangeRatesAPI
+from transactions.services.snapshots import refresh_exchange_rate_snapshot
+
+
+class Command(BaseCommand):
+    help = "Fetch the exchange rates on a schedule and store each result as a snapshot"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=None,
+            help="Seconds between two snapshots, planned from the provider quota by default",
+        )
+        parser.add_argument("--base-currency", default="EUR")
+        parser.add_argument(
+            "--once", action="store_true", help="Store a single snapshot and exit"
+        )
+
+    def handle(self, *args, **options):
+        base_currency = options["base_currency"]
+        planner = ExchangeRatesAPI.quota_planner
+
+        while True:
+            close_old_connections()
+            interval = options["interval"] or planner.get_refresh_interval(
+                minimum=settings.EXCHANGERATES_REFRESH_INTERVAL
+            )
+            latest = ExchangeRateSnapshot.objects.get_latest(base_currency)
+            # Avoid spending a request when the latest snapshot is recent enough,
+            # e.g. right after the command was restarted
+            wait = interval - latest.age if latest else 0
+
+            if options["once"]:
+                self._refresh(base_currency)
+                return
+
+            if wait <= 0:
+                if planner.should_refresh(essential=self._is_essential(latest, interval)):
+                    self._refresh(base_currency)
+                else:
+                    self.stdout.write(
+                        "Refresh deferred, the provider quota is ahead of budget"
+                    )
+                wait = interval
+            time.sleep(wait)
+
+    def _is_essential(self, latest: ExchangeRateSnapshot | None, interval: float) -> bool:
+        """
+        A refresh is essential when the latest snapshot would leave its freshness window
+        before the next one
+        """
+        return latest is None or (
+            latest.age + interval >= settings.EXCHANGERATES_SNAPSHOT_MAX_AGE
+        )
+
+    def _refresh(self, base_currency: str) -> None:
+        try:
+            snapshot = refresh_exchange_rate_snapshot(base_currency)
+        except RateProviderException as e:
+            # Already reported to Sentry, the latest snapshot keeps being served
+            self.stderr.write(f"Could not refresh the exchange rates: {e}")
+            return
+
+        if snapshot is None:
+            self.stdout.write("Another process is already refreshing the exchange rates")
+        else:
+            self.stdout.write(
+                f"Stored exchange rate snapshot {snapshot.id} from {snapshot.provider}"
+            )
@@ -0,0 +1,64 @@
+from datetime import date, datetime
+
+from django.db import IntegrityError, models, transaction
+from django.db.models import F
+
+
+class UserTransactionCounterManager(models.Manager):
+    def get_count(self, user_id) -> int | None:
+        return self.filter(user_id=user_id).values_list("count", flat=True).first()
+
+
+class DailyTransactionSummaryManager(models.Manager):
+    def get_range(
+        self,
+        user_id,
+        start: date,
+        end: date,
+        source_currency: str | None = None,
+        target_currency: str | None = None,
+    ):
+        summaries = self.filter(user_id=user_id, day__gte=start, day__lte=end)
+        if source_currency is not None:
+            summaries = summaries.filter(source_currency=source_currency)
+        if target_currency is not None:
+            summaries = summaries.filter(target_currency=target_currency)
+        return summaries.filter(count__gt=0)
+
+
+class ExchangeRateSnapshotManager(models.Manager):
+    def get_latest(self, base_currency: str = "EUR"):
+        return self.filter(base_currency=base_currency).order_by("-created").first()
+
+
+class HistoricalExchangeRateManager(models.Manager):
+    def get_series(
+        self, base_currency: str, quote_currency: str, start: datetime, end: datetime
+    ):
+        return self.filter(
+            base_currency=base_currency,
+            quote_currency=quote_currency,
+            timestamp__gte=start,
+            timestamp__lte=end,
+        ).order_by("timestamp")
+
+
+class ProviderQuotaUsageManager(models.Manager):
+    def get_calls(self, provider: str, period_start: date) -> int:
+        usage = self.filter(provider=provider, period_start=period_start).first()
+        return usage.calls if usage else 0
+
+    def record_call(self, provider: str, period_start: date) -> None:
+        if self.filter(provider=provider, period_start=period_start).update(
+            calls=F("calls") + 1
+        ):
+            return
+
+        try:
+            with transaction.atomic():
+                self.create(provider=provider, period_start=period_start, calls=1)
+        except IntegrityError:
+            # Another process created the period row first
+            self.filter(provider=provider, period_start=period_start).update(
+                calls=F("calls") + 1
+            )
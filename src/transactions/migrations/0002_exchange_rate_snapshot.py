@@ -0,0 +1,73 @@
+# Generated by Django 4.1.13 on 2026-10-18 09:55
+
+import uuid
+
+import django.db.models.deletion
+import django_extensions.db.fields
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("transactions", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExchangeRateSnapshot",
+            fields=[
+                (
+                    "created",
+                    django_extensions.db.fields.CreationDateTimeField(
+                        auto_now_add=True, verbose_name="created"
+                    ),
+                ),
+                (
+                    "modified",
+                    django_extensions.db.fields.ModificationDateTimeField(
+                        auto_now=True, verbose_name="modified"
+                    ),
+                ),
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "base_currency",
+                    models.CharField(
+                        default="EUR", max_length=3, verbose_name="Base Currency"
+                    ),
+                ),
+                ("rates", models.JSONField(verbose_name="Rates by currency code")),
+            ],
+            options={
+                "verbose_name": "Exchange Rate Snapshot",
+                "ordering": ["-created"],
+            },
+        ),
+        migrations.AlterField(
+            model_name="transaction",
+            name="user",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="transactions",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="The User who is associated to this transaction",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="exchangeratesnapshot",
+            index=models.Index(
+                fields=["base_currency", "-created"],
+                name="transaction_base_cu_88f9c7_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 4.1.13 on 2026-10-18 10:00
+
+import uuid
+
+import django_extensions.db.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("transactions", "0002_exchange_rate_snapshot"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProviderQuotaUsage",
+            fields=[
+                (
+                    "created",
+                    django_extensions.db.fields.CreationDateTimeField(
+                        auto_now_add=True, verbose_name="created"
+                    ),
+                ),
+                (
+                    "modified",
+                    django_extensions.db.fields.ModificationDateTimeField(
+                        auto_now=True, verbose_name="modified"
+                    ),
+                ),
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("provider", models.CharField(max_length=50, verbose_name="Provider")),
+                ("period_start", models.DateField(verbose_name="Billing period start")),
+                ("calls", models.PositiveIntegerField(default=0, verbose_name="Calls")),
+            ],
+            options={
+                "verbose_name": "Provider Quota Usage",
+                "ordering": ["-period_start"],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="providerquotausage",
+            constraint=models.UniqueConstraint(
+                fields=("provider", "period_start"), name="unique_provider_period"
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.1.13 on 2026-10-18 10:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("transactions", "0003_provider_quota_usage"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="exchangeratesnapshot",
+            name="provider",
+            field=models.CharField(
+                default="exchangeratesapi", max_length=32, verbose_name="Provider"
+            ),
+        ),
+    ]
@@ -0,0 +1,103 @@
+# Generated by Django 4.1.13 on 2026-10-18 10:04
+
+import uuid
+
+import django.db.models.deletion
+import django_extensions.db.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("transactions", "0004_exchange_rate_snapshot_provider"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="HistoricalExchangeRate",
+            fields=[
+                (
+                    "created",
+                    django_extensions.db.fields.CreationDateTimeField(
+                        auto_now_add=True, verbose_name="created"
+                    ),
+                ),
+                (
+                    "modified",
+                    django_extensions.db.fields.ModificationDateTimeField(
+                        auto_now=True, verbose_name="modified"
+                    ),
+                ),
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "base_currency",
+                    models.CharField(
+                        choices=[
+                            ("BRL", "Brazilian Real"),
+                            ("USD", "US Dollar"),
+                            ("EUR", "Euro"),
+                            ("JPY", "Japanese Yen"),
+                        ],
+                        max_length=3,
+                        verbose_name="Base Currency",
+                    ),
+                ),
+                (
+                    "quote_currency",
+                    models.CharField(
+                        choices=[
+                            ("BRL", "Brazilian Real"),
+                            ("USD", "US Dollar"),
+                            ("EUR", "Euro"),
+                            ("JPY", "Japanese Yen"),
+                        ],
+                        max_length=3,
+                        verbose_name="Quote Currency",
+                    ),
+                ),
+                (
+                    "rate",
+                    models.DecimalField(
+                        decimal_places=6, max_digits=16, verbose_name="Rate"
+                    ),
+                ),
+                ("timestamp", models.DateTimeField(verbose_name="Timestamp")),
+                (
+                    "snapshot",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="historical_rates",
+                        to="transactions.exchangeratesnapshot",
+                        verbose_name="The snapshot the rate was computed from",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Historical Exchange Rate",
+                "ordering": ["timestamp"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="historicalexchangerate",
+            index=models.Index(
+                fields=["base_currency", "quote_currency", "timestamp"],
+                name="transaction_base_cu_7f7f56_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="historicalexchangerate",
+            constraint=models.UniqueConstraint(
+                fields=("snapshot", "base_currency", "quote_currency"),
+                name="unique_snapshot_pair",
+            ),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 4.1.13 on 2026-10-18 10:14
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("transactions", "0005_historical_exchange_rate"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="transaction",
+            options={"ordering": ["-created", "-id"], "verbose_name": "Transactions"},
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["user", "-created", "-id"],
+                include=(
+                    "source_currency",
+                    "target_currency",
+                    "source_amount",
+                    "converted_amount",
+                    "exchange_rate",
+                    "modified",
+                ),
+                name="transaction_user_list_idx",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="transaction",
+            name="user",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="transactions",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="The User who is associated to this transaction",
+            ),
+        ),
+    ]
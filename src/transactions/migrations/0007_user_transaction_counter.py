@@ -0,0 +1,72 @@
+# Generated by Django 4.1.13 on 2026-10-18 10:15
+
+import uuid
+
+import django.db.models.deletion
+import django_extensions.db.fields
+from django.conf import settings
+from django.db import migrations, models
+
+
+def count_existing_transactions(apps, schema_editor):
+    Transaction = apps.get_model("transactions", "Transaction")
+    UserTransactionCounter = apps.get_model("transactions", "UserTransactionCounter")
+    counts = Transaction.objects.values("user_id").annotate(count=models.Count("id"))
+    UserTransactionCounter.objects.bulk_create(
+        (
+            UserTransactionCounter(user_id=row["user_id"], count=row["count"])
+            for row in counts.order_by()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("transactions", "0006_transaction_user_list_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserTransactionCounter",
+            fields=[
+                (
+                    "created",
+                    django_extensions.db.fields.CreationDateTimeField(
+                        auto_now_add=True, verbose_name="created"
+                    ),
+                ),
+                (
+                    "modified",
+                    django_extensions.db.fields.ModificationDateTimeField(
+                        auto_now=True, verbose_name="modified"
+                    ),
+                ),
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("count", models.BigIntegerField(default=0, verbose_name="Transactions")),
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="transaction_counter",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="The User whose transactions are counted",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "User Transaction Counter",
+            },
+        ),
+        migrations.RunPython(count_existing_transactions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,151 @@
+# Generated by Django 4.1.13 on 2026-10-18 10:24
+
+import uuid
+from datetime import timezone
+
+import django.db.models.deletion
+import django_extensions.db.fields
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models.functions import TruncDate
+
+
+def summarize_existing_transactions(apps, schema_editor):
+    Transaction = apps.get_model("transactions", "Transaction")
+    DailyTransactionSummary = apps.get_model("transactions", "DailyTransactionSummary")
+    totals = (
+        Transaction.objects.order_by()
+        .annotate(day=TruncDate("created", tzinfo=timezone.utc))
+        .values("user_id", "source_currency", "target_currency", "day")
+        .annotate(
+            total_count=models.Count("id"),
+            total_source_amount=models.Sum("source_amount"),
+            total_converted_amount=models.Sum("converted_amount"),
+        )
+    )
+    DailyTransactionSummary.objects.bulk_create(
+        (
+            DailyTransactionSummary(
+                user_id=row["user_id"],
+                source_currency=row["source_currency"],
+                target_currency=row["target_currency"],
+                day=row["day"],
+                count=row["total_count"],
+                source_amount=row["total_source_amount"],
+                converted_amount=row["total_converted_amount"],
+            )
+            for row in totals
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("transactions", "0007_user_transaction_counter"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyTransactionSummary",
+            fields=[
+                (
+                    "created",
+                    django_extensions.db.fields.CreationDateTimeField(
+                        auto_now_add=True, verbose_name="created"
+                    ),
+                ),
+                (
+                    "modified",
+                    django_extensions.db.fields.ModificationDateTimeField(
+                        auto_now=True, verbose_name="modified"
+                    ),
+                ),
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "source_currency",
+                    models.CharField(
+                        choices=[
+                            ("BRL", "Brazilian Real"),
+                            ("USD", "US Dollar"),
+                            ("EUR", "Euro"),
+                            ("JPY", "Japanese Yen"),
+                        ],
+                        max_length=3,
+                        verbose_name="Source Currency",
+                    ),
+                ),
+                (
+                    "target_currency",
+                    models.CharField(
+                        choices=[
+                            ("BRL", "Brazilian Real"),
+                            ("USD", "US Dollar"),
+                            ("EUR", "Euro"),
+                            ("JPY", "Japanese Yen"),
+                        ],
+                        max_length=3,
+                        verbose_name="Target Currency",
+                    ),
+                ),
+                ("day", models.DateField(verbose_name="Day")),
+                ("count", models.BigIntegerField(default=0, verbose_name="Transactions")),
+                (
+                    "source_amount",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=20,
+                        verbose_name="Total Source Amount",
+                    ),
+                ),
+                (
+                    "converted_amount",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=20,
+                        verbose_name="Total Converted Amount",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_transaction_summaries",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="The User whose transactions are summarized",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Daily Transaction Summary",
+                "ordering": ["day", "source_currency", "target_currency"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="dailytransactionsummary",
+            index=models.Index(
+                fields=["user", "day"], name="transaction_summary_day_idx"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="dailytransactionsummary",
+            constraint=models.UniqueConstraint(
+                fields=("user", "source_currency", "target_currency", "day"),
+                name="unique_daily_transaction_summary",
+            ),
+        ),
+        migrations.RunPython(summarize_existing_transactions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.1.13 on 2026-10-18 10:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("transactions", "0008_daily_transaction_summary"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["user", "source_currency", "-created", "-id"],
+                name="transaction_user_source_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["user", "target_currency", "-created", "-id"],
+                name="transaction_user_target_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["user", "source_amount"], name="transaction_user_amount_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.1.13 on 2026-10-18 10:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("transactions", "0009_transaction_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="transaction",
+            name="quote_id",
+            field=models.UUIDField(
+                blank=True, editable=False, null=True, unique=True, verbose_name="Quote"
+            ),
+        ),
+    ]
@@ -1,9 +1,19 @@
+from django.conf import settings
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from core.models import User
 from core.utils.models.base import BaseModel
 
+from .managers import (
+    DailyTransactionSummaryManager,
+    ExchangeRateSnapshotManager,
+    HistoricalExchangeRateManager,
+    ProviderQuotaUsageManager,
+    UserTransactionCounterManager,
+)
+
 CURRENCY_CHOICES = [
     ("BRL", "Brazilian Real"),
     ("USD", "US Dollar"),
@@ -22,6 +32,8 @@ class Transaction(BaseModel):
         related_name="transactions",
         on_delete=models.CASCADE,
         verbose_name=_("The User who is associated to this transaction"),
+        # Covered by the leading column of the list indexes
+        db_index=False,
     )
     source_currency = models.CharField(
         verbose_name=_("Source Currency"), max_length=3, choices=CURRENCY_CHOICES
@@ -38,15 +50,224 @@ class Transaction(BaseModel):
     exchange_rate = models.DecimalField(
         verbose_name=_("Exchange Rate"), max_digits=10, decimal_places=6
     )
+    # Set when the transaction redeemed a quote token, so every quote is used once
+    quote_id = models.UUIDField(
+        verbose_name=_("Quote"), null=True, blank=True, unique=True, editable=False
+    )
 
     class Meta:
         verbose_name = _("Transactions")
-        ordering = ["-created"]
+        ordering = ["-created", "-id"]
+        indexes = [
+            # Lists of a user newest first, the id breaks ties of the same created. It
+            # carries the list columns, so Postgres can answer a page with an index only
+            # scan, other databases create it without the extra columns
+            models.Index(
+                fields=["user", "-created", "-id"],
+                include=[
+                    "source_currency",
+                    "target_currency",
+                    "source_amount",
+                    "converted_amount",
+                    "exchange_rate",
+                    "modified",
+                ],
+                name="transaction_user_list_idx",
+            ),
+            # Lists filtered by currency keep the list order after the equality, the
+            # created range filter is a range of any of the three
+            models.Index(
+                fields=["user", "source_currency", "-created", "-id"],
+                name="transaction_user_source_idx",
+            ),
+            models.Index(
+                fields=["user", "target_currency", "-created", "-id"],
+                name="transaction_user_target_idx",
+            ),
+            # Amount ranges are read from here and the matching rows sorted
+            models.Index(
+                fields=["user", "source_amount"], name="transaction_user_amount_idx"
+            ),
+        ]
 
     def __str__(self):
-        return _(f"Transaction {self.id} - User {self.user.username}")
+        return f"Transaction {self.id} - User {self.user_id}"
 
     def clean(self):
         # target currency and source can not be of other type then the choices
         # source amount can not be negative
         pass
+
+
+class UserTransactionCounter(BaseModel):
+    """
+    Model for keeping the number of transactions of a user, updated in the same
+    database transaction as every insert and delete.
+    """
+
+    user = models.OneToOneField(
+        User,
+        related_name="transaction_counter",
+        on_delete=models.CASCADE,
+        verbose_name=_("The User whose transactions are counted"),
+    )
+    count = models.BigIntegerField(verbose_name=_("Transactions"), default=0)
+
+    class Meta:
+        verbose_name = _("User Transaction Counter")
+
+    objects: UserTransactionCounterManager = UserTransactionCounterManager()
+
+    def __str__(self):
+        return f"{self.user_id}: {self.count} transactions"
+
+
+class DailyTransactionSummary(BaseModel):
+    """
+    Model for keeping the totals of the transactions of a user by currency pair and UTC
+    day, updated in the same database transaction as every insert and delete.
+    """
+
+    user = models.ForeignKey(
+        User,
+        related_name="daily_transaction_summaries",
+        on_delete=models.CASCADE,
+        verbose_name=_("The User whose transactions are summarized"),
+        # Covered by the leading column of the unique constraint
+        db_index=False,
+    )
+    source_currency = models.CharField(
+        verbose_name=_("Source Currency"), max_length=3, choices=CURRENCY_CHOICES
+    )
+    target_currency = models.CharField(
+        verbose_name=_("Target Currency"), max_length=3, choices=CURRENCY_CHOICES
+    )
+    day = models.DateField(verbose_name=_("Day"))
+    count = models.BigIntegerField(verbose_name=_("Transactions"), default=0)
+    source_amount = models.DecimalField(
+        verbose_name=_("Total Source Amount"), max_digits=20, decimal_places=2, default=0
+    )
+    converted_amount = models.DecimalField(
+        verbose_name=_("Total Converted Amount"),
+        max_digits=20,
+        decimal_places=2,
+        default=0,
+    )
+
+    class Meta:
+        verbose_name = _("Daily Transaction Summary")
+        ordering = ["day", "source_currency", "target_currency"]
+        constraints = [
+            # Also the index of the reads of a pair over a range of days
+            models.UniqueConstraint(
+                fields=["user", "source_currency", "target_currency", "day"],
+                name="unique_daily_transaction_summary",
+            )
+        ]
+        indexes = [
+            # Reads of every pair of a user over a range of days
+            models.Index(fields=["user", "day"], name="transaction_summary_day_idx")
+        ]
+
+    objects: DailyTransactionSummaryManager = DailyTransactionSummaryManager()
+
+    def __str__(self):
+        return (
+            f"{self.user_id} {self.day} {self.source_currency}/{self.target_currency}: "
+            f"{self.count} transactions"
+        )
+
+
+class ExchangeRateSnapshot(BaseModel):
+    """
+    Model for storing the exchange rates fetched from the rates provider.
+    """
+
+    base_currency = models.CharField(
+        verbose_name=_("Base Currency"), max_length=3, default="EUR"
+    )
+    rates = models.JSONField(verbose_name=_("Rates by currency code"))
+    provider = models.CharField(
+        verbose_name=_("Provider"), max_length=32, default="exchangeratesapi"
+    )
+
+    class Meta:
+        verbose_name = _("Exchange Rate Snapshot")
+        ordering = ["-created"]
+        indexes = [models.Index(fields=["base_currency", "-created"])]
+
+    objects: ExchangeRateSnapshotManager = ExchangeRateSnapshotManager()
+
+    def __str__(self):
+        return f"{self.base_currency} rates at {self.created.isoformat()}"
+
+    @property
+    def age(self) -> float:
+        return (timezone.now() - self.created).total_seconds()
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.age <= settings.EXCHANGERATES_SNAPSHOT_MAX_AGE
+
+
+class HistoricalExchangeRate(BaseModel):
+    """
+    Model for storing the rate of a currency pair at the time of a snapshot.
+    """
+
+    snapshot = models.ForeignKey(
+        ExchangeRateSnapshot,
+        related_name="historical_rates",
+        on_delete=models.CASCADE,
+        verbose_name=_("The snapshot the rate was computed from"),
+    )
+    base_currency = models.CharField(
+        verbose_name=_("Base Currency"), max_length=3, choices=CURRENCY_CHOICES
+    )
+    quote_currency = models.CharField(
+        verbose_name=_("Quote Currency"), max_length=3, choices=CURRENCY_CHOICES
+    )
+    rate = models.DecimalField(verbose_name=_("Rate"), max_digits=16, decimal_places=6)
+    timestamp = models.DateTimeField(verbose_name=_("Timestamp"))
+
+    class Meta:
+        verbose_name = _("Historical Exchange Rate")
+        ordering = ["timestamp"]
+        indexes = [models.Index(fields=["base_currency", "quote_currency", "timestamp"])]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["snapshot", "base_currency", "quote_currency"],
+                name="unique_snapshot_pair",
+            )
+        ]
+
+    objects: HistoricalExchangeRateManager = HistoricalExchangeRateManager()
+
+    def __str__(self):
+        return (
+            f"{self.base_currency}/{self.quote_currency} {self.rate} at {self.timestamp}"
+        )
+
+
+class ProviderQuotaUsage(BaseModel):
+    """
+    Model for counting the requests made to a rates provider in a billing period.
+    """
+
+    provider = models.CharField(verbose_name=_("Provider"), max_length=50)
+    period_start = models.DateField(verbose_name=_("Billing period start"))
+    calls = models.PositiveIntegerField(verbose_name=_("Calls"), default=0)
+
+    class Meta:
+        verbose_name = _("Provider Quota Usage")
+        ordering = ["-period_start"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["provider", "period_start"], name="unique_provider_period"
+            )
+        ]
+
+    objects: ProviderQuotaUsageManager = ProviderQuotaUsageManager()
+
+    def __str__(self):
+        return f"{self.provider} {self.period_start}: {self.calls} calls"
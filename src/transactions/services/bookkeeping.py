@@ -0,0 +1,139 @@
+from collections import Counter
+from typing import Any, Iterable
+
+from django.db import IntegrityError, transaction
+from django.db.models import F, QuerySet
+from django.utils import timezone
+
+from transactions.models import Transaction, UserTransactionCounter
+from transactions.services.list_cache import TransactionListCache
+from transactions.services.summaries import add_to_daily_summaries
+
+SUMMARIZED_FIELDS = (
+    "user",
+    "source_currency",
+    "target_currency",
+    "source_amount",
+    "converted_amount",
+    "created",
+)
+
+
+def create_transaction(**transaction_data: Any) -> Transaction:
+    """
+    Insert a transaction and count it for its user and its day atomically
+    Params:
+        transaction_data: The fields of the transaction
+    Returns: The created transaction
+    """
+    return insert_transaction(Transaction(**transaction_data))
+
+
+def insert_transaction(row: Transaction) -> Transaction:
+    """
+    Insert an unsaved transaction and count it for its user and its day atomically
+    Params:
+        row: The unsaved transaction
+    Returns: The same transaction, saved
+    """
+    with transaction.atomic():
+        row.save(force_insert=True)
+        add_to_transaction_counter(row.user_id, 1)
+        add_to_daily_summaries([row])
+        TransactionListCache.bump_generation(row.user_id)
+    return row
+
+
+def update_transaction(row: Transaction) -> Transaction:
+    """
+    Save the changes of a transaction and move its count and totals with it atomically
+    Params:
+        row: The changed transaction
+    Returns: The same transaction, saved
+    """
+    with transaction.atomic():
+        # Locked so the count and totals taken out are the ones of the saved row
+        old = (
+            Transaction.objects.select_for_update()
+            .only(*SUMMARIZED_FIELDS)
+            .get(id=row.id)
+        )
+        row.save()
+        if old.user_id != row.user_id:
+            add_to_transaction_counter(old.user_id, -1)
+            add_to_transaction_counter(row.user_id, 1)
+            TransactionListCache.bump_generation(old.user_id)
+        add_to_daily_summaries([old], sign=-1)
+        add_to_daily_summaries([row])
+        TransactionListCache.bump_generation(row.user_id)
+    return row
+
+
+def bulk_create_transactions(rows: Iterable[Transaction]) -> list[Transaction]:
+    """
+    Insert transactions with a single query and count them for their users and days
+    atomically
+    Params:
+        rows: The unsaved transactions
+    Returns: The created transactions
+    """
+    with transaction.atomic():
+        created = Transaction.objects.bulk_create(rows)
+        for user_id, count in Counter(row.user_id for row in created).items():
+            add_to_transaction_counter(user_id, count)
+            TransactionListCache.bump_generation(user_id)
+        add_to_daily_summaries(created)
+    return created
+
+
+def delete_transactions(queryset: QuerySet[Transaction]) -> int:
+    """
+    Delete transactions and discount them from their users and days atomically
+    Params:
+        queryset: The transactions that are going to be deleted
+    Returns: The number of deleted transactions
+    """
+    with transaction.atomic():
+        # Locked so the rows counted are the rows deleted
+        rows = list(queryset.select_for_update().only(*SUMMARIZED_FIELDS))
+        Transaction.objects.filter(id__in=[row.id for row in rows]).delete()
+        for user_id, count in Counter(row.user_id for row in rows).items():
+            add_to_transaction_counter(user_id, -count)
+            TransactionListCache.bump_generation(user_id)
+        add_to_daily_summaries(rows, sign=-1)
+    return len(rows)
+
+
+def add_to_transaction_counter(user_id, delta: int) -> None:
+    """
+    Change the counter of a user, it must run in the transaction that changed its rows
+    Params:
+        user_id: The id of the user
+        delta: The number of transactions inserted, negative when they were deleted
+    """
+    if UserTransactionCounter.objects.filter(user_id=user_id).update(
+        count=F("count") + delta, modified=timezone.now()
+    ):
+        return
+
+    try:
+        with transaction.atomic():
+            # The rows changed by the current transaction are already counted
+            UserTransactionCounter.objects.create(
+                user_id=user_id, count=Transaction.objects.filter(user_id=user_id).count()
+            )
+    except IntegrityError:
+        # Another transaction created the counter first
+        UserTransactionCounter.objects.filter(user_id=user_id).update(
+            count=F("count") + delta, modified=timezone.now()
+        )
+
+
+def get_transaction_count(user_id) -> int | None:
+    """
+    Get the number of transactions of a user without counting them
+    Params:
+        user_id: The id of the user
+    Returns: The counter of the user, None when the user has no counter yet
+    """
+    return UserTransactionCounter.objects.get_count(user_id)
@@ -0,0 +1,104 @@
+import threading
+from dataclasses import dataclass
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Mapping
+from uuid import UUID
+
+from transactions.exceptions.exchangerate import ExchangeRatesUnavailableException
+from transactions.models import CURRENCY_CHOICES, ExchangeRateSnapshot
+
+# Precision of Transaction.exchange_rate and Transaction.converted_amount
+RATE_EXPONENT = Decimal("0.000001")
+AMOUNT_EXPONENT = Decimal("0.01")
+
+SUPPORTED_CURRENCIES = tuple(code for code, _ in CURRENCY_CHOICES)
+
+
+@dataclass(frozen=True)
+class CrossRateMatrix:
+    """
+    Immutable N×N matrix with the rate between every pair of supported currencies of
+    a snapshot, quantized to the stored precision.
+    """
+
+    snapshot_id: UUID | None
+    rates: Mapping[tuple[str, str], Decimal]
+
+    _compiled = {}
+    _compiled_lock = threading.Lock()
+    MAX_COMPILED = 16
+
+    @classmethod
+    def from_rates(
+        cls,
+        rates: Mapping[str, float],
+        base_currency: str = "EUR",
+        snapshot_id: UUID | None = None,
+        currencies: tuple[str, ...] = SUPPORTED_CURRENCIES,
+    ) -> "CrossRateMatrix":
+        """
+        Compile the rates of a snapshot into a cross-rate matrix
+        Params:
+            rates: The provider rates relative to the base currency
+            base_currency: The currency the rates are relative to
+            snapshot_id: The id of the snapshot the rates belong to
+            currencies: The currencies that are going to be in the matrix
+        Returns: The compiled matrix
+        """
+        base_rates = {base_currency: Decimal(1)}
+        base_rates.update(
+            {code: Decimal(str(rates[code])) for code in currencies if code in rates}
+        )
+        available = [code for code in currencies if code in base_rates]
+        cross_rates = {
+            (source, target): (base_rates[target] / base_rates[source]).quantize(
+                RATE_EXPONENT
+            )
+            for source in available
+            for target in available
+        }
+        return cls(snapshot_id=snapshot_id, rates=MappingProxyType(cross_rates))
+
+    @classmethod
+    def for_snapshot(cls, snapshot: ExchangeRateSnapshot) -> "CrossRateMatrix":
+        """
+        Get the matrix of the snapshot, compiling it only the first time this process
+        sees the snapshot
+        Params:
+            snapshot: The snapshot with the provider rates
+        Returns: The compiled matrix
+        """
+        matrix = cls._compiled.get(snapshot.id)
+        if matrix is not None:
+            return matrix
+
+        matrix = cls.from_rates(
+            snapshot.rates, base_currency=snapshot.base_currency, snapshot_id=snapshot.id
+        )
+        with cls._compiled_lock:
+            if len(cls._compiled) >= cls.MAX_COMPILED:
+                cls._compiled.pop(next(iter(cls._compiled)))
+            cls._compiled[snapshot.id] = matrix
+        return matrix
+
+    def get_rate(self, source_currency: str, target_currency: str) -> Decimal:
+        try:
+            return self.rates[(source_currency, target_currency)]
+        except KeyError:
+            # The provider did not return one of the currencies
+            raise ExchangeRatesUnavailableException()
+
+    def convert(
+        self, source_currency: str, target_currency: str, source_amount: Decimal
+    ) -> tuple[Decimal, Decimal]:
+        """
+        Convert an amount with a single lookup and multiplication
+        Params:
+            source_currency: The currency of the amount
+            target_currency: The currency the amount is converted to
+            source_amount: The amount that is going to be converted
+        Returns: The converted amount and the exchange rate used
+        """
+        exchange_rate = self.get_rate(source_currency, target_currency)
+        return (source_amount * exchange_rate).quantize(AMOUNT_EXPONENT), exchange_rate
@@ -0,0 +1,28 @@
+from transactions.models import ExchangeRateSnapshot, HistoricalExchangeRate
+from transactions.services.cross_rates import CrossRateMatrix
+
+
+def record_exchange_rate_history(
+    snapshot: ExchangeRateSnapshot,
+) -> list[HistoricalExchangeRate]:
+    """
+    Store the rate of every pair of supported currencies at the time of the snapshot
+    Params:
+        snapshot: The snapshot the rates are computed from
+    Returns: The stored historical rates
+    """
+    matrix = CrossRateMatrix.for_snapshot(snapshot)
+    return HistoricalExchangeRate.objects.bulk_create(
+        [
+            HistoricalExchangeRate(
+                snapshot=snapshot,
+                base_currency=base_currency,
+                quote_currency=quote_currency,
+                rate=rate,
+                timestamp=snapshot.created,
+            )
+            for (base_currency, quote_currency), rate in matrix.rates.items()
+            if base_currency != quote_currency
+        ],
+        ignore_conflicts=True,
+    )
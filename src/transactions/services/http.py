@@ -0,0 +1,116 @@
+import os
+import random
+import threading
+import time
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+from core.utils.metrics.registry import metrics
+from transactions.services.quota import QuotaPlanner
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class PooledHTTPClient:
+    """
+    HTTP client of a rates provider, with one pooled keep-alive session per process,
+    connect and read timeouts and a bounded retry budget.
+    """
+
+    def __init__(self, name: str, quota_planner: QuotaPlanner | None = None):
+        self.name = name
+        self.quota_planner = quota_planner
+        self._session: requests.Session | None = None
+        self._session_pid: int | None = None
+        self._session_lock = threading.Lock()
+
+    def get_session(self) -> requests.Session:
+        """
+        Get the pooled keep-alive session of the current process, so warm calls reuse
+        the open connection instead of doing a new TCP and TLS handshake
+        Returns: The session shared by every call of this process
+        """
+        pid = os.getpid()
+        if self._session is None or self._session_pid != pid:
+            with self._session_lock:
+                # Connections must not be shared with the parent of a forked worker
+                if self._session is None or self._session_pid != pid:
+                    adapter = HTTPAdapter(
+                        pool_connections=1,
+                        pool_maxsize=settings.EXCHANGERATES_API_POOL_SIZE,
+                        max_retries=0,
+                    )
+                    session = requests.Session()
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._session = session
+                    self._session_pid = pid
+        return self._session
+
+    def get(self, url: str) -> requests.Response:
+        """
+        GET the url with connect and read timeouts, retrying connection errors, timeouts
+        and retryable statuses with jittered exponential backoff inside the retry budget
+        Params:
+            url: The url that is going to be requested
+        Returns: The provider response
+        """
+        session = self.get_session()
+        timeout = (
+            settings.EXCHANGERATES_API_CONNECT_TIMEOUT,
+            settings.EXCHANGERATES_API_READ_TIMEOUT,
+        )
+        deadline = time.monotonic() + settings.EXCHANGERATES_API_RETRY_BUDGET
+        attempts = settings.EXCHANGERATES_API_MAX_RETRIES + 1
+
+        attempt = 0
+        while True:
+            attempt += 1
+            start = time.perf_counter()
+            try:
+                response = session.get(url, timeout=timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if not self._wait_for_retry(attempt, attempts, deadline):
+                    raise
+                continue
+            finally:
+                metrics.increment(f"{self.name}.attempts")
+                metrics.timing(
+                    f"{self.name}.attempt_latency", time.perf_counter() - start
+                )
+
+            # Every request answered by the provider counts towards its quota
+            if self.quota_planner is not None:
+                self.quota_planner.record_call()
+
+            if response.status_code in RETRY_STATUS_CODES and self._wait_for_retry(
+                attempt, attempts, deadline
+            ):
+                continue
+            return response
+
+    def _wait_for_retry(self, attempt: int, attempts: int, deadline: float) -> bool:
+        """
+        Sleep before the next attempt when it still fits in the retry budget
+        Params:
+            attempt: The number of the attempt that just failed
+            attempts: The maximum number of attempts
+            deadline: The monotonic time after which no attempt is started
+        Returns: Whether a new attempt should be made
+        """
+        if attempt >= attempts:
+            return False
+
+        backoff = min(
+            settings.EXCHANGERATES_API_RETRY_BACKOFF_MAX,
+            settings.EXCHANGERATES_API_RETRY_BACKOFF * 2 ** (attempt - 1),
+        )
+        delay = random.uniform(0, backoff)
+        if time.monotonic() + delay >= deadline:
+            return False
+
+        metrics.increment(f"{self.name}.retries")
+        time.sleep(delay)
+        return True
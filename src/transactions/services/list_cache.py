@@ -0,0 +1,108 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from core.utils.metrics.registry import metrics
+
+
+class TransactionListCache:
+    """
+    Cache of the first pages of the transaction list of each user. The pages are keyed
+    by a generation of the user that every write bumps once committed, so a write
+    invalidates every cached page of the user with a single increment and the pages of
+    an older generation are never read again.
+    """
+
+    GENERATION_KEY = "transactions:generation:{user_id}"
+    PAGE_KEY = "transactions:page:{user_id}:{generation}:{request_hash}"
+
+    @classmethod
+    def get_cache(cls):
+        return caches[settings.TRANSACTIONS_LIST_CACHE_ALIAS]
+
+    @classmethod
+    def get_generation(cls, user_id) -> int:
+        """
+        Get the current generation of the pages of a user
+        Params:
+            user_id: The id of the user
+        Returns: The generation, starting from the current time when it is not cached,
+        so an evicted generation is never reused
+        """
+        cache = cls.get_cache()
+        key = cls.GENERATION_KEY.format(user_id=user_id)
+        generation = cache.get(key)
+        if generation is None:
+            cache.add(key, time.time_ns(), timeout=None)
+            generation = cache.get(key)
+        return generation
+
+    @classmethod
+    def bump_generation(cls, user_id) -> None:
+        """
+        Invalidate the cached pages of a user once the current transaction commits,
+        it must run in the transaction that changed the rows
+        Params:
+            user_id: The id of the user
+        """
+        transaction.on_commit(lambda: cls._bump_generation(user_id))
+
+    @classmethod
+    def get_page(cls, user_id, generation: int, request_key: str) -> dict | None:
+        """
+        Get a cached page
+        Params:
+            user_id: The id of the user
+            generation: The generation read before the page was requested
+            request_key: The identity of the requested page, e.g. its absolute URL
+        Returns: The page data or None when it is not cached
+        """
+        page = cls.get_cache().get(cls._get_page_key(user_id, generation, request_key))
+        metrics.increment(
+            "transactions.list_cache.miss"
+            if page is None
+            else "transactions.list_cache.hit"
+        )
+        hits = metrics.get_counter("transactions.list_cache.hit")
+        misses = metrics.get_counter("transactions.list_cache.miss")
+        metrics.gauge("transactions.list_cache.hit_ratio", hits / (hits + misses))
+        return page
+
+    @classmethod
+    def set_page(cls, user_id, generation: int, request_key: str, page: dict) -> None:
+        """
+        Cache a page read after its generation, a write in between only leaves it in
+        a generation that is not read anymore
+        Params:
+            user_id: The id of the user
+            generation: The generation read before the page was read
+            request_key: The identity of the requested page, e.g. its absolute URL
+            page: The page data
+        """
+        cls.get_cache().set(
+            cls._get_page_key(user_id, generation, request_key),
+            page,
+            timeout=settings.TRANSACTIONS_LIST_CACHE_TTL,
+        )
+
+    @classmethod
+    def _bump_generation(cls, user_id) -> None:
+        cache = cls.get_cache()
+        key = cls.GENERATION_KEY.format(user_id=user_id)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Not cached, the next read starts a new generation
+            pass
+        metrics.increment("transactions.list_cache.invalidations")
+
+    @classmethod
+    def _get_page_key(cls, user_id, generation: int, request_key: str) -> str:
+        return cls.PAGE_KEY.format(
+            user_id=user_id,
+            generation=generation,
+            request_hash=hashlib.sha256(request_key.encode()).hexdigest(),
+        )
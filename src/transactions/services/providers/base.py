@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+
+class RateProvider(ABC):
+    name: str
+
+    @abstractmethod
+    def get_rates(self, base_currency: str) -> dict:
+        """
+        Get the latest rates
+        Params:
+            base_currency: The currency the rates are relative to
+        Returns: The exchange rates by currency code
+        """
+        pass
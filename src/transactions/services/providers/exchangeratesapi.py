@@ -0,0 +1,9 @@
+from transactions.services.exchangerate import ExchangeRatesAPI
+from transactions.services.providers.base import RateProvider
+
+
+class ExchangeRatesAPIProvider(RateProvider):
+    name = "exchangeratesapi"
+
+    def get_rates(self, base_currency: str) -> dict:
+        return ExchangeRatesAPI.get_exchange_rates(base_currency)
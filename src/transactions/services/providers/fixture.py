@@ -0,0 +1,33 @@
+import json
+from decimal import Decimal
+
+from django.conf import settings
+
+from transactions.exceptions.exchangerate import RateProviderException
+from transactions.services.providers.base import RateProvider
+
+
+class FixtureRatesProvider(RateProvider):
+    """
+    Rates read from a JSON file with a base currency and its rates, for offline use.
+    """
+
+    name = "fixture"
+
+    def get_rates(self, base_currency: str) -> dict:
+        try:
+            with open(settings.EXCHANGERATES_FIXTURE_PATH) as fixture:
+                data = json.load(fixture, parse_float=Decimal)
+        except (OSError, ValueError) as e:
+            raise RateProviderException(
+                "Could not read the exchange rates fixture."
+            ) from e
+
+        rates = data["rates"]
+        if data["base"] == base_currency:
+            return {code: float(rate) for code, rate in rates.items()}
+        if base_currency not in rates:
+            raise RateProviderException(f"The fixture has no {base_currency} rate.")
+
+        base_rate = rates[base_currency]
+        return {code: float(rate / base_rate) for code, rate in rates.items()}
@@ -0,0 +1,31 @@
+import requests
+import sentry_sdk
+from django.conf import settings
+
+from transactions.exceptions.exchangerate import RateProviderException
+from transactions.services.http import PooledHTTPClient
+from transactions.services.providers.base import RateProvider
+
+
+class OpenERAPIProvider(RateProvider):
+    """
+    Keyless open access endpoint of ExchangeRate-API, refreshed once a day.
+    """
+
+    name = "open_er_api"
+    http = PooledHTTPClient("open_er_api")
+
+    def get_rates(self, base_currency: str) -> dict:
+        try:
+            response = self.http.get(f"{settings.OPEN_ER_API_URL}/{base_currency}")
+            response.raise_for_status()
+            data = response.json()
+        except requests.exceptions.RequestException as e:
+            sentry_sdk.capture_exception(e)
+            raise RateProviderException("Could not reach the open.er-api.com API.") from e
+
+        if data.get("result") != "success":
+            raise RateProviderException(
+                f"open.er-api.com answered with an error: {data.get('error-type')}"
+            )
+        return data["rates"]
@@ -0,0 +1,147 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from django.conf import settings
+from django.db import connections
+
+from core.utils.metrics.registry import metrics
+from core.utils.resilience.circuit_breaker import CircuitBreaker, CircuitBreakerOpen
+from transactions.exceptions.exchangerate import RateProvidersUnavailableException
+from transactions.services.providers.base import RateProvider
+from transactions.services.providers.exchangeratesapi import ExchangeRatesAPIProvider
+from transactions.services.providers.fixture import FixtureRatesProvider
+from transactions.services.providers.open_er_api import OpenERAPIProvider
+
+PROVIDERS = {
+    provider.name: provider
+    for provider in (ExchangeRatesAPIProvider, OpenERAPIProvider, FixtureRatesProvider)
+}
+
+
+class HedgedRateSource:
+    """
+    Ask the providers in order of preference, each one behind its own circuit breaker.
+    When a provider is slower than the latency percentile of the past calls the next
+    one is asked as well, and the first rates received win.
+    """
+
+    LATENCY_WINDOW = 100
+    MIN_LATENCY_SAMPLES = 10
+
+    def __init__(self, providers: list[RateProvider]):
+        self.providers = providers
+        self.breakers = {
+            provider.name: CircuitBreaker(
+                f"rates.{provider.name}",
+                failure_threshold=settings.EXCHANGERATES_BREAKER_FAILURE_THRESHOLD,
+                reset_timeout=settings.EXCHANGERATES_BREAKER_RESET_TIMEOUT,
+            )
+            for provider in providers
+        }
+        self._latencies = deque(maxlen=self.LATENCY_WINDOW)
+        self._latencies_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(providers), thread_name_prefix="rate-source"
+        )
+
+    def get_hedge_delay(self) -> float:
+        """
+        Get how long a provider is waited for before the next one is asked
+        Returns: The latency percentile of the past calls, or the configured delay
+        while there are too few of them
+        """
+        with self._latencies_lock:
+            latencies = sorted(self._latencies)
+        if len(latencies) < self.MIN_LATENCY_SAMPLES:
+            return settings.EXCHANGERATES_HEDGE_DELAY
+
+        index = round(
+            settings.EXCHANGERATES_HEDGE_PERCENTILE / 100 * (len(latencies) - 1)
+        )
+        return latencies[index]
+
+    def get_rates(self, base_currency: str = "EUR") -> tuple[str, dict]:
+        """
+        Get the latest rates from the first provider that answers
+        Params:
+            base_currency: The currency the rates are relative to
+        Returns: The name of the provider that answered and its rates
+        """
+        errors = []
+        pending: dict[Future, str] = {}
+        candidates = iter(self.providers)
+
+        def ask_next() -> bool:
+            for provider in candidates:
+                breaker = self.breakers[provider.name]
+                if not breaker.allows_calls():
+                    errors.append(CircuitBreakerOpen(f"{provider.name} circuit is open"))
+                    continue
+                future = self._executor.submit(
+                    self._call, breaker, provider, base_currency
+                )
+                pending[future] = provider.name
+                return True
+            return False
+
+        ask_next()
+        while pending:
+            done, _ = wait(
+                pending, timeout=self.get_hedge_delay(), return_when=FIRST_COMPLETED
+            )
+            if not done:
+                # The providers in flight are slower than usual, hedge with the next one
+                if ask_next():
+                    metrics.increment("rates.hedged_requests")
+                    continue
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                name = pending.pop(future)
+                try:
+                    rates = future.result()
+                except Exception as e:
+                    # Fail over to the next provider right away
+                    errors.append(e)
+                    ask_next()
+                    continue
+                metrics.increment(f"rates.{name}.wins")
+                return name, rates
+
+        raise RateProvidersUnavailableException(errors)
+
+    def _call(
+        self, breaker: CircuitBreaker, provider: RateProvider, base_currency: str
+    ) -> dict:
+        start = time.perf_counter()
+        try:
+            rates = breaker.call(provider.get_rates, base_currency)
+        finally:
+            # The worker threads are not managed by Django
+            connections.close_all()
+        latency = time.perf_counter() - start
+        with self._latencies_lock:
+            self._latencies.append(latency)
+        metrics.timing(f"rates.{provider.name}.latency", latency)
+        return rates
+
+
+_rate_source: HedgedRateSource | None = None
+_rate_source_lock = threading.Lock()
+
+
+def get_rate_source() -> HedgedRateSource:
+    """
+    Get the rate source of the process built from the EXCHANGERATES_PROVIDERS setting
+    Returns: The shared rate source
+    """
+    global _rate_source
+    if _rate_source is None:
+        with _rate_source_lock:
+            if _rate_source is None:
+                _rate_source = HedgedRateSource(
+                    [PROVIDERS[name]() for name in settings.EXCHANGERATES_PROVIDERS]
+                )
+    return _rate_source
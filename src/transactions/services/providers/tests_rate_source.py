@@ -0,0 +1,95 @@
+import threading
+
+import pytest
+
+from core.utils.metrics.registry import metrics
+from transactions.exceptions.exchangerate import (
+    RateProviderException,
+    RateProvidersUnavailableException,
+)
+from transactions.services.providers.base import RateProvider
+from transactions.services.providers.fixture import FixtureRatesProvider
+from transactions.services.providers.rate_source import HedgedRateSource
+
+
+class FakeProvider(RateProvider):
+    def __init__(self, name, rates=None, release=None):
+        self.name = name
+        self.rates = rates
+        self.release = release
+        self.calls = 0
+
+    def get_rates(self, base_currency):
+        self.calls += 1
+        if self.release is not None:
+            self.release.wait(5)
+        if self.rates is None:
+            raise RateProviderException(f"{self.name} is down")
+        return self.rates
+
+
+def test_first_provider_answers(rates):
+    """Check if the preferred provider is the only one asked when it answers"""
+    primary = FakeProvider("primary", rates)
+    secondary = FakeProvider("secondary", rates)
+
+    assert HedgedRateSource([primary, secondary]).get_rates() == ("primary", rates)
+    assert secondary.calls == 0
+
+
+def test_failing_provider_falls_back_to_the_next(rates):
+    """Check if the next provider is asked when the preferred one fails"""
+    source = HedgedRateSource([FakeProvider("down"), FakeProvider("fallback", rates)])
+
+    assert source.get_rates() == ("fallback", rates)
+
+
+def test_slow_provider_is_hedged(rates, settings):
+    """Check if the next provider is asked when the preferred one is slow"""
+    settings.EXCHANGERATES_HEDGE_DELAY = 0.01
+    release = threading.Event()
+    source = HedgedRateSource(
+        [FakeProvider("slow", rates, release), FakeProvider("fast", rates)]
+    )
+
+    try:
+        assert source.get_rates() == ("fast", rates)
+    finally:
+        release.set()
+    assert metrics.get_counter("rates.hedged_requests") == 1
+
+
+def test_open_circuit_skips_the_provider(rates, settings):
+    """Check if a provider is not asked while its circuit is open"""
+    settings.EXCHANGERATES_BREAKER_FAILURE_THRESHOLD = 1
+    down = FakeProvider("down")
+    source = HedgedRateSource([down, FakeProvider("fallback", rates)])
+    source.get_rates()
+
+    assert source.get_rates() == ("fallback", rates)
+    assert down.calls == 1
+
+
+def test_every_provider_failing():
+    """Check if the errors of every provider are reported"""
+    source = HedgedRateSource([FakeProvider("first"), FakeProvider("second")])
+
+    with pytest.raises(RateProvidersUnavailableException) as error:
+        source.get_rates()
+    assert len(error.value.errors) == 2
+
+
+def test_hedge_delay_follows_the_latencies(settings):
+    """Check if the hedge delay is the latency percentile once there are enough calls"""
+    settings.EXCHANGERATES_HEDGE_PERCENTILE = 90
+    source = HedgedRateSource([FakeProvider("primary")])
+    assert source.get_hedge_delay() == settings.EXCHANGERATES_HEDGE_DELAY
+
+    source._latencies.extend(i / 10 for i in range(1, 11))
+    assert source.get_hedge_delay() == 0.9
+
+
+def test_fixture_provider_rebases_the_rates():
+    """Check if the fixture rates can be read relative to another currency"""
+    assert FixtureRatesProvider().get_rates("EUR")["EUR"] == 1
+    assert FixtureRatesProvider().get_rates("USD")["USD"] == 1
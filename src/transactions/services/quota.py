@@ -0,0 +1,154 @@
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, time
+from datetime import timezone as dt_timezone
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+
+from core.utils.metrics.registry import metrics
+from transactions.models import ProviderQuotaUsage
+
+
+@dataclass(frozen=True)
+class QuotaState:
+    provider: str
+    period_start: datetime
+    period_end: datetime
+    quota: int
+    reserve: int
+    calls: int
+    remaining_calls: int
+    expected_calls: float
+    projected_calls: float
+    projected_balance: float
+    refresh_interval: float
+    ahead_of_budget: bool
+
+
+class QuotaPlanner:
+    """
+    Plan the requests made to a rates provider so its monthly quota lasts until the end
+    of the billing period.
+    """
+
+    def __init__(
+        self,
+        provider: str = "exchangeratesapi",
+        quota: int | None = None,
+        reserve: int | None = None,
+        billing_day: int | None = None,
+    ):
+        self.provider = provider
+        self.quota = settings.EXCHANGERATES_MONTHLY_QUOTA if quota is None else quota
+        self.reserve = (
+            settings.EXCHANGERATES_QUOTA_RESERVE if reserve is None else reserve
+        )
+        self.billing_day = billing_day or settings.EXCHANGERATES_BILLING_DAY
+        # Every month has the billing day, so get_period can build its dates
+        if not 1 <= self.billing_day <= 28:
+            raise ImproperlyConfigured(
+                f"EXCHANGERATES_BILLING_DAY must be between 1 and 28, "
+                f"got {self.billing_day}"
+            )
+
+    def get_period(self, now: datetime | None = None) -> tuple[datetime, datetime]:
+        """
+        Get the billing period that contains the given time
+        Params:
+            now: The time inside the period, defaults to now
+        Returns: The start and the end of the period
+        """
+        now = now or timezone.now()
+        year, month = now.year, now.month
+        if now.day < self.billing_day:
+            year, month = (year - 1, 12) if month == 1 else (year, month - 1)
+        next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+        return (
+            self._start_of_day(date(year, month, self.billing_day)),
+            self._start_of_day(date(next_year, next_month, self.billing_day)),
+        )
+
+    def record_call(self, now: datetime | None = None) -> None:
+        """
+        Count a request made to the provider in the current billing period
+        Params:
+            now: The time of the request, defaults to now
+        """
+        period_start, _ = self.get_period(now)
+        ProviderQuotaUsage.objects.record_call(self.provider, period_start.date())
+        metrics.increment(f"quota.{self.provider}.calls")
+
+    def get_state(self, now: datetime | None = None) -> QuotaState:
+        """
+        Get the usage of the current billing period and its projection
+        Params:
+            now: The time the state is computed at, defaults to now
+        Returns: The quota state
+        """
+        now = now or timezone.now()
+        period_start, period_end = self.get_period(now)
+        calls = ProviderQuotaUsage.objects.get_calls(self.provider, period_start.date())
+
+        period = (period_end - period_start).total_seconds()
+        elapsed = max((now - period_start).total_seconds(), 1)
+        time_left = (period_end - now).total_seconds()
+        remaining_calls = max(self.quota - calls, 0)
+        budget = max(self.quota - self.reserve, 0)
+        expected_calls = budget * elapsed / period
+        projected_calls = calls * period / elapsed
+        plannable_calls = remaining_calls - self.reserve
+
+        state = QuotaState(
+            provider=self.provider,
+            period_start=period_start,
+            period_end=period_end,
+            quota=self.quota,
+            reserve=self.reserve,
+            calls=calls,
+            remaining_calls=remaining_calls,
+            expected_calls=round(expected_calls, 2),
+            projected_calls=round(projected_calls, 2),
+            projected_balance=round(self.quota - projected_calls, 2),
+            refresh_interval=(
+                time_left / plannable_calls if plannable_calls > 0 else time_left
+            ),
+            ahead_of_budget=calls > expected_calls,
+        )
+        for name in ("calls", "remaining_calls", "projected_balance", "refresh_interval"):
+            metrics.gauge(f"quota.{self.provider}.{name}", asdict(state)[name])
+        return state
+
+    def get_refresh_interval(
+        self, minimum: float = 0, now: datetime | None = None
+    ) -> float:
+        """
+        Spread the calls left over the time left in the billing period
+        Params:
+            minimum: The shortest interval that can be returned
+            now: The time the interval is computed at, defaults to now
+        Returns: The seconds until the next refresh
+        """
+        return max(self.get_state(now).refresh_interval, minimum)
+
+    def should_refresh(
+        self, essential: bool = False, now: datetime | None = None
+    ) -> bool:
+        """
+        Decide if a refresh can spend a call now
+        Params:
+            essential: Whether the refresh can use the reserved calls
+            now: The time of the refresh, defaults to now
+        Returns: Whether the refresh should be made
+        """
+        state = self.get_state(now)
+        if state.remaining_calls == 0:
+            return False
+        if essential:
+            return True
+        return state.remaining_calls > self.reserve and not state.ahead_of_budget
+
+    @staticmethod
+    def _start_of_day(day: date) -> datetime:
+        return datetime.combine(day, time.min, tzinfo=dt_timezone.utc)
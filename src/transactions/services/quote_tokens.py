@@ -0,0 +1,128 @@
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID, uuid4
+
+from django.conf import settings
+from django.core import signing
+from django.utils import timezone
+
+from core.utils.http.etag import make_etag
+from transactions.exceptions.exchangerate import (
+    ExpiredQuoteTokenException,
+    InvalidQuoteTokenException,
+    RedeemedQuoteTokenException,
+)
+from transactions.models import Transaction
+
+QUOTE_TOKEN_SALT = "transactions.quote"
+
+
+def get_quote_window(now: datetime | None = None) -> tuple[datetime, datetime]:
+    """
+    Get the window quotes are issued in: every quote of a window carries the same
+    expiry, so the response of a quote can be cached until the window ends
+    Params:
+        now: The time inside the window, defaults to now
+    Returns: The start and the end of the window
+    """
+    now = now or timezone.now()
+    window = settings.EXCHANGERATES_QUOTE_CACHE_MAX_AGE
+    start = int(now.timestamp()) // window * window
+    return (
+        datetime.fromtimestamp(start, tz=now.tzinfo),
+        datetime.fromtimestamp(start + window, tz=now.tzinfo),
+    )
+
+
+def issue_quote_token(
+    user_id: UUID, snapshot_id: UUID, quote: dict, now: datetime | None = None
+) -> tuple[str, datetime]:
+    """
+    Sign a quote so it can be redeemed by its user while it is valid
+    Params:
+        user_id: The id of the user the quote is issued to
+        snapshot_id: The id of the snapshot the quote was converted with
+        quote: The currencies, amounts and exchange rate of the quote
+        now: The time the quote is issued at, defaults to now
+    Returns: The quote token and the time it expires at
+    """
+    window_start, _ = get_quote_window(now)
+    expires_at = window_start.timestamp() + settings.EXCHANGERATES_QUOTE_TTL
+    payload = {
+        # Stored on the transaction that redeems the quote
+        "quote_id": str(uuid4()),
+        "user_id": str(user_id),
+        "snapshot_id": str(snapshot_id),
+        "source_currency": quote["source_currency"],
+        "target_currency": quote["target_currency"],
+        "source_amount": str(quote["source_amount"]),
+        "converted_amount": str(quote["converted_amount"]),
+        "exchange_rate": str(quote["exchange_rate"]),
+        "expires_at": expires_at,
+    }
+    token = signing.dumps(payload, salt=QUOTE_TOKEN_SALT, compress=True)
+    return token, datetime.fromtimestamp(expires_at, tz=window_start.tzinfo)
+
+
+def redeem_quote_token(token: str, user_id: UUID, check_redeemed: bool = True) -> dict:
+    """
+    Read a quote token issued to the user
+    Params:
+        token: The quote token
+        user_id: The id of the user redeeming it
+        check_redeemed: Whether a quote already redeemed is rejected, False when the
+        caller checks many quotes at once
+    Returns: The id, currencies, amounts and exchange rate of the quote
+    """
+    try:
+        payload = signing.loads(token, salt=QUOTE_TOKEN_SALT)
+    except signing.BadSignature:
+        raise InvalidQuoteTokenException()
+    if payload["user_id"] != str(user_id):
+        raise InvalidQuoteTokenException()
+    if payload["expires_at"] < timezone.now().timestamp():
+        raise ExpiredQuoteTokenException()
+
+    if check_redeemed and is_quote_redeemed(payload["quote_id"]):
+        raise RedeemedQuoteTokenException()
+
+    return {
+        "quote_id": UUID(payload["quote_id"]),
+        "snapshot_id": UUID(payload["snapshot_id"]),
+        "source_currency": payload["source_currency"],
+        "target_currency": payload["target_currency"],
+        "source_amount": Decimal(payload["source_amount"]),
+        "converted_amount": Decimal(payload["converted_amount"]),
+        "exchange_rate": Decimal(payload["exchange_rate"]),
+    }
+
+
+def is_quote_redeemed(quote_id: str) -> bool:
+    """
+    Check if a transaction was already created from a quote, the unique quote id of
+    the transactions rejects the quotes redeemed concurrently
+    """
+    return Transaction.objects.filter(quote_id=quote_id).exists()
+
+
+def get_redeemed_quote_ids(quote_ids: list[UUID]) -> set[UUID]:
+    """
+    Get which of some quotes were already redeemed, with a single query
+    Params:
+        quote_ids: The ids of the quotes
+    Returns: The ids of the quotes a transaction was created from
+    """
+    return set(
+        Transaction.objects.filter(quote_id__in=quote_ids).values_list(
+            "quote_id", flat=True
+        )
+    )
+
+
+def get_quote_etag(snapshot_id: UUID, window_start: datetime, *parts) -> str:
+    """
+    Get the ETag of a quote response, the same while the snapshot, the quote window and
+    the other parts the response depends on do not change
+    """
+    digest = make_etag(*parts)[:16]
+    return f'"{snapshot_id}-{int(window_start.timestamp())}-{digest}"'
@@ -0,0 +1,184 @@
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from django.conf import settings
+
+from core.utils.metrics.registry import metrics
+from transactions.exceptions.exchangerate import HistoricalRateNotFoundException
+from transactions.models import HistoricalExchangeRate
+from transactions.services.cross_rates import AMOUNT_EXPONENT, RATE_EXPONENT
+
+
+class PairRates:
+    """
+    Timestamps of the snapshots of a currency pair as a sorted array of epoch seconds,
+    next to the rate of each one. Once an index published it, it is only read, a sync
+    changes a copy.
+    """
+
+    def __init__(self):
+        self.timestamps = array("d")
+        self.rates: list[Decimal] = []
+
+    def copy(self) -> "PairRates":
+        pair = PairRates()
+        pair.timestamps = array("d", self.timestamps)
+        pair.rates = list(self.rates)
+        return pair
+
+    def add(self, timestamp: float, rate: Decimal) -> bool:
+        """
+        Add the rate of a snapshot unless its timestamp is already loaded
+        Returns: Whether the rate was added
+        """
+        if not self.timestamps or timestamp > self.timestamps[-1]:
+            self.timestamps.append(timestamp)
+            self.rates.append(rate)
+            return True
+
+        # Rows backfilled after newer ones were loaded, or read again by an overlap
+        index = bisect_left(self.timestamps, timestamp)
+        if index < len(self.timestamps) and self.timestamps[index] == timestamp:
+            return False
+        self.timestamps.insert(index, timestamp)
+        self.rates.insert(index, rate)
+        return True
+
+    def get(self, timestamp: float) -> tuple[float, Decimal] | None:
+        index = bisect_right(self.timestamps, timestamp) - 1
+        if index < 0:
+            return None
+        return self.timestamps[index], self.rates[index]
+
+
+class HistoricalRateIndex:
+    """
+    In-memory index of the rate history, loaded from the database on the first lookup
+    and then polled for the rows stored since, so a lookup is a binary search without
+    any query.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._pairs: dict[tuple[str, str], PairRates] = {}
+            self._loaded_until: datetime | None = None
+            self._latest_timestamp = float("-inf")
+            self._synced_at: float | None = None
+
+    def sync(self) -> None:
+        """
+        Load the rows stored since the last sync
+        """
+        with self._lock:
+            rows = HistoricalExchangeRate.objects.order_by("created")
+            if self._loaded_until is not None:
+                # Rows stamped before the latest loaded one can commit after it was
+                # read, so the last EXCHANGERATES_RATE_INDEX_SYNC_OVERLAP seconds are
+                # read again and the rows already loaded skipped
+                rows = rows.filter(
+                    created__gte=self._loaded_until
+                    - timedelta(seconds=settings.EXCHANGERATES_RATE_INDEX_SYNC_OVERLAP)
+                )
+
+            rows = rows.values_list(
+                "base_currency", "quote_currency", "timestamp", "rate", "created"
+            ).iterator(chunk_size=settings.EXCHANGERATES_HISTORY_CHUNK_SIZE)
+
+            # Lookups run without the lock, so the pairs they can read are never
+            # changed: the changed pairs are copies published with a single assignment
+            changed: dict[tuple[str, str], PairRates] = {}
+            latest_timestamp = self._latest_timestamp
+            loaded = 0
+            for base_currency, quote_currency, timestamp, rate, created in rows:
+                key = (base_currency, quote_currency)
+                pair = changed.get(key)
+                if pair is None:
+                    pair = changed[key] = self._pairs.get(key, PairRates()).copy()
+                self._loaded_until = created
+                if not pair.add(timestamp.timestamp(), rate):
+                    continue
+                latest_timestamp = max(latest_timestamp, timestamp.timestamp())
+                loaded += 1
+
+            if changed:
+                self._pairs = {**self._pairs, **changed}
+            self._latest_timestamp = latest_timestamp
+            self._synced_at = time.monotonic()
+        metrics.increment("rate_index.syncs")
+        metrics.increment("rate_index.rows_loaded", loaded)
+
+    def get_rate(
+        self, base_currency: str, quote_currency: str, at: datetime
+    ) -> tuple[datetime, Decimal]:
+        """
+        Get the rate of a pair from the snapshot in effect at a given time
+        Params:
+            base_currency: The currency the rate is relative to
+            quote_currency: The currency that is priced
+            at: The time the rate was in effect
+        Returns: The time of the snapshot and its rate
+        """
+        if self._needs_sync(at):
+            self.sync()
+
+        if base_currency == quote_currency:
+            return at, Decimal(1).quantize(RATE_EXPONENT)
+
+        pair = self._pairs.get((base_currency, quote_currency))
+        found = pair.get(at.timestamp()) if pair is not None else None
+        if found is None:
+            raise HistoricalRateNotFoundException()
+
+        timestamp, rate = found
+        snapshot_time = datetime.fromtimestamp(timestamp, tz=at.tzinfo)
+        # A snapshot is not in effect anymore once it left its freshness window
+        if at - snapshot_time > timedelta(
+            seconds=settings.EXCHANGERATES_SNAPSHOT_MAX_AGE
+        ):
+            raise HistoricalRateNotFoundException()
+        return snapshot_time, rate
+
+    def convert(
+        self,
+        source_currency: str,
+        target_currency: str,
+        source_amount: Decimal,
+        at: datetime,
+    ) -> tuple[Decimal, Decimal, datetime]:
+        """
+        Convert an amount with the rate in effect at a given time
+        Params:
+            source_currency: The currency of the amount
+            target_currency: The currency the amount is converted to
+            source_amount: The amount that is going to be converted
+            at: The time of the conversion
+        Returns: The converted amount, the exchange rate used and the snapshot time
+        """
+        snapshot_time, exchange_rate = self.get_rate(source_currency, target_currency, at)
+        return (
+            (source_amount * exchange_rate).quantize(AMOUNT_EXPONENT),
+            exchange_rate,
+            snapshot_time,
+        )
+
+    def _needs_sync(self, at: datetime) -> bool:
+        if self._synced_at is None:
+            return True
+        # Lookups before the latest loaded snapshot are already answered by the index
+        if at.timestamp() <= self._latest_timestamp:
+            return False
+        return (
+            time.monotonic() - self._synced_at
+            >= settings.EXCHANGERATES_RATE_INDEX_SYNC_INTERVAL
+        )
+
+
+rate_index = HistoricalRateIndex()
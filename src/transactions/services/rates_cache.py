@@ -0,0 +1,111 @@
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+from core.utils.locks.single_flight import SingleFlight
+from core.utils.metrics.registry import metrics
+from transactions.models import ExchangeRateSnapshot
+
+logger = logging.getLogger(__name__)
+
+
+class ExchangeRatesCache:
+    """
+    Shared cache holding the latest ExchangeRateSnapshot of each base currency.
+    Fresh entries are served from the cache, stale ones keep being served while a
+    single background reload replaces them with the latest stored snapshot.
+    """
+
+    CACHE_KEY = "exchangerates:snapshot:{base_currency}"
+    RELOAD_LOCK_KEY = "exchangerates:reload-lock:{base_currency}"
+    RELOAD_LOCK_TIMEOUT = 60
+
+    _reload_flight = SingleFlight("exchangerates.reload")
+
+    @classmethod
+    def get_snapshot(cls, base_currency: str = "EUR") -> ExchangeRateSnapshot | None:
+        """
+        Get the cached snapshot, reading the database only on a cold cache
+        Params:
+            base_currency: The currency the rates are relative to
+        Returns: The latest snapshot or None if no snapshot was stored yet
+        """
+        entry = cache.get(cls.CACHE_KEY.format(base_currency=base_currency))
+        if entry is None:
+            metrics.increment("exchangerates.cache.miss")
+            snapshot = cls.reload(base_currency)
+        elif time.time() - entry["cached_at"] < settings.EXCHANGERATES_CACHE_TTL:
+            metrics.increment("exchangerates.cache.hit")
+            snapshot = entry["snapshot"]
+        else:
+            metrics.increment("exchangerates.cache.stale")
+            cls._reload_in_background(base_currency)
+            snapshot = entry["snapshot"]
+
+        if snapshot is not None:
+            metrics.gauge("exchangerates.cache.snapshot_age", snapshot.age)
+        return snapshot
+
+    @classmethod
+    def set_snapshot(cls, snapshot: ExchangeRateSnapshot) -> None:
+        """
+        Store the snapshot as the cached one of its base currency
+        Params:
+            snapshot: The snapshot that is going to be served
+        """
+        cache.set(
+            cls.CACHE_KEY.format(base_currency=snapshot.base_currency),
+            {"snapshot": snapshot, "cached_at": time.time()},
+            timeout=settings.EXCHANGERATES_CACHE_TTL
+            + settings.EXCHANGERATES_CACHE_STALE_TTL,
+        )
+
+    @classmethod
+    def reload(cls, base_currency: str = "EUR") -> ExchangeRateSnapshot | None:
+        """
+        Cache the latest snapshot stored in the database, concurrent callers of this
+        process share a single query
+        Params:
+            base_currency: The currency the rates are relative to
+        Returns: The latest snapshot or None if no snapshot was stored yet
+        """
+        return cls._reload_flight.do(
+            base_currency,
+            lambda: cls._load(base_currency),
+            timeout=settings.EXCHANGERATES_SINGLE_FLIGHT_TIMEOUT,
+        )
+
+    @classmethod
+    def _load(cls, base_currency: str) -> ExchangeRateSnapshot | None:
+        snapshot = ExchangeRateSnapshot.objects.get_latest(base_currency)
+        if snapshot is not None:
+            cls.set_snapshot(snapshot)
+        return snapshot
+
+    @classmethod
+    def _reload_in_background(cls, base_currency: str) -> None:
+        """
+        Start a reload unless any worker sharing the cache is already running one
+        Params:
+            base_currency: The currency the rates are relative to
+        """
+        lock_key = cls.RELOAD_LOCK_KEY.format(base_currency=base_currency)
+        if not cache.add(lock_key, True, timeout=cls.RELOAD_LOCK_TIMEOUT):
+            return
+
+        threading.Thread(target=cls._reload, args=(base_currency,), daemon=True).start()
+
+    @classmethod
+    def _reload(cls, base_currency: str) -> None:
+        try:
+            cls.reload(base_currency)
+        except Exception:
+            # Callers keep getting the stale snapshot until a reload succeeds
+            logger.exception("Could not reload the %s exchange rates", base_currency)
+        finally:
+            cache.delete(cls.RELOAD_LOCK_KEY.format(base_currency=base_currency))
+            connections.close_all()
@@ -0,0 +1,58 @@
+from contextlib import nullcontext
+
+from django.conf import settings
+from django.db import transaction
+
+from core.utils.locks.cache_lock import cache_lock
+from transactions.exceptions.exchangerate import ExchangeRatesUnavailableException
+from transactions.models import ExchangeRateSnapshot
+from transactions.services.history import record_exchange_rate_history
+from transactions.services.providers.rate_source import get_rate_source
+from transactions.services.rates_cache import ExchangeRatesCache
+
+REFRESH_LOCK_KEY = "exchangerates:refresh-lock:{base_currency}"
+
+
+def refresh_exchange_rate_snapshot(
+    base_currency: str = "EUR",
+) -> ExchangeRateSnapshot | None:
+    """
+    Fetch the rates from the first provider that answers and store them as the latest
+    snapshot and in the rate history
+    Params:
+        base_currency: The currency the rates are relative to
+    Returns: The stored snapshot or None if another process is already refreshing
+    """
+    lock = (
+        cache_lock(
+            REFRESH_LOCK_KEY.format(base_currency=base_currency),
+            timeout=int(settings.EXCHANGERATES_API_RETRY_BUDGET * 2),
+        )
+        if settings.EXCHANGERATES_REFRESH_LOCK
+        else nullcontext(True)
+    )
+    with lock as acquired:
+        if not acquired:
+            return None
+
+        provider, rates = get_rate_source().get_rates(base_currency)
+        with transaction.atomic():
+            snapshot = ExchangeRateSnapshot.objects.create(
+                base_currency=base_currency, rates=rates, provider=provider
+            )
+            record_exchange_rate_history(snapshot)
+    ExchangeRatesCache.set_snapshot(snapshot)
+    return snapshot
+
+
+def get_latest_exchange_rate_snapshot(base_currency: str = "EUR") -> ExchangeRateSnapshot:
+    """
+    Get the latest snapshot without reaching the rates provider
+    Params:
+        base_currency: The currency the rates are relative to
+    Returns: The latest snapshot still inside its freshness window
+    """
+    snapshot = ExchangeRatesCache.get_snapshot(base_currency)
+    if snapshot is None or not snapshot.is_fresh:
+        raise ExchangeRatesUnavailableException()
+    return snapshot
@@ -0,0 +1,130 @@
+from collections import defaultdict
+from datetime import date
+from datetime import timezone as dt_timezone
+from decimal import Decimal
+from typing import Iterable
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from transactions.models import DailyTransactionSummary, Transaction
+
+SummaryKey = tuple[object, str, str, date]
+
+
+def get_summary_day(created) -> date:
+    """
+    Get the day a transaction is summarized in, days are counted in UTC
+    Params:
+        created: The creation time of the transaction
+    Returns: The UTC day of the creation time
+    """
+    return created.astimezone(dt_timezone.utc).date()
+
+
+def add_to_daily_summaries(rows: Iterable[Transaction], sign: int = 1) -> None:
+    """
+    Change the summaries of the days of some transactions, it must run in the
+    transaction that changed the rows
+    Params:
+        rows: The inserted or deleted transactions
+        sign: 1 when the transactions were inserted, -1 when they were deleted
+    """
+    totals: dict[SummaryKey, list] = defaultdict(lambda: [0, Decimal(0), Decimal(0)])
+    for row in rows:
+        total = totals[
+            (
+                row.user_id,
+                row.source_currency,
+                row.target_currency,
+                get_summary_day(row.created),
+            )
+        ]
+        total[0] += sign
+        total[1] += sign * row.source_amount
+        total[2] += sign * row.converted_amount
+
+    # Always in the same order, so concurrent transactions lock the rows in turn
+    for key in sorted(totals, key=lambda key: (str(key[0]), *key[1:])):
+        _add_to_daily_summary(key, *totals[key])
+
+
+def _add_to_daily_summary(
+    key: SummaryKey, count: int, source_amount: Decimal, converted_amount: Decimal
+) -> None:
+    user_id, source_currency, target_currency, day = key
+    summaries = DailyTransactionSummary.objects.filter(
+        user_id=user_id,
+        source_currency=source_currency,
+        target_currency=target_currency,
+        day=day,
+    )
+    changes = {
+        "count": F("count") + count,
+        "source_amount": F("source_amount") + source_amount,
+        "converted_amount": F("converted_amount") + converted_amount,
+        "modified": timezone.now(),
+    }
+    if summaries.update(**changes) or count < 0:
+        # A day without summary is not summarized yet, rebuild_daily_summaries does it
+        return
+
+    try:
+        with transaction.atomic():
+            DailyTransactionSummary.objects.create(
+                user_id=user_id,
+                source_currency=source_currency,
+                target_currency=target_currency,
+                day=day,
+                count=count,
+                source_amount=source_amount,
+                converted_amount=converted_amount,
+            )
+    except IntegrityError:
+        # Another transaction created the summary first
+        summaries.update(**changes)
+
+
+def rebuild_daily_summaries(user_id=None, batch_size: int = 1000) -> int:
+    """
+    Replace the daily summaries with the totals computed from the transactions
+    Params:
+        user_id: The id of the user whose summaries are rebuilt, every user when None
+        batch_size: The number of summaries inserted by each query
+    Returns: The number of summaries created
+    """
+    transactions = Transaction.objects.order_by()
+    summaries = DailyTransactionSummary.objects.all()
+    if user_id is not None:
+        transactions = transactions.filter(user_id=user_id)
+        summaries = summaries.filter(user_id=user_id)
+
+    totals = (
+        transactions.annotate(day=TruncDate("created", tzinfo=dt_timezone.utc))
+        .values("user_id", "source_currency", "target_currency", "day")
+        .annotate(
+            total_count=Count("id"),
+            total_source_amount=Sum("source_amount"),
+            total_converted_amount=Sum("converted_amount"),
+        )
+    )
+    with transaction.atomic():
+        summaries.delete()
+        created = DailyTransactionSummary.objects.bulk_create(
+            (
+                DailyTransactionSummary(
+                    user_id=row["user_id"],
+                    source_currency=row["source_currency"],
+                    target_currency=row["target_currency"],
+                    day=row["day"],
+                    count=row["total_count"],
+                    source_amount=row["total_source_amount"],
+                    converted_amount=row["total_converted_amount"],
+                )
+                for row in totals.iterator(chunk_size=batch_size)
+            ),
+            batch_size=batch_size,
+        )
+    return len(created)
@@ -0,0 +1,72 @@
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+
+from transactions.models import Transaction, UserTransactionCounter
+from transactions.services.bookkeeping import (
+    bulk_create_transactions,
+    create_transaction,
+    delete_transactions,
+    get_transaction_count,
+)
+
+
+def build_transaction(user, **fields):
+    return Transaction(
+        user=user,
+        source_currency="EUR",
+        target_currency="USD",
+        source_amount=Decimal("1.00"),
+        converted_amount=Decimal("1.08"),
+        exchange_rate=Decimal("1.08"),
+        **fields,
+    )
+
+
+@pytest.fixture
+def transaction_data(user_1):
+    return {
+        "user": user_1,
+        "source_currency": "EUR",
+        "target_currency": "USD",
+        "source_amount": Decimal("1.00"),
+        "converted_amount": Decimal("1.08"),
+        "exchange_rate": Decimal("1.08"),
+    }
+
+
+def test_counter_follows_inserts_and_deletes(user_1, user_factory, transaction_data):
+    """Check if the counter is updated by every insert and delete"""
+    user_2 = user_factory()
+    create_transaction(**transaction_data)
+    bulk_create_transactions([build_transaction(user_1), build_transaction(user_2)])
+
+    assert get_transaction_count(user_1.id) == 2
+    assert get_transaction_count(user_2.id) == 1
+
+    assert delete_transactions(Transaction.objects.filter(user=user_1)) == 2
+    assert get_transaction_count(user_1.id) == 0
+    assert get_transaction_count(user_2.id) == 1
+
+
+def test_missing_counter_starts_from_the_real_count(user_1, transaction_data):
+    """Check if a user without counter gets one with all of its transactions"""
+    Transaction.objects.create(**transaction_data)
+    assert get_transaction_count(user_1.id) is None
+
+    create_transaction(**transaction_data)
+
+    assert get_transaction_count(user_1.id) == 2
+
+
+def test_reconcile_repairs_drifted_counters(user_1, transaction_data):
+    """Check if the reconciliation command sets the drifted counters to the real count"""
+    create_transaction(**transaction_data)
+    UserTransactionCounter.objects.filter(user=user_1).update(count=10)
+
+    call_command("reconcile_transaction_counters", "--dry-run")
+    assert get_transaction_count(user_1.id) == 10
+
+    call_command("reconcile_transaction_counters")
+    assert get_transaction_count(user_1.id) == 1
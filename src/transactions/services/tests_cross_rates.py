@@ -0,0 +1,56 @@
+from decimal import Decimal
+
+import pytest
+
+from transactions.exceptions.exchangerate import ExchangeRatesUnavailableException
+from transactions.models import ExchangeRateSnapshot
+from transactions.services.cross_rates import CrossRateMatrix
+
+
+def test_matrix_has_every_pair_and_inverse(rates):
+    """Check if every pair of supported currencies is compiled with its inverse"""
+    matrix = CrossRateMatrix.from_rates(rates)
+
+    assert len(matrix.rates) == 16
+    assert matrix.get_rate("USD", "USD") == Decimal("1.000000")
+    assert matrix.get_rate("EUR", "BRL") == Decimal("5.800000")
+    assert matrix.get_rate("BRL", "EUR") == Decimal("0.172414")
+    assert matrix.get_rate("USD", "BRL") == Decimal("5.370370")
+    assert matrix.get_rate("BRL", "USD") == Decimal("0.186207")
+
+
+def test_matrix_is_immutable(rates):
+    """Check if a compiled matrix cannot be changed"""
+    matrix = CrossRateMatrix.from_rates(rates)
+
+    with pytest.raises(TypeError):
+        matrix.rates[("USD", "BRL")] = Decimal(1)
+
+
+def test_convert_quantizes_to_the_stored_precision(rates):
+    """Check if the converted amount is the amount times the quantized rate"""
+    matrix = CrossRateMatrix.from_rates(rates)
+
+    assert matrix.convert("USD", "JPY", Decimal("10.00")) == (
+        Decimal("1578.70"),
+        Decimal("157.870370"),
+    )
+
+
+def test_convert_currency_missing_from_the_snapshot(rates):
+    """Check if a currency the provider did not return cannot be converted"""
+    del rates["JPY"]
+    matrix = CrossRateMatrix.from_rates(rates)
+
+    with pytest.raises(ExchangeRatesUnavailableException):
+        matrix.convert("USD", "JPY", Decimal("10.00"))
+
+
+def test_matrix_is_compiled_once_per_snapshot(db, rates):
+    """Check if the matrix of a snapshot is reused"""
+    snapshot = ExchangeRateSnapshot.objects.create(rates=rates)
+
+    matrix = CrossRateMatrix.for_snapshot(snapshot)
+
+    assert CrossRateMatrix.for_snapshot(snapshot) is matrix
+    assert matrix.snapshot_id == snapshot.id
@@ -0,0 +1,89 @@
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from core.utils.metrics.registry import metrics
+from transactions.exceptions.exchangerate import ExchangeRatesAPIException
+from transactions.services.exchangerate import ExchangeRatesAPI
+
+
+def make_response(status_code=200, data=None):
+    response = Mock(status_code=status_code)
+    response.json.return_value = data or {}
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            response=response
+        )
+    return response
+
+
+@pytest.fixture
+def session_get(db, mocker):
+    mocker.patch("transactions.services.http.time.sleep")
+    return mocker.patch.object(ExchangeRatesAPI.http.get_session(), "get")
+
+
+def test_session_is_reused_between_calls():
+    """Check if every call of the process uses the same pooled session"""
+    assert ExchangeRatesAPI.http.get_session() is ExchangeRatesAPI.http.get_session()
+
+
+def test_get_exchange_rates_uses_timeouts(session_get, rates, settings):
+    """Check if the provider is called with connect and read timeouts"""
+    session_get.return_value = make_response(data={"rates": rates})
+
+    assert ExchangeRatesAPI.get_exchange_rates() == rates
+
+    assert session_get.call_args.kwargs["timeout"] == (
+        settings.EXCHANGERATES_API_CONNECT_TIMEOUT,
+        settings.EXCHANGERATES_API_READ_TIMEOUT,
+    )
+    assert metrics.as_dict()["timings"]["exchangerates.api.attempt_latency"]["count"] == 1
+
+
+def test_get_exchange_rates_retries_timeouts(session_get, rates):
+    """Check if timeouts and retryable statuses are retried"""
+    session_get.side_effect = [
+        requests.exceptions.ReadTimeout(),
+        make_response(status_code=503),
+        make_response(data={"rates": rates}),
+    ]
+
+    assert ExchangeRatesAPI.get_exchange_rates() == rates
+
+    assert session_get.call_count == 3
+    assert metrics.get_counter("exchangerates.api.retries") == 2
+    # The request that timed out never reached the provider quota
+    assert ExchangeRatesAPI.quota_planner.get_state().calls == 2
+
+
+def test_get_exchange_rates_stops_after_max_retries(session_get, settings):
+    """Check if the retries are bounded"""
+    session_get.side_effect = requests.exceptions.ConnectTimeout()
+
+    with pytest.raises(ExchangeRatesAPIException):
+        ExchangeRatesAPI.get_exchange_rates()
+
+    assert session_get.call_count == settings.EXCHANGERATES_API_MAX_RETRIES + 1
+
+
+def test_get_exchange_rates_stops_when_budget_is_spent(session_get, settings):
+    """Check if no attempt is started after the retry budget is spent"""
+    settings.EXCHANGERATES_API_RETRY_BUDGET = 0
+    session_get.side_effect = requests.exceptions.ConnectTimeout()
+
+    with pytest.raises(ExchangeRatesAPIException):
+        ExchangeRatesAPI.get_exchange_rates()
+
+    assert session_get.call_count == 1
+
+
+def test_get_exchange_rates_does_not_retry_client_errors(session_get):
+    """Check if a client error fails without being retried"""
+    session_get.return_value = make_response(status_code=401)
+
+    with pytest.raises(ExchangeRatesAPIException):
+        ExchangeRatesAPI.get_exchange_rates()
+
+    assert session_get.call_count == 1
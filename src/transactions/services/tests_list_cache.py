@@ -0,0 +1,48 @@
+import time
+
+from transactions.services.list_cache import TransactionListCache
+
+
+def test_generation_starts_from_the_current_time(user_1):
+    """Check if a new generation never reuses the one of an evicted key"""
+    before = time.time_ns()
+
+    generation = TransactionListCache.get_generation(user_1.id)
+
+    assert generation >= before
+    assert TransactionListCache.get_generation(user_1.id) == generation
+
+
+def test_generation_is_bumped_on_commit(user_1, django_capture_on_commit_callbacks):
+    """Check if the pages are invalidated only once the write is committed"""
+    generation = TransactionListCache.get_generation(user_1.id)
+    TransactionListCache.set_page(user_1.id, generation, "/page", {"data": []})
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        TransactionListCache.bump_generation(user_1.id)
+        assert TransactionListCache.get_generation(user_1.id) == generation
+
+    assert len(callbacks) == 1
+    new_generation = TransactionListCache.get_generation(user_1.id)
+    assert new_generation == generation + 1
+    assert TransactionListCache.get_page(user_1.id, new_generation, "/page") is None
+    assert TransactionListCache.get_page(user_1.id, generation, "/page") == {"data": []}
+
+
+def test_cache_alias_is_configurable(user_1, settings):
+    """Check if the pages are stored in the configured cache"""
+    settings.CACHES = {
+        **settings.CACHES,
+        "transactions": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "transactions",
+        },
+    }
+    settings.TRANSACTIONS_LIST_CACHE_ALIAS = "transactions"
+
+    generation = TransactionListCache.get_generation(user_1.id)
+    TransactionListCache.set_page(user_1.id, generation, "/page", {"data": []})
+
+    assert TransactionListCache.get_page(user_1.id, generation, "/page") == {"data": []}
+    settings.TRANSACTIONS_LIST_CACHE_ALIAS = "default"
+    assert TransactionListCache.get_page(user_1.id, generation, "/page") is None
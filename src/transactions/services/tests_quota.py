@@ -0,0 +1,98 @@
+from datetime import datetime, timezone
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.urls import reverse
+from rest_framework import status
+
+from transactions.models import ProviderQuotaUsage
+from transactions.services.quota import QuotaPlanner
+
+MID_PERIOD = datetime(2024, 6, 16, tzinfo=timezone.utc)
+
+
+def make_planner(calls=0, quota=250, reserve=10, billing_day=1):
+    planner = QuotaPlanner("test", quota=quota, reserve=reserve, billing_day=billing_day)
+    ProviderQuotaUsage.objects.create(
+        provider="test",
+        period_start=planner.get_period(MID_PERIOD)[0].date(),
+        calls=calls,
+    )
+    return planner
+
+
+def test_period_follows_the_billing_day():
+    """Check if the billing period starts on the billing day"""
+    planner = QuotaPlanner("test", billing_day=20)
+
+    assert planner.get_period(datetime(2024, 1, 5, tzinfo=timezone.utc)) == (
+        datetime(2023, 12, 20, tzinfo=timezone.utc),
+        datetime(2024, 1, 20, tzinfo=timezone.utc),
+    )
+
+
+@pytest.mark.parametrize("billing_day", [29, 31, -1])
+def test_billing_day_must_be_in_every_month(billing_day, settings):
+    """Check if a billing day some months do not have is refused"""
+    settings.EXCHANGERATES_BILLING_DAY = billing_day
+
+    with pytest.raises(ImproperlyConfigured):
+        QuotaPlanner("test")
+
+
+def test_record_call_counts_calls_per_period(db):
+    """Check if calls are counted in the period they were made"""
+    planner = QuotaPlanner("test")
+
+    planner.record_call(MID_PERIOD)
+    planner.record_call(MID_PERIOD)
+    planner.record_call(datetime(2024, 7, 1, tzinfo=timezone.utc))
+
+    assert planner.get_state(MID_PERIOD).calls == 2
+
+
+def test_state_projects_the_end_of_period_balance(db):
+    """Check if the projection extrapolates the calls made so far"""
+    state = make_planner(calls=150).get_state(MID_PERIOD)
+
+    assert state.remaining_calls == 100
+    assert state.projected_calls == 300
+    assert state.projected_balance == -50
+    assert state.ahead_of_budget
+
+
+def test_refresh_interval_spreads_the_calls_left(db):
+    """Check if the calls left outside the reserve are spread over the time left"""
+    planner = make_planner(calls=100)
+
+    # 15 days left for 250 - 100 - 10 calls
+    assert planner.get_refresh_interval(now=MID_PERIOD) == 15 * 24 * 60 * 60 / 140
+    assert planner.get_refresh_interval(minimum=86400, now=MID_PERIOD) == 86400
+
+
+def test_non_essential_refresh_is_deferred_when_ahead_of_budget(db):
+    """Check if only essential refreshes are made when ahead of budget"""
+    planner = make_planner(calls=150)
+
+    assert not planner.should_refresh(now=MID_PERIOD)
+    assert planner.should_refresh(essential=True, now=MID_PERIOD)
+
+
+def test_refresh_is_made_when_behind_budget(db):
+    """Check if refreshes are made while the usage is under the pro-rata budget"""
+    assert make_planner(calls=100).should_refresh(now=MID_PERIOD)
+
+
+def test_no_refresh_once_the_quota_is_spent(db):
+    """Check if even essential refreshes are refused without calls left"""
+    assert not make_planner(calls=250).should_refresh(essential=True, now=MID_PERIOD)
+
+
+def test_quota_endpoint_is_restricted_to_admins(client, user_1_token):
+    """Check if regular users cannot see the quota state"""
+    response = client.get(
+        reverse("transactions:get-exchange-rates-quota"),
+        HTTP_AUTHORIZATION=f"Bearer {user_1_token}",
+    )
+
+    assert response.status_code == status.HTTP_403_FORBIDDEN
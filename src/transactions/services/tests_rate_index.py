@@ -0,0 +1,115 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from freezegun import freeze_time
+
+from transactions.exceptions.exchangerate import HistoricalRateNotFoundException
+from transactions.models import ExchangeRateSnapshot, HistoricalExchangeRate
+from transactions.services.history import record_exchange_rate_history
+from transactions.services.rate_index import HistoricalRateIndex
+
+
+def at(day, hour=12):
+    return datetime(2024, 1, day, hour, tzinfo=timezone.utc)
+
+
+def store_snapshot(time, rates, usd_rate):
+    with freeze_time(time):
+        snapshot = ExchangeRateSnapshot.objects.create(rates={**rates, "USD": usd_rate})
+        record_exchange_rate_history(snapshot)
+    return snapshot
+
+
+@pytest.fixture
+def history(db, rates):
+    store_snapshot(at(1), rates, 1.08)
+    store_snapshot(at(2), rates, 1.1)
+
+
+def test_rate_in_effect_at_a_time(history):
+    """Check if the latest snapshot taken before the time is used"""
+    index = HistoricalRateIndex()
+
+    assert index.get_rate("EUR", "USD", at(1)) == (at(1), Decimal("1.080000"))
+    assert index.get_rate("EUR", "USD", at(2, 11)) == (at(1), Decimal("1.080000"))
+    assert index.get_rate("EUR", "USD", at(2, 13)) == (at(2), Decimal("1.100000"))
+
+
+def test_lookups_do_not_query_the_database(history):
+    """Check if the history is loaded once and then answered from memory"""
+    index = HistoricalRateIndex()
+    index.get_rate("EUR", "USD", at(1))
+
+    with CaptureQueriesContext(connection) as queries:
+        index.get_rate("USD", "BRL", at(2))
+        index.get_rate("EUR", "JPY", at(1, 15))
+    assert len(queries) == 0
+
+
+def test_new_snapshots_are_loaded_incrementally(history, rates, settings):
+    """Check if the index polls only the rows stored since the last sync"""
+    settings.EXCHANGERATES_RATE_INDEX_SYNC_INTERVAL = 0
+    index = HistoricalRateIndex()
+    index.get_rate("EUR", "USD", at(2))
+
+    store_snapshot(at(3), rates, 1.2)
+
+    assert index.get_rate("EUR", "USD", at(3, 13)) == (at(3), Decimal("1.200000"))
+    assert len(index._pairs[("EUR", "USD")].timestamps) == 3
+
+
+def test_rows_committed_late_are_loaded_once(history, rates, settings):
+    """Check if a row stamped before the latest loaded one is still loaded, once"""
+    settings.EXCHANGERATES_RATE_INDEX_SYNC_INTERVAL = 0
+    index = HistoricalRateIndex()
+    index.get_rate("EUR", "USD", at(2))
+
+    # Stamped before the last sync read the latest row, committed after it
+    late = store_snapshot(at(3), rates, 1.2)
+    HistoricalExchangeRate.objects.filter(snapshot=late).update(
+        created=index._loaded_until
+    )
+    index.get_rate("EUR", "USD", at(3, 13))
+    index.sync()
+
+    assert index.get_rate("EUR", "USD", at(3, 13)) == (at(3), Decimal("1.200000"))
+    assert len(index._pairs[("EUR", "USD")].timestamps) == 3
+
+
+def test_sync_does_not_change_the_pairs_being_read(history, rates):
+    """Check if a sync publishes new pairs instead of changing the ones lookups read"""
+    index = HistoricalRateIndex()
+    index.get_rate("EUR", "USD", at(2))
+    pair = index._pairs[("EUR", "USD")]
+
+    store_snapshot(at(3), rates, 1.2)
+    index.sync()
+
+    assert len(pair.timestamps) == len(pair.rates) == 2
+    assert len(index._pairs[("EUR", "USD")].timestamps) == 3
+
+
+def test_rate_before_the_first_snapshot(history):
+    """Check if there is no rate before the history starts"""
+    with pytest.raises(HistoricalRateNotFoundException):
+        HistoricalRateIndex().get_rate("EUR", "USD", at(1, 11))
+
+
+def test_rate_after_the_snapshot_expired(history, settings):
+    """Check if a snapshot older than its freshness window is not in effect"""
+    settings.EXCHANGERATES_SNAPSHOT_MAX_AGE = 60 * 60
+
+    with pytest.raises(HistoricalRateNotFoundException):
+        HistoricalRateIndex().get_rate("EUR", "USD", at(2, 14))
+
+
+def test_convert_at_a_time(history):
+    """Check if an amount is converted with the rate in effect at the time"""
+    assert HistoricalRateIndex().convert("EUR", "USD", Decimal("10"), at(1, 18)) == (
+        Decimal("10.80"),
+        Decimal("1.080000"),
+        at(1),
+    )
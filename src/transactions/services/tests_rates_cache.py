@@ -0,0 +1,51 @@
+import pytest
+from freezegun import freeze_time
+
+from core.utils.metrics.registry import metrics
+from transactions.models import ExchangeRateSnapshot
+from transactions.services.rates_cache import ExchangeRatesCache
+
+
+@pytest.fixture
+def snapshot(db, rates):
+    return ExchangeRateSnapshot.objects.create(rates=rates)
+
+
+def test_cold_cache_reads_the_database_once(snapshot, django_assert_num_queries):
+    """Check if only the first call on a cold cache reads the latest snapshot"""
+    with django_assert_num_queries(1):
+        assert ExchangeRatesCache.get_snapshot() == snapshot
+        assert ExchangeRatesCache.get_snapshot() == snapshot
+
+    assert metrics.get_counter("exchangerates.cache.miss") == 1
+    assert metrics.get_counter("exchangerates.cache.hit") == 1
+
+
+def test_empty_database_returns_none(db):
+    """Check if no snapshot is returned before the first refresh"""
+    assert ExchangeRatesCache.get_snapshot() is None
+
+
+def test_stale_snapshot_is_served_while_reloading(snapshot, mocker, settings):
+    """Check if an expired entry is served and a single background reload starts"""
+    thread = mocker.patch("transactions.services.rates_cache.threading.Thread")
+
+    with freeze_time("2024-06-21 12:00:00") as frozen_time:
+        ExchangeRatesCache.set_snapshot(snapshot)
+        frozen_time.tick(settings.EXCHANGERATES_CACHE_TTL + 1)
+
+        assert ExchangeRatesCache.get_snapshot() == snapshot
+        assert ExchangeRatesCache.get_snapshot() == snapshot
+
+    thread.assert_called_once()
+    assert metrics.get_counter("exchangerates.cache.stale") == 2
+
+
+def test_reload_replaces_the_cached_snapshot(snapshot, rates):
+    """Check if a reload serves the newest stored snapshot"""
+    ExchangeRatesCache.set_snapshot(snapshot)
+    newest = ExchangeRateSnapshot.objects.create(rates={**rates, "BRL": 6.1})
+
+    ExchangeRatesCache._reload("EUR")
+
+    assert ExchangeRatesCache.get_snapshot() == newest
@@ -0,0 +1,60 @@
+import pytest
+
+from core.utils.locks.cache_lock import cache_lock
+from transactions.exceptions.exchangerate import ExchangeRatesUnavailableException
+from transactions.models import ExchangeRateSnapshot, HistoricalExchangeRate
+from transactions.services.rates_cache import ExchangeRatesCache
+from transactions.services.snapshots import (
+    REFRESH_LOCK_KEY,
+    get_latest_exchange_rate_snapshot,
+    refresh_exchange_rate_snapshot,
+)
+
+
+@pytest.fixture
+def get_rates(mocker, rates):
+    rate_source = mocker.patch("transactions.services.snapshots.get_rate_source")
+    rate_source.return_value.get_rates.return_value = ("open_er_api", rates)
+    return rate_source.return_value.get_rates
+
+
+def test_refresh_stores_and_caches_a_snapshot(db, get_rates, rates):
+    """Check if a refresh stores the fetched rates and serves them right away"""
+    snapshot = refresh_exchange_rate_snapshot()
+
+    assert snapshot.rates == rates
+    assert snapshot.provider == "open_er_api"
+    # Every pair of the 4 supported currencies is kept in the rate history
+    assert snapshot.historical_rates.count() == 12
+    assert (
+        HistoricalExchangeRate.objects.get(
+            base_currency="USD", quote_currency="EUR"
+        ).timestamp
+        == snapshot.created
+    )
+    assert ExchangeRateSnapshot.objects.get_latest() == snapshot
+    assert ExchangeRatesCache.get_snapshot() == snapshot
+    assert get_latest_exchange_rate_snapshot() == snapshot
+
+
+def test_refresh_is_skipped_while_another_process_refreshes(db, get_rates):
+    """Check if only the process holding the refresh lock reaches the provider"""
+    with cache_lock(REFRESH_LOCK_KEY.format(base_currency="EUR"), timeout=60):
+        assert refresh_exchange_rate_snapshot() is None
+
+    get_rates.assert_not_called()
+    assert not ExchangeRateSnapshot.objects.exists()
+
+
+def test_refresh_without_lock(db, get_rates, settings):
+    """Check if the refresh lock can be disabled"""
+    settings.EXCHANGERATES_REFRESH_LOCK = False
+
+    with cache_lock(REFRESH_LOCK_KEY.format(base_currency="EUR"), timeout=60):
+        assert refresh_exchange_rate_snapshot() is not None
+
+
+def test_latest_snapshot_is_unavailable_before_the_first_refresh(db):
+    """Check if converting without any snapshot fails"""
+    with pytest.raises(ExchangeRatesUnavailableException):
+        get_latest_exchange_rate_snapshot()
@@ -0,0 +1,91 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from freezegun import freeze_time
+
+from transactions.models import DailyTransactionSummary, Transaction
+from transactions.services.bookkeeping import (
+    bulk_create_transactions,
+    create_transaction,
+    delete_transactions,
+)
+
+
+def get_transaction_data(user, source_amount="1.00", target_currency="USD"):
+    return {
+        "user": user,
+        "source_currency": "EUR",
+        "target_currency": target_currency,
+        "source_amount": Decimal(source_amount),
+        "converted_amount": Decimal(source_amount) * 2,
+        "exchange_rate": Decimal(2),
+    }
+
+
+def build_transaction(user, **fields):
+    return Transaction(**get_transaction_data(user, **fields))
+
+
+def get_summaries(user):
+    return list(
+        DailyTransactionSummary.objects.filter(user=user).values_list(
+            "day", "target_currency", "count", "source_amount", "converted_amount"
+        )
+    )
+
+
+@freeze_time("2024-03-01 23:30:00")
+def test_summaries_follow_inserts_and_deletes(user_1):
+    """Check if the summaries are updated by every insert and delete"""
+    day = datetime(2024, 3, 1).date()
+    create_transaction(**get_transaction_data(user_1))
+    bulk_create_transactions(
+        [
+            build_transaction(user_1, source_amount="2.50"),
+            build_transaction(user_1, source_amount="4.00", target_currency="BRL"),
+        ]
+    )
+
+    assert get_summaries(user_1) == [
+        (day, "BRL", 1, Decimal("4.00"), Decimal("8.00")),
+        (day, "USD", 2, Decimal("3.50"), Decimal("7.00")),
+    ]
+
+    delete_transactions(Transaction.objects.filter(target_currency="USD"))
+
+    assert get_summaries(user_1)[1] == (day, "USD", 0, Decimal("0"), Decimal("0"))
+
+
+def test_summary_days_are_utc(user_1, settings):
+    """Check if a transaction is summarized in its UTC day"""
+    settings.TIME_ZONE = "America/Sao_Paulo"
+    with freeze_time(datetime(2024, 3, 2, 1, 0, tzinfo=timezone.utc)):
+        bulk_create_transactions([build_transaction(user_1)])
+
+    assert get_summaries(user_1)[0][0] == datetime(2024, 3, 2).date()
+
+
+@pytest.mark.django_db
+def test_rebuild_summaries(user_1, user_factory):
+    """Check if the rebuild command replaces the summaries with the real totals"""
+    user_2 = user_factory()
+    with freeze_time("2024-03-01"):
+        Transaction.objects.bulk_create(
+            [build_transaction(user_1), build_transaction(user_1, source_amount="3.00")]
+        )
+    with freeze_time("2024-03-02"):
+        bulk_create_transactions([build_transaction(user_2)])
+    DailyTransactionSummary.objects.filter(user=user_2).update(count=10)
+
+    call_command("rebuild_transaction_summaries", "--user", str(user_1.id))
+
+    assert get_summaries(user_1) == [
+        (datetime(2024, 3, 1).date(), "USD", 2, Decimal("4.00"), Decimal("8.00"))
+    ]
+    assert get_summaries(user_2)[0][2] == 10
+
+    call_command("rebuild_transaction_summaries")
+
+    assert get_summaries(user_2)[0][2] == 1
@@ -0,0 +1,79 @@
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+
+from transactions.models import DailyTransactionSummary, Transaction
+from transactions.services.bookkeeping import create_transaction, get_transaction_count
+
+
+def get_form_data(user, **fields):
+    return {
+        "user": str(user.id),
+        "source_currency": "EUR",
+        "target_currency": "USD",
+        "source_amount": "1.00",
+        "converted_amount": "1.08",
+        "exchange_rate": "1.08",
+        **fields,
+    }
+
+
+@pytest.fixture
+def transaction(user_1):
+    return create_transaction(
+        user=user_1,
+        source_currency="EUR",
+        target_currency="USD",
+        source_amount=Decimal("1.00"),
+        converted_amount=Decimal("1.08"),
+        exchange_rate=Decimal("1.08"),
+    )
+
+
+def test_admin_add_counts_the_transaction(admin_client, user_1):
+    """Check if a transaction added in the admin is counted for its user"""
+    response = admin_client.post(
+        reverse("admin:transactions_transaction_add"), get_form_data(user_1)
+    )
+
+    assert response.status_code == 302
+    assert Transaction.objects.filter(user=user_1).count() == 1
+    assert get_transaction_count(user_1.id) == 1
+
+
+def test_admin_change_moves_the_count(admin_client, user_1, user_factory, transaction):
+    """Check if moving a transaction to another user in the admin moves its count"""
+    user_2 = user_factory()
+
+    response = admin_client.post(
+        reverse("admin:transactions_transaction_change", args=[transaction.id]),
+        get_form_data(user_2),
+    )
+
+    assert response.status_code == 302
+    assert get_transaction_count(user_1.id) == 0
+    assert get_transaction_count(user_2.id) == 1
+
+
+def test_admin_change_moves_the_totals(admin_client, user_1, transaction):
+    """Check if editing a transaction in the admin replaces its totals in the summaries"""
+    response = admin_client.post(
+        reverse("admin:transactions_transaction_change", args=[transaction.id]),
+        get_form_data(
+            user_1, target_currency="BRL", source_amount="3.00", converted_amount="17.40"
+        ),
+    )
+
+    assert response.status_code == 302
+    summaries = DailyTransactionSummary.objects.filter(user=user_1).order_by(
+        "target_currency"
+    )
+    assert list(
+        summaries.values_list(
+            "target_currency", "count", "source_amount", "converted_amount"
+        )
+    ) == [
+        ("BRL", 1, Decimal("3.00"), Decimal("17.40")),
+        ("USD", 0, Decimal("0"), Decimal("0")),
+    ]
@@ -0,0 +1,184 @@
+import json
+import os
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.hashers import make_password
+from django.db import connection
+from django.utils import timezone
+
+from core.models import User
+from core.utils.pagination.cursor_mixin import KeysetCursorPagination
+from transactions.models import CURRENCY_CHOICES, Transaction
+from transactions.utils import get_transactions_for_user
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+BENCHMARK_ROWS = int(os.environ.get("BENCHMARK_ROWS", 2_000_000))
+BENCHMARK_USERS = 1_000
+LIST_INDEXES = {"transaction_user_list_idx"}
+
+SEED_TRANSACTIONS_SQL = f"""
+    INSERT INTO {Transaction._meta.db_table} (
+        id, created, modified, user_id, source_currency, target_currency,
+        source_amount, converted_amount, exchange_rate
+    )
+    SELECT
+        md5(i::text)::uuid,
+        now() - make_interval(secs => i),
+        now(),
+        (%(users)s::uuid[])[1 + i %% %(user_count)s],
+        (%(currencies)s::text[])[1 + i %% 4],
+        (%(currencies)s::text[])[1 + i / 4 %% 4],
+        i %% 1000 + 1,
+        i %% 1000 + 1,
+        1
+    FROM generate_series(1, %(rows)s) AS i
+"""
+
+
+@pytest.fixture(scope="module")
+def heavy_user(django_db_setup, django_db_blocker):
+    """
+    A user among BENCHMARK_USERS users sharing BENCHMARK_ROWS transactions, seeded
+    once for the module outside of the test transactions so they can be vacuumed
+    """
+    if connection.vendor != "postgresql":
+        pytest.skip("The query plans are checked on PostgreSQL")
+
+    with django_db_blocker.unblock():
+        password = make_password(None)
+        users = User.objects.bulk_create(
+            User(email=f"benchmark-{index}@example.com", password=password)
+            for index in range(BENCHMARK_USERS)
+        )
+        user_ids = [str(user.id) for user in users]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                SEED_TRANSACTIONS_SQL,
+                {
+                    "users": user_ids,
+                    "user_count": BENCHMARK_USERS,
+                    "currencies": [code for code, _ in CURRENCY_CHOICES],
+                    "rows": BENCHMARK_ROWS,
+                },
+            )
+            # Index only scans need the visibility map of a vacuumed table
+            cursor.execute(f"VACUUM ANALYZE {Transaction._meta.db_table}")
+
+        yield users[0]
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {Transaction._meta.db_table} WHERE user_id = ANY(%s::uuid[])",
+                [user_ids],
+            )
+        User.objects.filter(id__in=user_ids).delete()
+
+
+def days_ago(days: int) -> str:
+    # The seeded rows are one second apart, up to now
+    return (timezone.now() - timedelta(days=days)).isoformat()
+
+
+def get_plan_nodes(queryset) -> list[dict]:
+    """
+    Flatten the EXPLAIN plan of a queryset
+    Args:
+        queryset: The queryset that is going to be explained
+    Returns: Every node of the plan
+    """
+    plan = queryset.explain(format="json")
+    nodes = [json.loads(plan)[0]["Plan"]]
+    for node in nodes:
+        nodes.extend(node.get("Plans", []))
+    return nodes
+
+
+def assert_list_index_scan(queryset, indexes=LIST_INDEXES, sorted_by_index=True):
+    nodes = get_plan_nodes(queryset)
+    node_types = [node["Node Type"] for node in nodes]
+
+    if sorted_by_index:
+        assert "Sort" not in node_types, node_types
+    assert "Seq Scan" not in node_types, node_types
+    assert any(
+        node["Node Type"] in ("Index Scan", "Index Only Scan", "Bitmap Index Scan")
+        and node.get("Index Name") in indexes
+        for node in nodes
+    ), nodes
+
+
+def test_first_page_uses_the_list_index(heavy_user):
+    """Check if the first page of a user is read from the list index without sorting"""
+    queryset = get_transactions_for_user(heavy_user)[:10]
+
+    assert_list_index_scan(queryset)
+
+
+def test_deep_keyset_page_uses_the_list_index(heavy_user):
+    """Check if a page deep into the history costs an index range scan"""
+    pagination = KeysetCursorPagination()
+    pagination.fields = ["created", "id"]
+    middle = get_transactions_for_user(heavy_user).values_list("created", "id")[
+        BENCHMARK_ROWS // BENCHMARK_USERS // 2
+    ]
+    queryset = get_transactions_for_user(heavy_user).filter(
+        pagination._after(list(middle), descending=True)
+    )[:10]
+
+    assert_list_index_scan(queryset)
+
+
+def test_list_columns_are_covered(heavy_user):
+    """Check if Postgres can answer a page with an index only scan"""
+    queryset = get_transactions_for_user(heavy_user).values_list(
+        "id",
+        "user_id",
+        "source_currency",
+        "source_amount",
+        "target_currency",
+        "converted_amount",
+        "exchange_rate",
+        "created",
+        "modified",
+    )[:10]
+
+    assert "Index Only Scan" in [node["Node Type"] for node in get_plan_nodes(queryset)]
+
+
+@pytest.mark.parametrize(
+    "filters,indexes,sorted_by_index",
+    [
+        (
+            {"start": days_ago(2), "end": days_ago(1)},
+            LIST_INDEXES,
+            True,
+        ),
+        ({"source_currency": "BRL"}, {"transaction_user_source_idx"}, True),
+        ({"target_currency": "JPY"}, {"transaction_user_target_idx"}, True),
+        (
+            {"source_currency": "BRL", "target_currency": "JPY"},
+            {"transaction_user_source_idx", "transaction_user_target_idx"},
+            True,
+        ),
+        (
+            {"source_currency": "USD", "start": days_ago(2)},
+            {"transaction_user_source_idx"},
+            True,
+        ),
+        # The matching rows of an amount range are few and sorted after the range scan
+        (
+            {"min_source_amount": "10", "max_source_amount": "12"},
+            {"transaction_user_amount_idx"},
+            False,
+        ),
+    ],
+)
+def test_filtered_page_uses_an_index_range_scan(
+    heavy_user, filters, indexes, sorted_by_index
+):
+    """Check if every filter of the list is answered by a range scan of an index"""
+    queryset = get_transactions_for_user(heavy_user, filters)[:10]
+
+    assert_list_index_scan(queryset, indexes=indexes, sorted_by_index=sorted_by_index)
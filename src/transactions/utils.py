@@ -1,14 +1,27 @@
+from typing import Mapping
+
 from django.contrib.auth.models import AbstractBaseUser
+from django_filters.utils import translate_validation
 
+from transactions.filters import TransactionFilter
 from transactions.models import Transaction
 
 
-def get_transactions_for_user(user: AbstractBaseUser) -> dict:
+def get_transactions_for_user(
+    user: AbstractBaseUser, filters: Mapping | None = None
+) -> dict:
     """
     Get translations for the user
     Params:
         user: The user from which the translation belong to
+        filters: The TransactionFilter parameters, e.g. the query parameters
     Returns: The user's transactions
     """
     transactions = Transaction.objects.filter(user=user)
-    return transactions
+    if not filters:
+        return transactions
+
+    filterset = TransactionFilter(filters, queryset=transactions)
+    if not filterset.is_valid():
+        raise translate_validation(filterset.errors)
+    return filterset.qs
@@ -0,0 +1,23 @@
+from drf_spectacular.utils import OpenApiResponse
+from rest_framework import status
+
+from core.utils.docs.typing import Docs
+from transactions.enums.docs import Tags
+
+from .serializers import BatchConvertRequestSerializer, BatchConvertResponseSerializer
+
+docs: Docs = {
+    "request": BatchConvertRequestSerializer,
+    "responses": {
+        status.HTTP_200_OK: BatchConvertResponseSerializer,
+        status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+            description="Invalid item or too many items"
+        ),
+        status.HTTP_503_SERVICE_UNAVAILABLE: OpenApiResponse(
+            description="Exchange rates are temporarily unavailable"
+        ),
+    },
+    "summary": "Convert many amounts with the same rates",
+    "tags": [Tags.EXCHANGE_RATES.value],
+    "methods": ["POST"],
+}
@@ -0,0 +1,52 @@
+from django.conf import settings
+from rest_framework import serializers
+
+from core.utils.serializer.base import BaseResponseSerializer
+from core.utils.serializer.inline_serializer import inline_serializer
+from transactions.enums.messages import ExchangeRateMessages
+from transactions.exceptions.transactions import (
+    TransactionSourceAmountMustBePositiveException,
+)
+from transactions.models import CURRENCY_CHOICES
+
+
+class BatchConvertItemSerializer(serializers.Serializer):
+    source_currency = serializers.ChoiceField(choices=CURRENCY_CHOICES)
+    target_currency = serializers.ChoiceField(choices=CURRENCY_CHOICES)
+    source_amount = serializers.DecimalField(max_digits=10, decimal_places=2)
+
+    def validate_source_amount(self, value):
+        if value <= 0:
+            raise TransactionSourceAmountMustBePositiveException()
+        return value
+
+
+class BatchConvertRequestSerializer(serializers.Serializer):
+    items = BatchConvertItemSerializer(many=True, allow_empty=False)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Checked before any item is validated
+        items = self.fields["items"]
+        items.max_length = settings.EXCHANGERATES_BATCH_MAX_ITEMS
+        items.error_messages["max_length"] = ExchangeRateMessages.BATCH_TOO_LARGE.value
+
+
+class ConversionSerializer(serializers.Serializer):
+    source_currency = serializers.CharField()
+    target_currency = serializers.CharField()
+    source_amount = serializers.DecimalField(max_digits=10, decimal_places=2)
+    # The largest source amount times the largest exchange rate
+    converted_amount = serializers.DecimalField(max_digits=20, decimal_places=2)
+    exchange_rate = serializers.DecimalField(max_digits=16, decimal_places=6)
+
+
+class BatchConvertResponseSerializer(BaseResponseSerializer):
+    data = inline_serializer(
+        name="BatchConvertDataResponseSerializer",
+        fields={
+            "snapshot_id": serializers.UUIDField(),
+            "rates_timestamp": serializers.DateTimeField(),
+            "conversions": ConversionSerializer(many=True),
+        },
+    )
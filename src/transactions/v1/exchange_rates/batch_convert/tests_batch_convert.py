@@ -0,0 +1,142 @@
+import json
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from transactions.enums.messages import ExchangeRateMessages
+from transactions.models import ExchangeRateSnapshot, Transaction
+
+
+def batch_convert(client, access_token, data):
+    """
+    Make a request to the batch conversion endpoint
+    Args:
+        client: HTTP Client
+        access_token: The access token of the user
+        data: The request body
+    Returns: Batch conversion endpoint response
+    """
+    return client.post(
+        path=reverse("transactions:batch-convert-exchange-rates"),
+        data=json.dumps(data),
+        content_type="application/json",
+        HTTP_AUTHORIZATION=f"Bearer {access_token}",
+    )
+
+
+@pytest.fixture
+def snapshot(db, rates):
+    return ExchangeRateSnapshot.objects.create(rates=rates)
+
+
+def test_batch_convert_successfully(client, user_1_token, snapshot):
+    """Check if every item is converted with the same snapshot"""
+    response = batch_convert(
+        client,
+        user_1_token,
+        {
+            "items": [
+                {
+                    "source_currency": "USD",
+                    "target_currency": "BRL",
+                    "source_amount": "10",
+                },
+                {
+                    "source_currency": "EUR",
+                    "target_currency": "JPY",
+                    "source_amount": "2.5",
+                },
+            ]
+        },
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert body["message"] == ExchangeRateMessages.BATCH_CONVERT_SUCCESSFULLY.value
+    assert body["data"]["snapshot_id"] == str(snapshot.id)
+    assert body["data"]["conversions"] == [
+        {
+            "source_currency": "USD",
+            "target_currency": "BRL",
+            "source_amount": "10.00",
+            "converted_amount": "53.70",
+            "exchange_rate": "5.370370",
+        },
+        {
+            "source_currency": "EUR",
+            "target_currency": "JPY",
+            "source_amount": "2.50",
+            "converted_amount": "426.25",
+            "exchange_rate": "170.500000",
+        },
+    ]
+    assert not Transaction.objects.exists()
+
+
+def test_batch_convert_largest_amount(client, user_1_token, snapshot):
+    """Check if the largest accepted amount is converted to the currency worth least"""
+    item = {
+        "source_currency": "EUR",
+        "target_currency": "JPY",
+        "source_amount": "99999999.99",
+    }
+
+    response = batch_convert(client, user_1_token, {"items": [item]})
+
+    assert response.status_code == status.HTTP_200_OK
+    conversion = response.json()["data"]["conversions"][0]
+    assert conversion["converted_amount"] == "17049999998.30"
+
+
+def test_batch_convert_too_many_items(client, user_1_token, snapshot, settings):
+    """Check if batches over the maximum size are rejected"""
+    settings.EXCHANGERATES_BATCH_MAX_ITEMS = 1
+    item = {"source_currency": "USD", "target_currency": "BRL", "source_amount": "10"}
+
+    response = batch_convert(client, user_1_token, {"items": [item, item]})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {
+        "items": {
+            "non_field_errors": [
+                ExchangeRateMessages.BATCH_TOO_LARGE.value.format(max_length=1)
+            ]
+        }
+    }
+
+
+def test_batch_convert_invalid_item(client, user_1_token, snapshot):
+    """Check if the errors are reported for each item"""
+    response = batch_convert(
+        client,
+        user_1_token,
+        {
+            "items": [
+                {
+                    "source_currency": "USD",
+                    "target_currency": "BRL",
+                    "source_amount": "1",
+                },
+                {
+                    "source_currency": "USD",
+                    "target_currency": "XXX",
+                    "source_amount": "1",
+                },
+            ]
+        },
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    errors = response.json()["items"]
+    assert errors[0] == {}
+    assert "target_currency" in errors[1]
+
+
+def test_batch_convert_without_snapshot(client, user_1_token):
+    """Check if the batch fails when no rates exist"""
+    item = {"source_currency": "USD", "target_currency": "BRL", "source_amount": "10"}
+
+    response = batch_convert(client, user_1_token, {"items": [item]})
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
@@ -0,0 +1,34 @@
+from core.utils.use_cases.base import BaseUseCase
+from transactions.services.cross_rates import CrossRateMatrix
+from transactions.services.snapshots import get_latest_exchange_rate_snapshot
+
+
+class BatchConvertUseCase(BaseUseCase):
+    def execute(self, items: list[dict]) -> dict:
+        """
+        Convert every item with the latest snapshot, without registering transactions
+        Params:
+            items: The currencies and amounts that are going to be converted
+        Returns: The snapshot used and the conversions in the order of the items
+        """
+        snapshot = get_latest_exchange_rate_snapshot()
+        matrix = CrossRateMatrix.for_snapshot(snapshot)
+
+        conversions = []
+        for item in items:
+            converted_amount, exchange_rate = matrix.convert(
+                item["source_currency"], item["target_currency"], item["source_amount"]
+            )
+            conversions.append(
+                {
+                    **item,
+                    "converted_amount": converted_amount,
+                    "exchange_rate": exchange_rate,
+                }
+            )
+
+        return {
+            "snapshot_id": snapshot.id,
+            "rates_timestamp": snapshot.created,
+            "conversions": conversions,
+        }
@@ -0,0 +1,33 @@
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from transactions.enums.messages import ExchangeRateMessages
+
+from .docs import docs
+from .serializers import BatchConvertRequestSerializer, BatchConvertResponseSerializer
+from .use_case import BatchConvertUseCase
+
+
+class BatchConvertView(APIView):
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(**docs)
+    def post(self, request: Request) -> Response:
+        """
+        Convert a list of amounts between currency pairs from a single snapshot
+        """
+        serializer = BatchConvertRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        conversions = BatchConvertUseCase().execute(**serializer.validated_data)
+        response_body = BatchConvertResponseSerializer(
+            {
+                "message": ExchangeRateMessages.BATCH_CONVERT_SUCCESSFULLY.value,
+                "data": conversions,
+            }
+        ).data
+        return Response(response_body, status=status.HTTP_200_OK)
@@ -0,0 +1,15 @@
+from rest_framework import status
+
+from core.utils.docs.typing import Docs
+from transactions.enums.docs import Tags
+
+from .serializers import GetQuotaResponseSerializer
+
+docs: Docs = {
+    "responses": {
+        status.HTTP_200_OK: GetQuotaResponseSerializer,
+    },
+    "summary": "Get the rates provider quota state",
+    "tags": [Tags.EXCHANGE_RATES.value],
+    "methods": ["GET"],
+}
@@ -0,0 +1,26 @@
+from rest_framework import serializers
+
+from core.utils.serializer.base import BaseResponseSerializer
+from core.utils.serializer.inline_serializer import inline_serializer
+
+
+class QuotaStateSerializer(serializers.Serializer):
+    provider = serializers.CharField()
+    period_start = serializers.DateTimeField()
+    period_end = serializers.DateTimeField()
+    quota = serializers.IntegerField()
+    reserve = serializers.IntegerField()
+    calls = serializers.IntegerField()
+    remaining_calls = serializers.IntegerField()
+    expected_calls = serializers.FloatField()
+    projected_calls = serializers.FloatField()
+    projected_balance = serializers.FloatField()
+    refresh_interval = serializers.FloatField()
+    ahead_of_budget = serializers.BooleanField()
+
+
+class GetQuotaResponseSerializer(BaseResponseSerializer):
+    data = inline_serializer(
+        name="GetQuotaDataResponseSerializer",
+        fields={"quota": QuotaStateSerializer()},
+    )
@@ -0,0 +1,12 @@
+from core.utils.use_cases.base import BaseUseCase
+from transactions.services.exchangerate import ExchangeRatesAPI
+from transactions.services.quota import QuotaState
+
+
+class GetQuotaUseCase(BaseUseCase):
+    def execute(self) -> QuotaState:
+        """
+        Get the quota state of the rates provider
+        Returns: The calls made in the billing period and their projection
+        """
+        return ExchangeRatesAPI.quota_planner.get_state()
@@ -0,0 +1,30 @@
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from transactions.enums.messages import ExchangeRateMessages
+
+from .docs import docs
+from .serializers import GetQuotaResponseSerializer
+from .use_case import GetQuotaUseCase
+
+
+class GetQuotaView(APIView):
+    permission_classes = (IsAdminUser,)
+
+    @extend_schema(**docs)
+    def get(self, request: Request) -> Response:
+        """
+        Get the calls made to the rates provider and the projected end of period balance
+        """
+        quota = GetQuotaUseCase().execute()
+        response_body = GetQuotaResponseSerializer(
+            {
+                "message": ExchangeRateMessages.GET_QUOTA_SUCCESSFULLY.value,
+                "data": {"quota": quota},
+            }
+        ).data
+        return Response(response_body, status=status.HTTP_200_OK)
@@ -0,0 +1,23 @@
+from drf_spectacular.utils import OpenApiResponse
+from rest_framework import status
+
+from core.utils.docs.typing import Docs
+from transactions.enums.docs import Tags
+
+from .serializers import GetQuoteRequestSerializer, GetQuoteResponseSerializer
+
+docs: Docs = {
+    "parameters": [GetQuoteRequestSerializer],
+    "responses": {
+        status.HTTP_200_OK: GetQuoteResponseSerializer,
+        status.HTTP_404_NOT_FOUND: OpenApiResponse(
+            description="No exchange rates were in effect at the requested time"
+        ),
+        status.HTTP_503_SERVICE_UNAVAILABLE: OpenApiResponse(
+            description="Exchange rates are temporarily unavailable"
+        ),
+    },
+    "summary": "Convert an amount without registering a transaction",
+    "tags": [Tags.EXCHANGE_RATES.value],
+    "methods": ["GET"],
+}
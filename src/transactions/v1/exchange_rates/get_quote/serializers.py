@@ -0,0 +1,39 @@
+from rest_framework import serializers
+
+from core.utils.serializer.base import BaseResponseSerializer
+from core.utils.serializer.inline_serializer import inline_serializer
+from transactions.exceptions.transactions import (
+    TransactionSourceAmountMustBePositiveException,
+)
+from transactions.models import CURRENCY_CHOICES
+
+
+class GetQuoteRequestSerializer(serializers.Serializer):
+    source_currency = serializers.ChoiceField(choices=CURRENCY_CHOICES)
+    target_currency = serializers.ChoiceField(choices=CURRENCY_CHOICES)
+    source_amount = serializers.DecimalField(max_digits=5, decimal_places=2, default=1)
+    at = serializers.DateTimeField(required=False)
+
+    def validate_source_amount(self, value):
+        if value <= 0:
+            raise TransactionSourceAmountMustBePositiveException()
+        return value
+
+
+class QuoteSerializer(serializers.Serializer):
+    source_currency = serializers.CharField()
+    target_currency = serializers.CharField()
+    source_amount = serializers.DecimalField(max_digits=10, decimal_places=2)
+    converted_amount = serializers.DecimalField(max_digits=10, decimal_places=2)
+    exchange_rate = serializers.DecimalField(max_digits=16, decimal_places=6)
+    rates_timestamp = serializers.DateTimeField()
+    snapshot_id = serializers.UUIDField(allow_null=True)
+    quote_token = serializers.CharField(allow_null=True)
+    quote_expires_at = serializers.DateTimeField(allow_null=True)
+
+
+class GetQuoteResponseSerializer(BaseResponseSerializer):
+    data = inline_serializer(
+        name="GetQuoteDataResponseSerializer",
+        fields={"quote": QuoteSerializer()},
+    )
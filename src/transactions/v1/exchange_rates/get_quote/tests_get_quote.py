@@ -0,0 +1,219 @@
+import pytest
+from django.urls import reverse
+from freezegun import freeze_time
+from rest_framework import status
+
+from transactions.enums.messages import ExchangeRateMessages
+from transactions.models import ExchangeRateSnapshot
+from transactions.services.history import record_exchange_rate_history
+
+
+def get_quote(client, access_token, params):
+    """
+    Make a request to the quote endpoint
+    Args:
+        client: HTTP Client
+        access_token: The access token of the user
+        params: The query parameters
+    Returns: Quote endpoint response
+    """
+    return client.get(
+        path=reverse("transactions:get-exchange-rates-quote"),
+        data=params,
+        HTTP_AUTHORIZATION=f"Bearer {access_token}",
+    )
+
+
+@pytest.fixture
+def snapshot(db, rates):
+    with freeze_time("2024-01-01 12:00:00"):
+        snapshot = ExchangeRateSnapshot.objects.create(rates=rates)
+        record_exchange_rate_history(snapshot)
+    return snapshot
+
+
+@freeze_time("2024-01-01 15:00:00")
+def test_get_quote_with_the_latest_rates(client, user_1_token, snapshot):
+    """Check if an amount is converted with the latest snapshot"""
+    response = get_quote(
+        client,
+        user_1_token,
+        {"source_currency": "USD", "target_currency": "BRL", "source_amount": "10.00"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    quote_token = response.json()["data"]["quote"]["quote_token"]
+    assert response.json() == {
+        "message": ExchangeRateMessages.GET_QUOTE_SUCCESSFULLY.value,
+        "data": {
+            "quote": {
+                "source_currency": "USD",
+                "target_currency": "BRL",
+                "source_amount": "10.00",
+                "converted_amount": "53.70",
+                "exchange_rate": "5.370370",
+                "rates_timestamp": "2024-01-01T12:00:00Z",
+                "snapshot_id": str(snapshot.id),
+                "quote_token": quote_token,
+                "quote_expires_at": "2024-01-01T15:02:00Z",
+            }
+        },
+    }
+
+
+def test_get_quote_at_a_past_time(client, user_1_token, snapshot, rates):
+    """Check if a backdated quote uses the snapshot in effect at that time"""
+    with freeze_time("2024-01-02 12:00:00"):
+        newer = ExchangeRateSnapshot.objects.create(rates={**rates, "BRL": 6})
+        record_exchange_rate_history(newer)
+
+    response = get_quote(
+        client,
+        user_1_token,
+        {
+            "source_currency": "EUR",
+            "target_currency": "BRL",
+            "at": "2024-01-01T18:00:00Z",
+        },
+    )
+
+    quote = response.json()["data"]["quote"]
+    assert quote["exchange_rate"] == "5.800000"
+    assert quote["quote_token"] is None
+    assert quote["rates_timestamp"] == "2024-01-01T12:00:00Z"
+
+
+def test_get_quote_before_any_rates(client, user_1_token, snapshot):
+    """Check if a quote before the first snapshot is not found"""
+    response = get_quote(
+        client,
+        user_1_token,
+        {
+            "source_currency": "EUR",
+            "target_currency": "BRL",
+            "at": "2023-12-31T12:00:00Z",
+        },
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert response.json() == {
+        "detail": ExchangeRateMessages.HISTORICAL_RATE_NOT_FOUND.value
+    }
+
+
+@freeze_time("2024-01-01 15:00:10")
+def test_get_quote_is_cacheable(client, user_1_token, snapshot, settings):
+    """Check if a quote can be cached until its window ends and then revalidated"""
+    settings.EXCHANGERATES_QUOTE_CACHE_MAX_AGE = 30
+    params = {"source_currency": "USD", "target_currency": "BRL"}
+
+    response = get_quote(client, user_1_token, params)
+
+    assert response["Cache-Control"] == "private, max-age=20"
+    assert str(snapshot.id) in response["ETag"]
+    assert response.json()["data"]["quote"]["snapshot_id"] == str(snapshot.id)
+    assert response.json()["data"]["quote"]["quote_token"]
+
+    revalidated = client.get(
+        path=reverse("transactions:get-exchange-rates-quote"),
+        data=params,
+        HTTP_AUTHORIZATION=f"Bearer {user_1_token}",
+        HTTP_IF_NONE_MATCH=response["ETag"],
+    )
+    assert revalidated.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.mark.parametrize(
+    "if_none_match", ['"other", {etag}', "W/{etag}", "*"], ids=["list", "weak", "any"]
+)
+@freeze_time("2024-01-01 15:00:10")
+def test_get_quote_not_modified(client, user_1_token, snapshot, mocker, if_none_match):
+    """Check if any matching validator gets a 304 without converting the amount"""
+    params = {"source_currency": "USD", "target_currency": "BRL"}
+    etag = get_quote(client, user_1_token, params)["ETag"]
+    execute = mocker.patch(
+        "transactions.v1.exchange_rates.get_quote.views.GetQuoteUseCase.execute"
+    )
+
+    response = client.get(
+        path=reverse("transactions:get-exchange-rates-quote"),
+        data=params,
+        HTTP_AUTHORIZATION=f"Bearer {user_1_token}",
+        HTTP_IF_NONE_MATCH=if_none_match.format(etag=etag),
+    )
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response["ETag"] == etag
+    execute.assert_not_called()
+
+
+@freeze_time("2024-01-01 15:00:10")
+def test_get_quote_changes_once_redeemed(
+    client, user_1_token, snapshot, django_capture_on_commit_callbacks
+):
+    """Check if a quote is issued again after its token was redeemed"""
+    params = {"source_currency": "USD", "target_currency": "BRL"}
+    first = get_quote(client, user_1_token, params)
+    with django_capture_on_commit_callbacks(execute=True):
+        client.post(
+            path=reverse("transactions:create-transaction"),
+            data={"quote_token": first.json()["data"]["quote"]["quote_token"]},
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {user_1_token}",
+        )
+
+    response = client.get(
+        path=reverse("transactions:get-exchange-rates-quote"),
+        data=params,
+        HTTP_AUTHORIZATION=f"Bearer {user_1_token}",
+        HTTP_IF_NONE_MATCH=first["ETag"],
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["ETag"] != first["ETag"]
+
+
+@freeze_time("2024-01-01 15:00:10")
+def test_get_quote_etag_depends_on_the_format(client, user_1_token, snapshot):
+    """Check if a JSON ETag does not revalidate a MessagePack quote"""
+    params = {"source_currency": "USD", "target_currency": "BRL"}
+    json_response = get_quote(client, user_1_token, params)
+
+    response = client.get(
+        path=reverse("transactions:get-exchange-rates-quote"),
+        data=params,
+        HTTP_AUTHORIZATION=f"Bearer {user_1_token}",
+        HTTP_ACCEPT="application/msgpack",
+        HTTP_IF_NONE_MATCH=json_response["ETag"],
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "application/msgpack"
+    assert response["ETag"] != json_response["ETag"]
+    assert "Accept" in response["Vary"]
+
+
+@freeze_time("2024-01-01 15:00:10")
+def test_get_quote_compressed_not_modified(client, user_1_token, snapshot, settings):
+    """Check if the weak ETag of a compressed quote still answers revalidations"""
+    settings.COMPRESSION_MIN_SIZE = 0
+    params = {"source_currency": "USD", "target_currency": "BRL"}
+    compressed = client.get(
+        path=reverse("transactions:get-exchange-rates-quote"),
+        data=params,
+        HTTP_AUTHORIZATION=f"Bearer {user_1_token}",
+        HTTP_ACCEPT_ENCODING="br, gzip",
+    )
+    assert compressed["Content-Encoding"] == "br"
+    assert compressed["ETag"].startswith("W/")
+
+    response = client.get(
+        path=reverse("transactions:get-exchange-rates-quote"),
+        data=params,
+        HTTP_AUTHORIZATION=f"Bearer {user_1_token}",
+        HTTP_ACCEPT_ENCODING="br, gzip",
+        HTTP_IF_NONE_MATCH=compressed["ETag"],
+    )
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
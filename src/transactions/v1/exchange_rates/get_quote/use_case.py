@@ -0,0 +1,66 @@
+from datetime import datetime
+from decimal import Decimal
+
+from core.models import User
+from core.utils.use_cases.base import BaseUseCase
+from transactions.services.cross_rates import CrossRateMatrix
+from transactions.services.quote_tokens import issue_quote_token
+from transactions.services.rate_index import rate_index
+from transactions.services.snapshots import get_latest_exchange_rate_snapshot
+
+
+class GetQuoteUseCase(BaseUseCase):
+    def execute(
+        self,
+        user: User,
+        source_currency: str,
+        target_currency: str,
+        source_amount: Decimal,
+        at: datetime | None = None,
+    ) -> dict:
+        """
+        Convert an amount with the latest rates, locked by a quote token the user can
+        redeem, or with the rates in effect at a time
+        Params:
+            user: The user asking for the quote
+            source_currency: The currency of the amount
+            target_currency: The currency the amount is converted to
+            source_amount: The amount that is going to be converted
+            at: The time of a backdated conversion
+        Returns: The conversion, the time of the rates it used and the quote token
+        """
+        quote = {
+            "source_currency": source_currency,
+            "target_currency": target_currency,
+            "source_amount": source_amount,
+            "snapshot_id": None,
+            "quote_token": None,
+            "quote_expires_at": None,
+        }
+
+        if at is not None:
+            # Backdated quotes can not be redeemed
+            converted_amount, exchange_rate, rates_timestamp = rate_index.convert(
+                source_currency, target_currency, source_amount, at
+            )
+            return {
+                **quote,
+                "converted_amount": converted_amount,
+                "exchange_rate": exchange_rate,
+                "rates_timestamp": rates_timestamp,
+            }
+
+        snapshot = get_latest_exchange_rate_snapshot()
+        converted_amount, exchange_rate = CrossRateMatrix.for_snapshot(snapshot).convert(
+            source_currency, target_currency, source_amount
+        )
+        quote.update(
+            converted_amount=converted_amount,
+            exchange_rate=exchange_rate,
+            rates_timestamp=snapshot.created,
+            snapshot_id=snapshot.id,
+        )
+        quote["quote_token"], quote["quote_expires_at"] = issue_quote_token(
+            user.id, snapshot.id, quote
+        )
+        return quote
@@ -0,0 +1,73 @@
+from django.conf import settings
+from django.utils import timezone
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from transactions.enums.messages import ExchangeRateMessages
+from transactions.services.list_cache import TransactionListCache
+from transactions.services.quote_tokens import get_quote_etag, get_quote_window
+from transactions.services.snapshots import get_latest_exchange_rate_snapshot
+
+from .docs import docs
+from .serializers import GetQuoteRequestSerializer, GetQuoteResponseSerializer
+from .use_case import GetQuoteUseCase
+
+
+def get_latest_quote_etag(request: Request, *args, **kwargs) -> str | None:
+    # Backdated quotes carry no token and are not revalidated
+    if "at" in request.query_params:
+        return None
+
+    # The quote only changes with the snapshot and the quote window, and once the user
+    # redeemed its token, which changes the generation of the user transactions
+    window_start, _ = get_quote_window()
+    return get_quote_etag(
+        get_latest_exchange_rate_snapshot().id,
+        window_start,
+        TransactionListCache.get_generation(request.user.id),
+        request.META.get("QUERY_STRING", ""),
+        # JSON and MessagePack bodies are different representations
+        request.META.get("HTTP_ACCEPT", ""),
+    )
+
+
+class GetQuoteView(APIView):
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(**docs)
+    @method_decorator(condition(etag_func=get_latest_quote_etag))
+    def get(self, request: Request) -> Response:
+        """
+        Convert an amount with the latest rates and a quote token that locks them for
+        create-transaction, or with the rates in effect at the given time, answering
+        304 when the If-None-Match ETag is current
+        """
+        serializer = GetQuoteRequestSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        quote = GetQuoteUseCase().execute(user=request.user, **serializer.validated_data)
+
+        max_age = settings.EXCHANGERATES_QUOTE_CACHE_MAX_AGE
+        if quote["snapshot_id"] is not None:
+            now = timezone.now()
+            _, window_end = get_quote_window(now)
+            max_age = int((window_end - now).total_seconds())
+
+        response_body = GetQuoteResponseSerializer(
+            {
+                "message": ExchangeRateMessages.GET_QUOTE_SUCCESSFULLY.value,
+                "data": {"quote": quote},
+            }
+        ).data
+        response = Response(response_body, status=status.HTTP_200_OK)
+        # Quote tokens are issued to a single user
+        patch_cache_control(response, private=True, max_age=max_age)
+        patch_vary_headers(response, ("Authorization", "Accept"))
+        return response
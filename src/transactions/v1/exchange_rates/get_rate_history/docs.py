@@ -0,0 +1,23 @@
+from drf_spectacular.utils import OpenApiResponse
+from rest_framework import status
+
+from core.utils.docs.typing import Docs
+from transactions.enums.docs import Tags
+
+from .serializers import (
+    GetRateHistoryRequestSerializer,
+    GetRateHistoryResponseSerializer,
+)
+
+docs: Docs = {
+    "parameters": [GetRateHistoryRequestSerializer],
+    "responses": {
+        status.HTTP_200_OK: GetRateHistoryResponseSerializer,
+        status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+            description="Unknown currency or invalid date range"
+        ),
+    },
+    "summary": "Get the rate history of a currency pair",
+    "tags": [Tags.EXCHANGE_RATES.value],
+    "methods": ["GET"],
+}
@@ -0,0 +1,35 @@
+from django.utils import timezone
+from rest_framework import serializers
+
+from core.utils.serializer.base import BaseResponseSerializer
+from core.utils.serializer.inline_serializer import inline_serializer
+from transactions.exceptions.exchangerate import InvalidDateRangeException
+from transactions.models import CURRENCY_CHOICES
+
+
+class GetRateHistoryRequestSerializer(serializers.Serializer):
+    base_currency = serializers.ChoiceField(choices=CURRENCY_CHOICES)
+    quote_currency = serializers.ChoiceField(choices=CURRENCY_CHOICES)
+    start = serializers.DateTimeField()
+    end = serializers.DateTimeField(default=timezone.now)
+
+    def validate(self, attrs):
+        if attrs["start"] > attrs["end"]:
+            raise InvalidDateRangeException()
+        return attrs
+
+
+class HistoricalRateSerializer(serializers.Serializer):
+    timestamp = serializers.DateTimeField()
+    rate = serializers.DecimalField(max_digits=16, decimal_places=6)
+
+
+class GetRateHistoryResponseSerializer(BaseResponseSerializer):
+    data = inline_serializer(
+        name="GetRateHistoryDataResponseSerializer",
+        fields={
+            "base_currency": serializers.CharField(),
+            "quote_currency": serializers.CharField(),
+            "rates": HistoricalRateSerializer(many=True),
+        },
+    )
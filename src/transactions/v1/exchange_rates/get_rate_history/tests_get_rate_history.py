@@ -0,0 +1,103 @@
+import json
+
+import pytest
+from django.urls import reverse
+from freezegun import freeze_time
+from rest_framework import status
+
+from transactions.enums.messages import ExchangeRateMessages
+from transactions.models import ExchangeRateSnapshot
+from transactions.services.history import record_exchange_rate_history
+
+
+def get_rate_history(client, access_token, params):
+    """
+    Make a request to the rate history endpoint
+    Args:
+        client: HTTP Client
+        access_token: The access token of the user
+        params: The query parameters
+    Returns: Rate history endpoint response
+    """
+    return client.get(
+        path=reverse("transactions:get-exchange-rates-history"),
+        data=params,
+        HTTP_AUTHORIZATION=f"Bearer {access_token}",
+    )
+
+
+@pytest.fixture
+def history(db, rates):
+    for day, usd_rate in ((1, 1.08), (2, 1.1), (3, 1.2)):
+        with freeze_time(f"2024-01-0{day} 12:00:00"):
+            snapshot = ExchangeRateSnapshot.objects.create(
+                rates={**rates, "USD": usd_rate}
+            )
+            record_exchange_rate_history(snapshot)
+
+
+def test_get_rate_history_successfully(client, user_1_token, history):
+    """Check if the rates of the pair inside the range are streamed in order"""
+    response = get_rate_history(
+        client,
+        user_1_token,
+        {
+            "base_currency": "EUR",
+            "quote_currency": "USD",
+            "start": "2024-01-02T00:00:00Z",
+            "end": "2024-01-03T23:59:59Z",
+        },
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.streaming
+    assert json.loads(b"".join(response.streaming_content)) == {
+        "message": ExchangeRateMessages.GET_RATE_HISTORY_SUCCESSFULLY.value,
+        "data": {
+            "base_currency": "EUR",
+            "quote_currency": "USD",
+            "rates": [
+                {"timestamp": "2024-01-02T12:00:00Z", "rate": "1.100000"},
+                {"timestamp": "2024-01-03T12:00:00Z", "rate": "1.200000"},
+            ],
+        },
+    }
+
+
+def test_get_rate_history_until_now(client, user_1_token, history):
+    """Check if the range ends now by default"""
+    response = get_rate_history(
+        client,
+        user_1_token,
+        {"base_currency": "USD", "quote_currency": "BRL", "start": "2023-01-01T00:00Z"},
+    )
+
+    content = json.loads(b"".join(response.streaming_content))
+    assert len(content["data"]["rates"]) == 3
+    assert content["data"]["rates"][0]["rate"] == "5.370370"
+
+
+def test_get_rate_history_with_an_invalid_range(client, user_1_token):
+    """Check if a range ending before it starts is rejected"""
+    response = get_rate_history(
+        client,
+        user_1_token,
+        {
+            "base_currency": "EUR",
+            "quote_currency": "USD",
+            "start": "2024-01-02T00:00:00Z",
+            "end": "2024-01-01T00:00:00Z",
+        },
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["non_field_errors"] == [
+        ExchangeRateMessages.INVALID_DATE_RANGE.value
+    ]
+
+
+def test_get_rate_history_without_authentication(client):
+    """Check if the history is only available to authenticated users"""
+    response = client.get(reverse("transactions:get-exchange-rates-history"))
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
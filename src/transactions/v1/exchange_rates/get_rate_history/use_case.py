@@ -0,0 +1,31 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Iterator
+
+from django.conf import settings
+
+from core.utils.use_cases.base import BaseUseCase
+from transactions.models import HistoricalExchangeRate
+
+
+class GetRateHistoryUseCase(BaseUseCase):
+    def execute(
+        self, base_currency: str, quote_currency: str, start: datetime, end: datetime
+    ) -> Iterator[tuple[datetime, Decimal]]:
+        """
+        Get the rates of a currency pair over a time range
+        Params:
+            base_currency: The currency the rates are relative to
+            quote_currency: The currency that is priced
+            start: The start of the range
+            end: The end of the range
+        Returns: The timestamps and rates in chronological order, read from the database
+        in chunks as they are consumed
+        """
+        return (
+            HistoricalExchangeRate.objects.get_series(
+                base_currency, quote_currency, start, end
+            )
+            .values_list("timestamp", "rate")
+            .iterator(chunk_size=settings.EXCHANGERATES_HISTORY_CHUNK_SIZE)
+        )
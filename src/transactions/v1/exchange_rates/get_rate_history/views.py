@@ -0,0 +1,46 @@
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from drf_spectacular.utils import extend_schema
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.views import APIView
+
+from core.utils.streaming.json import ITEMS_PLACEHOLDER, stream_json
+from transactions.enums.messages import ExchangeRateMessages
+
+from .docs import docs
+from .serializers import GetRateHistoryRequestSerializer
+from .use_case import GetRateHistoryUseCase
+
+
+class GetRateHistoryView(APIView):
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(**docs)
+    def get(self, request: Request) -> StreamingHttpResponse:
+        """
+        Stream the rates of a currency pair over a time range
+        """
+        serializer = GetRateHistoryRequestSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        rates = GetRateHistoryUseCase().execute(**serializer.validated_data)
+        envelope = {
+            "message": ExchangeRateMessages.GET_RATE_HISTORY_SUCCESSFULLY.value,
+            "data": {
+                "base_currency": serializer.validated_data["base_currency"],
+                "quote_currency": serializer.validated_data["quote_currency"],
+                "rates": ITEMS_PLACEHOLDER,
+            },
+        }
+        return StreamingHttpResponse(
+            stream_json(
+                envelope,
+                (
+                    {"timestamp": timestamp, "rate": str(rate)}
+                    for timestamp, rate in rates
+                ),
+                chunk_size=settings.EXCHANGERATES_HISTORY_CHUNK_SIZE,
+            ),
+            content_type="application/json",
+        )
@@ -0,0 +1,21 @@
+from django.urls import path
+
+from transactions.v1.exchange_rates.batch_convert.views import BatchConvertView
+from transactions.v1.exchange_rates.get_quota.views import GetQuotaView
+from transactions.v1.exchange_rates.get_quote.views import GetQuoteView
+from transactions.v1.exchange_rates.get_rate_history.views import GetRateHistoryView
+
+urls = [
+    path("exchange-rates/quota", GetQuotaView.as_view(), name="get-exchange-rates-quota"),
+    path(
+        "exchange-rates/history",
+        GetRateHistoryView.as_view(),
+        name="get-exchange-rates-history",
+    ),
+    path("exchange-rates/quote", GetQuoteView.as_view(), name="get-exchange-rates-quote"),
+    path(
+        "exchange-rates/convert",
+        BatchConvertView.as_view(),
+        name="batch-convert-exchange-rates",
+    ),
+]
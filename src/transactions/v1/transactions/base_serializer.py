@@ -1,9 +1,20 @@
+from decimal import Context, Decimal
+from typing import Iterator
+
+from django.db import models
+from django.utils import timezone
+from django.utils.functional import cached_property
 from rest_framework import serializers
 
+from core.utils.serializer.dynamic_fields import DynamicFieldsMixin
+from transactions.exceptions.transactions import UnknownTransactionFieldsException
 from transactions.models import Transaction
 
 
-class TransactionSerializer(serializers.ModelSerializer):
+class TransactionSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    # Read whatever the requested fields are, the cursor pagination needs them
+    key_fields = ("id", "created")
+
     class Meta:
         model = Transaction
         fields = (
@@ -17,3 +28,106 @@ class TransactionSerializer(serializers.ModelSerializer):
             "created",
             "modified",
         )
+
+    @classmethod
+    def get_queryset(cls, queryset, fields: tuple[str, ...] | None = None):
+        """
+        Select only the columns of the requested fields
+        """
+        if fields is None:
+            return queryset
+        return queryset.only(*fields, *cls.key_fields)
+
+
+def get_requested_fields(query_params) -> tuple[str, ...] | None:
+    """
+    Get the transaction fields asked for with ?fields=id,source_amount
+    Params:
+        query_params: The query parameters of the request
+    Returns: The requested fields in the serializer order, None when every field is
+    """
+    value = query_params.get("fields", "")
+    requested = {name.strip() for name in value.split(",") if name.strip()}
+    if not requested:
+        return None
+
+    unknown = requested - set(TransactionSerializer.Meta.fields)
+    if unknown:
+        raise UnknownTransactionFieldsException(sorted(unknown))
+    return tuple(name for name in TransactionSerializer.Meta.fields if name in requested)
+
+
+def _format_decimal(field: models.DecimalField):
+    exponent = Decimal(1).scaleb(-field.decimal_places)
+    context = Context(prec=field.max_digits)
+
+    def format_decimal(value: Decimal) -> str:
+        return "{:f}".format(value.quantize(exponent, context=context))
+
+    return format_decimal
+
+
+class FastTransactionSerializer:
+    """
+    Read only serializer giving the same data as TransactionSerializer from the rows of
+    get_queryset, formatting the values of a row in one pass instead of building the
+    model instances and running the DRF fields
+    """
+
+    fields = TransactionSerializer.Meta.fields
+
+    def __init__(
+        self, instance, many: bool = True, fields: tuple[str, ...] | None = None
+    ):
+        self.instance = instance
+        if fields is not None:
+            self.fields = fields
+
+    @classmethod
+    def get_queryset(cls, queryset, fields: tuple[str, ...] | None = None):
+        """
+        Select only the serialized columns as named tuples, the foreign keys give the
+        related id like the serializer and the ordering fields stay attributes
+        """
+        fields = cls.fields if fields is None else fields
+        keys = [name for name in TransactionSerializer.key_fields if name not in fields]
+        # The keys come last, where the formatting of a row stops
+        return queryset.values_list(*fields, *keys, named=True)
+
+    @cached_property
+    def data(self) -> list[dict]:
+        return list(self.stream())
+
+    def stream(self) -> Iterator[dict]:
+        """
+        Format the rows as they are consumed, for responses streamed from an iterator
+        """
+        formatters = self.get_formatters()
+        for row in self.instance:
+            yield {
+                name: value if value is None or format is None else format(value)
+                for name, format, value in zip(self.fields, formatters, row)
+            }
+
+    def get_formatters(self) -> list:
+        # Same rendering as the DRF fields, datetimes in the timezone of the request
+        current_timezone = timezone.get_current_timezone()
+
+        def format_datetime(value):
+            value = value.astimezone(current_timezone).isoformat()
+            if value.endswith("+00:00"):
+                return value[:-6] + "Z"
+            return value
+
+        formatters = []
+        for name in self.fields:
+            field = Transaction._meta.get_field(name)
+            if isinstance(field, models.UUIDField):
+                formatters.append(str)
+            elif isinstance(field, models.DecimalField):
+                formatters.append(_format_decimal(field))
+            elif isinstance(field, models.DateTimeField):
+                formatters.append(format_datetime)
+            else:
+                formatters.append(None)
+        return formatters
@@ -0,0 +1,23 @@
+from drf_spectacular.types import OpenApiTypes
+from rest_framework import status
+
+from core.utils.docs.typing import Docs
+from transactions.enums.docs import Tags
+from transactions.v1.transactions.create_user_transaction.serializers import (
+    CreateUserTransactionRequestSerializer,
+)
+
+from .serializers import BulkCreateUserTransactionsResponseSerializer
+
+docs: Docs = {
+    "request": CreateUserTransactionRequestSerializer(many=True),
+    "responses": {
+        status.HTTP_201_CREATED: BulkCreateUserTransactionsResponseSerializer,
+        status.HTTP_207_MULTI_STATUS: BulkCreateUserTransactionsResponseSerializer,
+        status.HTTP_400_BAD_REQUEST: OpenApiTypes.OBJECT,
+        status.HTTP_503_SERVICE_UNAVAILABLE: OpenApiTypes.OBJECT,
+    },
+    "summary": "Bulk Create User Transactions",
+    "tags": [Tags.TRANSACTION.value],
+    "methods": ["POST"],
+}
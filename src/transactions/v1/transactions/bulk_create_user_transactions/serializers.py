@@ -0,0 +1,27 @@
+from rest_framework import serializers
+
+from core.utils.serializer.base import BaseResponseSerializer
+from core.utils.serializer.inline_serializer import inline_serializer
+from transactions.v1.transactions.base_serializer import TransactionSerializer
+
+
+class CreatedTransactionSerializer(serializers.Serializer):
+    index = serializers.IntegerField()
+    transaction = TransactionSerializer()
+
+
+class TransactionErrorSerializer(serializers.Serializer):
+    index = serializers.IntegerField()
+    errors = serializers.DictField()
+
+
+class BulkCreateUserTransactionsResponseSerializer(BaseResponseSerializer):
+    data = inline_serializer(
+        name="BulkCreateUserTransactionsDataResponseSerializer",
+        fields={
+            "created": serializers.IntegerField(),
+            "failed": serializers.IntegerField(),
+            "transactions": CreatedTransactionSerializer(many=True),
+            "errors": TransactionErrorSerializer(many=True),
+        },
+    )
@@ -0,0 +1,216 @@
+import json
+from decimal import Decimal
+
+import pytest
+from django.db import DatabaseError, connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from transactions.enums.messages import ExchangeRateMessages, TransactionMessages
+from transactions.models import ExchangeRateSnapshot, Transaction
+
+ITEM = {"source_currency": "USD", "target_currency": "BRL", "source_amount": "10.00"}
+
+
+def bulk_create_transactions(client, access_token, data):
+    """
+    Make a request to the bulk create transactions endpoint
+    Args:
+        client: HTTP Client
+        access_token: The access token of the user creating the transactions
+        data: The list of transactions
+    Returns: Bulk create transactions endpoint response
+    """
+    return client.post(
+        path=reverse("transactions:bulk-create-transactions"),
+        data=json.dumps(data),
+        content_type="application/json",
+        HTTP_AUTHORIZATION=f"Bearer {access_token}",
+    )
+
+
+@pytest.fixture
+def snapshot(db, rates):
+    return ExchangeRateSnapshot.objects.create(rates=rates)
+
+
+def test_bulk_create_transactions_successfully(
+    client, user_1, user_1_token, snapshot, settings
+):
+    """Check if every item is converted and inserted in chunks"""
+    settings.TRANSACTIONS_BULK_CHUNK_SIZE = 2
+
+    with CaptureQueriesContext(connection) as queries:
+        response = bulk_create_transactions(client, user_1_token, [ITEM] * 5)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    body = response.json()
+    assert body["message"] == (
+        TransactionMessages.BULK_CREATE_TRANSACTIONS_SUCCESSFULLY.value
+    )
+    assert body["data"]["created"] == 5
+    assert [row["index"] for row in body["data"]["transactions"]] == [0, 1, 2, 3, 4]
+    assert (
+        Transaction.objects.filter(user=user_1, converted_amount=Decimal("53.70")).count()
+        == 5
+    )
+    inserts = [
+        query
+        for query in queries
+        if query["sql"].startswith(f'INSERT INTO "{Transaction._meta.db_table}"')
+    ]
+    assert len(inserts) == 3
+    assert user_1.transaction_counter.count == 5
+
+
+def test_bulk_create_transactions_reports_invalid_items(
+    client, user_1, user_1_token, snapshot
+):
+    """Check if the invalid items are reported without discarding the valid ones"""
+    response = bulk_create_transactions(
+        client,
+        user_1_token,
+        [ITEM, {**ITEM, "source_amount": "-1"}, {**ITEM, "target_currency": "XXX"}],
+    )
+
+    assert response.status_code == status.HTTP_207_MULTI_STATUS
+    body = response.json()
+    assert body["message"] == TransactionMessages.BULK_CREATE_TRANSACTIONS_PARTIALLY.value
+    assert body["data"]["created"] == 1
+    assert body["data"]["failed"] == 2
+    assert body["data"]["errors"][0] == {
+        "index": 1,
+        "errors": {
+            "source_amount": [TransactionMessages.SOURCE_AMOUNT_MUST_BE_POSITIVE.value]
+        },
+    }
+    assert body["data"]["errors"][1]["index"] == 2
+    assert Transaction.objects.filter(user=user_1).count() == 1
+
+
+def get_quote_token(client, access_token, source_amount="1.00"):
+    """
+    Get a quote token from the quote endpoint
+    Args:
+        client: HTTP Client
+        access_token: The access token of the user
+        source_amount: The quoted amount, a different amount gives another token
+    Returns: The quote token
+    """
+    return client.get(
+        path=reverse("transactions:get-exchange-rates-quote"),
+        data={
+            "source_currency": "USD",
+            "target_currency": "BRL",
+            "source_amount": source_amount,
+        },
+        HTTP_AUTHORIZATION=f"Bearer {access_token}",
+    ).json()["data"]["quote"]["quote_token"]
+
+
+def test_bulk_create_transactions_redeems_a_quote_once(
+    client, user_1, user_1_token, snapshot
+):
+    """Check if a quote token repeated in a list only creates one transaction"""
+    token = get_quote_token(client, user_1_token)
+
+    response = bulk_create_transactions(
+        client, user_1_token, [{"quote_token": token}, {"quote_token": token}]
+    )
+
+    assert response.status_code == status.HTTP_207_MULTI_STATUS
+    assert response.json()["data"]["errors"] == [
+        {
+            "index": 1,
+            "errors": {
+                "non_field_errors": [ExchangeRateMessages.REDEEMED_QUOTE_TOKEN.value]
+            },
+        }
+    ]
+    assert Transaction.objects.filter(user=user_1).count() == 1
+
+
+def test_bulk_create_transactions_with_redeemed_quotes(
+    client, user_1, user_1_token, snapshot
+):
+    """Check if the redeemed quotes are found with one query and only fail their item"""
+    tokens = [get_quote_token(client, user_1_token, f"{index}.00") for index in (1, 2, 3)]
+    bulk_create_transactions(client, user_1_token, [{"quote_token": tokens[1]}])
+
+    with CaptureQueriesContext(connection) as queries:
+        response = bulk_create_transactions(
+            client, user_1_token, [{"quote_token": token} for token in tokens] + [ITEM]
+        )
+
+    assert response.status_code == status.HTTP_207_MULTI_STATUS
+    body = response.json()["data"]
+    assert body["created"] == 3
+    assert body["errors"] == [
+        {
+            "index": 1,
+            "errors": {
+                "non_field_errors": [ExchangeRateMessages.REDEEMED_QUOTE_TOKEN.value]
+            },
+        }
+    ]
+    quote_lookups = [
+        query for query in queries if '"quote_id" IN' in query["sql"].replace("`", '"')
+    ]
+    assert len(quote_lookups) == 1
+
+
+def test_bulk_create_transactions_with_a_quote_redeemed_concurrently(
+    client, user_1, user_1_token, snapshot, mocker
+):
+    """Check if a quote redeemed since the lookup only fails its own item"""
+    tokens = [get_quote_token(client, user_1_token, f"{index}.00") for index in (1, 2)]
+    bulk_create_transactions(client, user_1_token, [{"quote_token": tokens[0]}])
+    # Both requests looked the quotes up before either was stored
+    mocker.patch(
+        "transactions.v1.transactions.bulk_create_user_transactions.use_case"
+        ".get_redeemed_quote_ids",
+        return_value=set(),
+    )
+
+    response = bulk_create_transactions(
+        client, user_1_token, [{"quote_token": token} for token in tokens] + [ITEM]
+    )
+
+    body = response.json()["data"]
+    assert body["created"] == 2
+    assert [error["index"] for error in body["errors"]] == [0]
+    assert Transaction.objects.filter(user=user_1).count() == 3
+
+
+def test_bulk_create_transactions_keeps_the_other_batches(
+    client, user_1, user_1_token, snapshot, settings, mocker
+):
+    """Check if a batch that fails to be inserted does not roll back the others"""
+    settings.TRANSACTIONS_BULK_CHUNK_SIZE = 2
+    bulk_create = Transaction.objects.bulk_create
+    batches = []
+
+    def fail_second_batch(rows):
+        batches.append(rows)
+        if len(batches) == 2:
+            raise DatabaseError()
+        return bulk_create(rows)
+
+    mocker.patch.object(Transaction.objects, "bulk_create", side_effect=fail_second_batch)
+
+    response = bulk_create_transactions(client, user_1_token, [ITEM] * 5)
+
+    assert response.status_code == status.HTTP_207_MULTI_STATUS
+    assert [error["index"] for error in response.json()["data"]["errors"]] == [2, 3]
+    assert Transaction.objects.filter(user=user_1).count() == 3
+
+
+def test_bulk_create_transactions_too_many_items(client, user_1_token, settings):
+    """Check if lists over the maximum size are rejected as a whole"""
+    settings.TRANSACTIONS_BULK_MAX_ITEMS = 2
+
+    response = bulk_create_transactions(client, user_1_token, [ITEM] * 3)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert not Transaction.objects.exists()
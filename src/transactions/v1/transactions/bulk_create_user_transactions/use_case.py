@@ -0,0 +1,138 @@
+from typing import Any
+
+import sentry_sdk
+from django.conf import settings
+from django.db import DatabaseError, IntegrityError
+from rest_framework.exceptions import APIException
+from rest_framework.settings import api_settings
+
+from core.models import User
+from core.utils.use_cases.base import BaseUseCase
+from transactions.enums.messages import ExchangeRateMessages, TransactionMessages
+from transactions.models import Transaction
+from transactions.services.bookkeeping import (
+    bulk_create_transactions,
+    insert_transaction,
+)
+from transactions.services.cross_rates import CrossRateMatrix
+from transactions.services.quote_tokens import get_redeemed_quote_ids
+from transactions.services.snapshots import get_latest_exchange_rate_snapshot
+
+REDEEMED_QUOTE_ERRORS = {
+    api_settings.NON_FIELD_ERRORS_KEY: [ExchangeRateMessages.REDEEMED_QUOTE_TOKEN.value]
+}
+
+
+class BulkCreateUserTransactionsUseCase(BaseUseCase):
+    def execute(
+        self, user: User, items: list[dict | None]
+    ) -> tuple[dict[int, Transaction], dict[int, Any]]:
+        """
+        Register many transactions converted with the same snapshot, inserting them in
+        atomic batches so a failed batch does not roll back the others, and the ones
+        locked by a quote one by one
+        Params:
+            user: The user the transactions belong to
+            items: The validated transaction info, None for the items that failed
+            validation
+        Returns: The created transactions and the errors, by position of the item
+        """
+        matrix = None
+        errors = {}
+        pending = []
+        quote_ids = set()
+        for index, item in enumerate(items):
+            if item is None:
+                continue
+            if "quote_id" in item:
+                # Locked by a quote token, that the other items can not redeem again
+                if item["quote_id"] in quote_ids:
+                    errors[index] = REDEEMED_QUOTE_ERRORS
+                    continue
+                quote_ids.add(item["quote_id"])
+                pending.append((index, Transaction(**item, user=user)))
+                continue
+            if matrix is None:
+                matrix = CrossRateMatrix.for_snapshot(get_latest_exchange_rate_snapshot())
+            try:
+                converted_amount, exchange_rate = matrix.convert(
+                    item["source_currency"],
+                    item["target_currency"],
+                    item["source_amount"],
+                )
+            except APIException as e:
+                errors[index] = {"detail": e.detail}
+                continue
+            pending.append(
+                (
+                    index,
+                    Transaction(
+                        **item,
+                        user=user,
+                        converted_amount=converted_amount,
+                        exchange_rate=exchange_rate,
+                    ),
+                )
+            )
+
+        created = {}
+        chunk_size = settings.TRANSACTIONS_BULK_CHUNK_SIZE
+        for start in range(0, len(pending), chunk_size):
+            end = start + chunk_size
+            chunk = pending[start:end]
+            created.update(
+                self.insert_quoted(
+                    [(index, row) for index, row in chunk if row.quote_id], errors
+                )
+            )
+            chunk = [(index, row) for index, row in chunk if not row.quote_id]
+            if not chunk:
+                continue
+            try:
+                bulk_create_transactions([row for _, row in chunk])
+            except DatabaseError as e:
+                sentry_sdk.capture_exception(e)
+                for index, _ in chunk:
+                    errors[index] = {
+                        "detail": TransactionMessages.BULK_CREATE_TRANSACTIONS_FAILED.value
+                    }
+                continue
+            created.update(chunk)
+
+        return created, errors
+
+    @staticmethod
+    def insert_quoted(
+        rows: list[tuple[int, Transaction]], errors: dict[int, Any]
+    ) -> dict[int, Transaction]:
+        """
+        Insert the transactions locked by a quote, each one in its own atomic block so
+        a quote redeemed by a concurrent request only fails its own item
+        Params:
+            rows: The transactions by position of their item
+            errors: The errors by position of the item, completed with the failed rows
+        Returns: The created transactions by position of their item
+        """
+        if not rows:
+            return {}
+
+        redeemed = get_redeemed_quote_ids([row.quote_id for _, row in rows])
+        created = {}
+        for index, row in rows:
+            if row.quote_id in redeemed:
+                errors[index] = REDEEMED_QUOTE_ERRORS
+                continue
+            try:
+                insert_transaction(row)
+            except IntegrityError:
+                # Redeemed by a concurrent request since the lookup
+                errors[index] = REDEEMED_QUOTE_ERRORS
+                continue
+            except DatabaseError as e:
+                sentry_sdk.capture_exception(e)
+                errors[index] = {
+                    "detail": TransactionMessages.BULK_CREATE_TRANSACTIONS_FAILED.value
+                }
+                continue
+            created[index] = row
+        return created
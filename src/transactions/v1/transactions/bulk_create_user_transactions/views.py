@@ -0,0 +1,68 @@
+from django.conf import settings
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from transactions.enums.messages import TransactionMessages
+from transactions.v1.transactions.bulk_create_user_transactions.use_case import (
+    BulkCreateUserTransactionsUseCase,
+)
+from transactions.v1.transactions.create_user_transaction.serializers import (
+    CreateUserTransactionRequestSerializer,
+)
+
+from .docs import docs
+from .serializers import BulkCreateUserTransactionsResponseSerializer
+
+
+class BulkCreateUserTransactionsView(APIView):
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(**docs)
+    def post(self, request: Request) -> Response:
+        """
+        Register a list of user transactions, reporting the items that could not be
+        created without discarding the others
+        """
+        serializer = CreateUserTransactionRequestSerializer(
+            data=request.data,
+            context={"request": request},
+            many=True,
+            allow_empty=False,
+            max_length=settings.TRANSACTIONS_BULK_MAX_ITEMS,
+        )
+        serializer.is_valid(raise_exception=True)
+
+        created, errors = BulkCreateUserTransactionsUseCase().execute(
+            user=request.user, items=serializer.validated_data
+        )
+        errors.update(serializer.item_errors)
+
+        response_body = BulkCreateUserTransactionsResponseSerializer(
+            {
+                "message": (
+                    TransactionMessages.BULK_CREATE_TRANSACTIONS_PARTIALLY.value
+                    if errors
+                    else TransactionMessages.BULK_CREATE_TRANSACTIONS_SUCCESSFULLY.value
+                ),
+                "data": {
+                    "created": len(created),
+                    "failed": len(errors),
+                    "transactions": [
+                        {"index": index, "transaction": transaction}
+                        for index, transaction in sorted(created.items())
+                    ],
+                    "errors": [
+                        {"index": index, "errors": item_errors}
+                        for index, item_errors in sorted(errors.items())
+                    ],
+                },
+            }
+        ).data
+        return Response(
+            response_body,
+            status=status.HTTP_207_MULTI_STATUS if errors else status.HTTP_201_CREATED,
+        )
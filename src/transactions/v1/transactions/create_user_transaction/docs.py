@@ -24,6 +24,7 @@ docs: Docs = {
     "responses": {
         status.HTTP_201_CREATED: CreateUseTransactionResponseSerializer,
         status.HTTP_400_BAD_REQUEST: OpenApiTypes.OBJECT,
+        status.HTTP_503_SERVICE_UNAVAILABLE: OpenApiTypes.OBJECT,
     },
     "summary": "Create User Transaction",
     "tags": [Tags.TRANSACTION.value],
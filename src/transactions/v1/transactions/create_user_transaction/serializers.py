@@ -2,23 +2,51 @@ from rest_framework import serializers
 
 from core.utils.serializer.base import BaseResponseSerializer
 from core.utils.serializer.inline_serializer import inline_serializer
+from core.utils.serializer.partial_list import PartialListSerializer
 from transactions.exceptions.transactions import (
     TransactionSourceAmountMustBePositiveException,
 )
 from transactions.models import CURRENCY_CHOICES
+from transactions.services.quote_tokens import redeem_quote_token
 from transactions.v1.transactions.base_serializer import TransactionSerializer
 
 
 class CreateUserTransactionRequestSerializer(serializers.Serializer):
-    source_currency = serializers.ChoiceField(choices=CURRENCY_CHOICES)
-    target_currency = serializers.ChoiceField(choices=CURRENCY_CHOICES)
+    source_currency = serializers.ChoiceField(choices=CURRENCY_CHOICES, required=False)
+    target_currency = serializers.ChoiceField(choices=CURRENCY_CHOICES, required=False)
     source_amount = serializers.DecimalField(max_digits=5, decimal_places=2, default=1)
+    quote_token = serializers.CharField(required=False, write_only=True)
+
+    class Meta:
+        # Bulk creation keeps the valid items of a list
+        list_serializer_class = PartialListSerializer
 
     def validate_source_amount(self, value):
         if value <= 0:
             raise TransactionSourceAmountMustBePositiveException()
         return value
 
+    def validate(self, attrs):
+        if "quote_token" in attrs:
+            # The quote locks the currencies, amounts and rate of the transaction
+            quote = redeem_quote_token(
+                attrs.pop("quote_token"),
+                self.context["request"].user.id,
+                # Bulk creation looks the quotes of the whole list up with one query
+                check_redeemed=self.parent is None,
+            )
+            quote.pop("snapshot_id")
+            return quote
+
+        missing = {
+            field: [self.fields[field].error_messages["required"]]
+            for field in ("source_currency", "target_currency")
+            if field not in attrs
+        }
+        if missing:
+            raise serializers.ValidationError(missing, code="required")
+        return attrs
+
 
 class CreateUseTransactionResponseSerializer(BaseResponseSerializer):
     data = inline_serializer(
@@ -0,0 +1,255 @@
+import json
+from datetime import timedelta
+from decimal import Decimal
+
+import msgpack
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from freezegun import freeze_time
+from rest_framework import status
+
+from authentication.utils.jwt import AccessToken
+from transactions.enums.messages import ExchangeRateMessages, TransactionMessages
+from transactions.models import ExchangeRateSnapshot, Transaction
+
+
+def create_transaction(client, access_token, data):
+    """
+    Make a request to the create transaction endpoint
+    Args:
+        client: HTTP Client
+        access_token: The access token of the user creating the transaction
+        data: The transaction request body
+    Returns: Create transaction endpoint response
+    """
+    return client.post(
+        path=reverse("transactions:create-transaction"),
+        data=json.dumps(data),
+        content_type="application/json",
+        HTTP_AUTHORIZATION=f"Bearer {access_token}",
+    )
+
+
+@pytest.fixture
+def snapshot(db, rates):
+    return ExchangeRateSnapshot.objects.create(rates=rates)
+
+
+@pytest.fixture
+def get_exchange_rates(mocker):
+    return mocker.patch(
+        "transactions.services.exchangerate.ExchangeRatesAPI.get_exchange_rates"
+    )
+
+
+def test_create_transaction_successfully(
+    client, user_1, user_1_token, snapshot, get_exchange_rates
+):
+    """Check if a transaction is converted with the latest snapshot"""
+    response = create_transaction(
+        client,
+        user_1_token,
+        {"source_currency": "USD", "target_currency": "BRL", "source_amount": "10.00"},
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()["message"] == (
+        TransactionMessages.CREATE_TRANSACTION_SUCCESSFULLY.value
+    )
+    transaction = Transaction.objects.get(user=user_1)
+    assert transaction.converted_amount == Decimal("53.70")
+    assert transaction.exchange_rate == Decimal("5.370370")
+    get_exchange_rates.assert_not_called()
+
+
+def test_create_transaction_with_msgpack(
+    client, user_1, user_1_token, snapshot, get_exchange_rates
+):
+    """Check if a MessagePack body is accepted and answered in MessagePack"""
+    response = client.post(
+        path=reverse("transactions:create-transaction"),
+        data=msgpack.packb(
+            {"source_currency": "USD", "target_currency": "BRL", "source_amount": "10.00"}
+        ),
+        content_type="application/msgpack",
+        HTTP_AUTHORIZATION=f"Bearer {user_1_token}",
+        HTTP_ACCEPT="application/msgpack",
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert msgpack.unpackb(response.content)["message"] == (
+        TransactionMessages.CREATE_TRANSACTION_SUCCESSFULLY.value
+    )
+    assert Transaction.objects.get(user=user_1).converted_amount == Decimal("53.70")
+
+
+def test_create_transaction_without_snapshot(user_1_token, client, get_exchange_rates):
+    """Check if the transaction fails without reaching the provider when no rates exist"""
+    response = create_transaction(
+        client,
+        user_1_token,
+        {"source_currency": "USD", "target_currency": "BRL", "source_amount": "10.00"},
+    )
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.json() == {
+        "detail": TransactionMessages.EXCHANGE_RATES_UNAVAILABLE.value
+    }
+    get_exchange_rates.assert_not_called()
+
+
+def test_create_transaction_with_expired_snapshot(
+    client, user_1_token, snapshot, settings
+):
+    """Check if a snapshot outside its freshness window is not used"""
+    ExchangeRateSnapshot.objects.filter(id=snapshot.id).update(
+        created=timezone.now()
+        - timedelta(seconds=settings.EXCHANGERATES_SNAPSHOT_MAX_AGE + 1)
+    )
+
+    response = create_transaction(
+        client,
+        user_1_token,
+        {"source_currency": "USD", "target_currency": "BRL", "source_amount": "10.00"},
+    )
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert not Transaction.objects.exists()
+
+
+def test_create_transaction_with_negative_amount(client, user_1_token, snapshot):
+    """Check if a non positive source amount is rejected"""
+    response = create_transaction(
+        client,
+        user_1_token,
+        {"source_currency": "USD", "target_currency": "BRL", "source_amount": "-1.00"},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {
+        "source_amount": [TransactionMessages.SOURCE_AMOUNT_MUST_BE_POSITIVE.value]
+    }
+
+
+def get_quote(client, access_token, params):
+    """
+    Make a request to the quote endpoint
+    Args:
+        client: HTTP Client
+        access_token: The access token of the user
+        params: The query parameters
+    Returns: Quote endpoint response
+    """
+    return client.get(
+        path=reverse("transactions:get-exchange-rates-quote"),
+        data=params,
+        HTTP_AUTHORIZATION=f"Bearer {access_token}",
+    )
+
+
+def test_create_transaction_with_a_quote_token(
+    client, user_1, user_1_token, snapshot, rates, get_exchange_rates
+):
+    """Check if a quoted transaction keeps the quoted amount after the rates change"""
+    quote = get_quote(
+        client,
+        user_1_token,
+        {"source_currency": "USD", "target_currency": "BRL", "source_amount": "10.00"},
+    ).json()["data"]["quote"]
+    ExchangeRateSnapshot.objects.create(rates={**rates, "BRL": 7})
+
+    response = create_transaction(
+        client, user_1_token, {"quote_token": quote["quote_token"]}
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    transaction = response.json()["data"]["transaction"]
+    assert transaction["converted_amount"] == quote["converted_amount"] == "53.70"
+    assert transaction["exchange_rate"] == quote["exchange_rate"]
+    get_exchange_rates.assert_not_called()
+
+
+def test_create_transaction_with_an_expired_quote_token(client, user_1_token, snapshot):
+    """Check if a quote token can not be redeemed after it expires"""
+    with freeze_time("2024-01-01 12:00:00"):
+        ExchangeRateSnapshot.objects.update(created=timezone.now())
+        token = get_quote(
+            client,
+            user_1_token,
+            {"source_currency": "USD", "target_currency": "BRL"},
+        ).json()["data"]["quote"]["quote_token"]
+
+    with freeze_time("2024-01-01 13:00:00"):
+        response = create_transaction(client, user_1_token, {"quote_token": token})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {
+        "non_field_errors": [ExchangeRateMessages.EXPIRED_QUOTE_TOKEN.value]
+    }
+
+
+def test_create_transaction_with_a_quote_token_of_another_user(
+    client, user_factory, user_1_token, snapshot
+):
+    """Check if a quote token can only be redeemed by the user it was issued to"""
+    token = get_quote(
+        client, user_1_token, {"source_currency": "USD", "target_currency": "BRL"}
+    ).json()["data"]["quote"]["quote_token"]
+
+    response = create_transaction(
+        client, AccessToken.for_user(user_factory()), {"quote_token": token}
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {
+        "non_field_errors": [ExchangeRateMessages.INVALID_QUOTE_TOKEN.value]
+    }
+
+
+def test_create_transaction_with_a_redeemed_quote_token(
+    client, user_1, user_1_token, snapshot
+):
+    """Check if a quote token can only be redeemed once"""
+    token = get_quote(
+        client, user_1_token, {"source_currency": "USD", "target_currency": "BRL"}
+    ).json()["data"]["quote"]["quote_token"]
+    first = create_transaction(client, user_1_token, {"quote_token": token})
+
+    response = create_transaction(client, user_1_token, {"quote_token": token})
+
+    assert first.status_code == status.HTTP_201_CREATED
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {
+        "non_field_errors": [ExchangeRateMessages.REDEEMED_QUOTE_TOKEN.value]
+    }
+    assert Transaction.objects.filter(user=user_1).count() == 1
+
+
+def test_create_transaction_with_a_quote_token_redeemed_concurrently(
+    client, user_1, user_1_token, snapshot, mocker
+):
+    """Check if the unique quote id rejects a token redeemed by a concurrent request"""
+    token = get_quote(
+        client, user_1_token, {"source_currency": "USD", "target_currency": "BRL"}
+    ).json()["data"]["quote"]["quote_token"]
+    create_transaction(client, user_1_token, {"quote_token": token})
+    # Both requests validated the token before either was stored
+    mocker.patch(
+        "transactions.services.quote_tokens.is_quote_redeemed", return_value=False
+    )
+
+    response = create_transaction(client, user_1_token, {"quote_token": token})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {
+        "non_field_errors": [ExchangeRateMessages.REDEEMED_QUOTE_TOKEN.value]
+    }
+
+
+def test_create_transaction_without_currencies(client, user_1_token, snapshot):
+    """Check if the currencies are required when no quote token is given"""
+    response = create_transaction(client, user_1_token, {"source_amount": "10.00"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert set(response.json()) == {"source_currency", "target_currency"}
@@ -1,9 +1,16 @@
 from typing import Any
 
+from django.db import IntegrityError
+from rest_framework.settings import api_settings
+
 from core.models import User
 from core.utils.use_cases.base import BaseUseCase
+from transactions.enums.messages import ExchangeRateMessages
+from transactions.exceptions.exchangerate import RedeemedQuoteTokenException
 from transactions.models import Transaction
-from transactions.services.exchangerate import ExchangeRatesAPI
+from transactions.services.bookkeeping import create_transaction
+from transactions.services.cross_rates import CrossRateMatrix
+from transactions.services.snapshots import get_latest_exchange_rate_snapshot
 
 
 class CreateUserTransactionUseCase(BaseUseCase):
@@ -11,22 +18,36 @@ class CreateUserTransactionUseCase(BaseUseCase):
         """
         Register a new transaction
         Params:
-            transaction_data: The user transaction info
+            transaction_data: The user transaction info, with the quote id, converted
+            amount and exchange rate when they were locked by a quote
         Returns: The registered Transaction instance
         """
-        rates = ExchangeRatesAPI.get_exchange_rates()
-        converted_amount, exchange_rate = ExchangeRatesAPI.convert_currency_via_eur(
-            transaction_data["source_currency"],
-            transaction_data["target_currency"],
-            transaction_data["source_amount"],
-            rates,
-        )
+        if "exchange_rate" not in transaction_data:
+            snapshot = get_latest_exchange_rate_snapshot()
+            converted_amount, exchange_rate = CrossRateMatrix.for_snapshot(
+                snapshot
+            ).convert(
+                transaction_data["source_currency"],
+                transaction_data["target_currency"],
+                transaction_data["source_amount"],
+            )
+            transaction_data.update(
+                converted_amount=converted_amount, exchange_rate=exchange_rate
+            )
 
-        create_payload = {
-            **transaction_data,
-            "user": user,
-            "converted_amount": converted_amount,
-            "exchange_rate": exchange_rate,
-        }
+        create_payload = {**transaction_data, "user": user}
 
-        return Transaction.objects.create(**create_payload)
+        try:
+            return create_transaction(**create_payload)
+        except IntegrityError:
+            if "quote_id" not in create_payload:
+                raise
+            # A concurrent request redeemed the same quote first, reported like the
+            # serializer does
+            raise RedeemedQuoteTokenException(
+                {
+                    api_settings.NON_FIELD_ERRORS_KEY: [
+                        ExchangeRateMessages.REDEEMED_QUOTE_TOKEN.value
+                    ]
+                }
+            )
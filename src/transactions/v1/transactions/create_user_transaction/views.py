@@ -25,7 +25,9 @@ class CreateUserTransactionView(APIView):
         """
         Register a new user transaction and return the user's transaction data
         """
-        serializer = CreateUserTransactionRequestSerializer(data=request.data)
+        serializer = CreateUserTransactionRequestSerializer(
+            data=request.data, context={"request": request}
+        )
         serializer.is_valid(raise_exception=True)
 
         transaction = CreateUserTransactionUseCase().execute(
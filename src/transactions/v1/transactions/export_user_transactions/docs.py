@@ -0,0 +1,34 @@
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, OpenApiResponse
+from rest_framework import status
+
+from core.utils.docs.typing import Docs
+from transactions.enums.docs import Tags
+
+from .serializers import ExportUserTransactionsRequestSerializer
+
+docs: Docs = {
+    "parameters": [
+        ExportUserTransactionsRequestSerializer,
+        OpenApiParameter(
+            "fields",
+            OpenApiTypes.STR,
+            description="Comma separated transaction fields to export, all by default",
+        ),
+    ],
+    "responses": {
+        status.HTTP_200_OK: OpenApiResponse(
+            response=OpenApiTypes.STR,
+            description=(
+                "The transactions created in the range, oldest first, as CSV or as "
+                "one JSON object per line, gzip encoded when the client accepts it"
+            ),
+        ),
+        status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+            description="Unknown file format or field, or invalid date range"
+        ),
+    },
+    "summary": "Export the transactions of the user",
+    "tags": [Tags.TRANSACTION.value],
+    "methods": ["GET"],
+}
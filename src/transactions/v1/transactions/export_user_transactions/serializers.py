@@ -0,0 +1,18 @@
+from rest_framework import serializers
+
+from transactions.exceptions.exchangerate import InvalidDateRangeException
+
+
+class ExportUserTransactionsRequestSerializer(serializers.Serializer):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+    # Not named format, DRF reads that query parameter to pick the renderer
+    file_format = serializers.ChoiceField(choices=(CSV, NDJSON), default=NDJSON)
+    start = serializers.DateTimeField(required=False)
+    end = serializers.DateTimeField(required=False)
+
+    def validate(self, attrs):
+        if "start" in attrs and "end" in attrs and attrs["start"] > attrs["end"]:
+            raise InvalidDateRangeException()
+        return attrs
@@ -0,0 +1,158 @@
+import csv
+import gzip
+import io
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from transactions.models import Transaction
+
+
+def export_transactions(client, access_token, params=None, **headers):
+    """
+    Make a request to the export transactions endpoint
+    Args:
+        client: HTTP Client
+        access_token: The access token of the user
+        params: The query parameters
+        headers: Extra request headers
+    Returns: Export transactions endpoint response
+    """
+    return client.get(
+        path=reverse("transactions:export-transactions"),
+        data=params or {},
+        HTTP_AUTHORIZATION=f"Bearer {access_token}",
+        **headers,
+    )
+
+
+def read(response) -> str:
+    content = b"".join(response.streaming_content)
+    if response.get("Content-Encoding") == "gzip":
+        content = gzip.decompress(content)
+    return content.decode()
+
+
+@pytest.fixture
+def transactions(user_1, user_factory):
+    rows = Transaction.objects.bulk_create(
+        Transaction(
+            user=user_1,
+            source_currency="EUR",
+            target_currency="BRL",
+            source_amount=Decimal(day),
+            converted_amount=Decimal(day) * Decimal("5.8"),
+            exchange_rate=Decimal("5.8"),
+        )
+        for day in range(1, 6)
+    )
+    for day, row in enumerate(rows, start=1):
+        row.created = datetime(2024, 1, day, tzinfo=timezone.utc)
+    Transaction.objects.bulk_update(rows, ["created"])
+    Transaction.objects.create(
+        user=user_factory(),
+        source_currency="EUR",
+        target_currency="USD",
+        source_amount=Decimal(1),
+        converted_amount=Decimal("1.08"),
+        exchange_rate=Decimal("1.08"),
+    )
+    return rows
+
+
+def test_export_transactions_as_ndjson(client, user_1_token, transactions):
+    """Check if the transactions of the user are streamed oldest first, one per line"""
+    response = export_transactions(client, user_1_token)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.streaming
+    assert response["Content-Type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in read(response).splitlines()]
+    assert [line["id"] for line in lines] == [str(row.id) for row in transactions]
+    assert lines[0]["source_amount"] == "1.00"
+    assert lines[0]["created"] == "2024-01-01T00:00:00Z"
+
+
+def test_export_transactions_as_csv(client, user_1_token, transactions):
+    """Check if the transactions are streamed as CSV with a header"""
+    response = export_transactions(client, user_1_token, {"file_format": "csv"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "text/csv"
+    assert 'filename="transactions.csv"' in response["Content-Disposition"]
+    rows = list(csv.DictReader(io.StringIO(read(response))))
+    assert len(rows) == 5
+    assert rows[-1]["converted_amount"] == "29.00"
+
+
+def test_export_transactions_in_a_date_range(client, user_1_token, transactions):
+    """Check if only the transactions created inside the range are exported"""
+    response = export_transactions(
+        client,
+        user_1_token,
+        {"start": "2024-01-02T00:00:00Z", "end": "2024-01-04T00:00:00Z"},
+    )
+
+    lines = [json.loads(line) for line in read(response).splitlines()]
+    assert [line["id"] for line in lines] == [str(row.id) for row in transactions[1:4]]
+
+
+def test_export_transactions_with_an_invalid_date_range(client, user_1_token):
+    """Check if a range ending before it starts is rejected"""
+    response = export_transactions(
+        client,
+        user_1_token,
+        {"start": "2024-01-04T00:00:00Z", "end": "2024-01-02T00:00:00Z"},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_export_transactions_compressed(client, user_1_token, transactions):
+    """Check if the export is gzip encoded when the client accepts it"""
+    response = export_transactions(
+        client, user_1_token, HTTP_ACCEPT_ENCODING="gzip, deflate"
+    )
+
+    assert response["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response["Vary"]
+    assert len(read(response).splitlines()) == 5
+
+
+def test_export_transactions_without_transactions(client, user_1_token):
+    """Check if a CSV export of a user without transactions only has the header"""
+    response = export_transactions(client, user_1_token, {"file_format": "csv"})
+
+    assert read(response).splitlines() == [
+        "id,user,source_currency,source_amount,target_currency,converted_amount,"
+        "exchange_rate,created,modified"
+    ]
+
+
+def test_export_transactions_unauthenticated(client):
+    """Check if the export requires an authenticated user"""
+    response = client.get(reverse("transactions:export-transactions"))
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_export_transactions_sparse_fields(client, user_1_token, transactions):
+    """Check if only the requested columns are exported"""
+    response = export_transactions(
+        client, user_1_token, {"file_format": "csv", "fields": "created,source_amount"}
+    )
+
+    rows = list(csv.reader(io.StringIO(read(response))))
+    assert rows[0] == ["source_amount", "created"]
+    assert rows[1] == ["1.00", "2024-01-01T00:00:00Z"]
+
+
+def test_export_transactions_unknown_fields(client, user_1_token):
+    """Check if unknown fields are rejected"""
+    response = export_transactions(client, user_1_token, {"fields": "password"})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,40 @@
+from datetime import datetime
+from typing import Iterator
+
+from django.conf import settings
+
+from core.models import User
+from core.utils.use_cases.base import BaseUseCase
+from transactions.utils import get_transactions_for_user
+from transactions.v1.transactions.base_serializer import FastTransactionSerializer
+
+
+class ExportUserTransactionsUseCase(BaseUseCase):
+    def execute(
+        self,
+        user: User,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        fields: tuple[str, ...] | None = None,
+    ) -> Iterator[dict]:
+        """
+        Get every transaction of a user over a time range
+        Params:
+            user: The user the transactions belong to
+            start: The start of the range, from the first transaction when missing
+            end: The end of the range, up to the last transaction when missing
+            fields: The fields of each transaction, all of them when missing
+        Returns: The transactions in chronological order, read from the database in
+        chunks as they are consumed
+        """
+        transactions = get_transactions_for_user(user).order_by("created", "id")
+        if start is not None:
+            transactions = transactions.filter(created__gte=start)
+        if end is not None:
+            transactions = transactions.filter(created__lte=end)
+
+        # A server-side cursor on PostgreSQL, so only a chunk is held in memory
+        rows = FastTransactionSerializer.get_queryset(transactions, fields).iterator(
+            chunk_size=settings.TRANSACTIONS_EXPORT_CHUNK_SIZE
+        )
+        return FastTransactionSerializer(rows, fields=fields).stream()
@@ -0,0 +1,55 @@
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from drf_spectacular.utils import extend_schema
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.views import APIView
+
+from core.utils.streaming.csv import stream_csv
+from core.utils.streaming.ndjson import stream_ndjson
+from transactions.v1.transactions.base_serializer import (
+    FastTransactionSerializer,
+    get_requested_fields,
+)
+
+from .docs import docs
+from .serializers import ExportUserTransactionsRequestSerializer
+from .use_case import ExportUserTransactionsUseCase
+
+CONTENT_TYPES = {
+    ExportUserTransactionsRequestSerializer.CSV: "text/csv",
+    ExportUserTransactionsRequestSerializer.NDJSON: "application/x-ndjson",
+}
+
+
+class ExportUserTransactionsView(APIView):
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(**docs)
+    def get(self, request: Request) -> StreamingHttpResponse:
+        """
+        Stream every transaction of the user as CSV or NDJSON
+        """
+        serializer = ExportUserTransactionsRequestSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        file_format = serializer.validated_data.pop("file_format")
+        fields = get_requested_fields(request.query_params)
+
+        transactions = ExportUserTransactionsUseCase().execute(
+            user=request.user, fields=fields, **serializer.validated_data
+        )
+        chunk_size = settings.TRANSACTIONS_EXPORT_CHUNK_SIZE
+        if file_format == ExportUserTransactionsRequestSerializer.CSV:
+            content = stream_csv(
+                fields or FastTransactionSerializer.fields,
+                transactions,
+                chunk_size=chunk_size,
+            )
+        else:
+            content = stream_ndjson(transactions, chunk_size=chunk_size)
+
+        response = StreamingHttpResponse(content, content_type=CONTENT_TYPES[file_format])
+        response["Content-Disposition"] = (
+            f'attachment; filename="transactions.{file_format}"'
+        )
+        return response
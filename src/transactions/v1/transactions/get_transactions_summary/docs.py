@@ -0,0 +1,23 @@
+from drf_spectacular.utils import OpenApiResponse
+from rest_framework import status
+
+from core.utils.docs.typing import Docs
+from transactions.enums.docs import Tags
+
+from .serializers import (
+    GetTransactionsSummaryRequestSerializer,
+    GetTransactionsSummaryResponseSerializer,
+)
+
+docs: Docs = {
+    "parameters": [GetTransactionsSummaryRequestSerializer],
+    "responses": {
+        status.HTTP_200_OK: GetTransactionsSummaryResponseSerializer,
+        status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+            description="Unknown currency or invalid date range"
+        ),
+    },
+    "summary": "Get the totals of the user transactions by currency pair and day",
+    "tags": [Tags.TRANSACTION.value],
+    "methods": ["GET"],
+}
@@ -0,0 +1,47 @@
+from django.utils import timezone
+from rest_framework import serializers
+
+from core.utils.serializer.base import BaseResponseSerializer
+from core.utils.serializer.inline_serializer import inline_serializer
+from transactions.exceptions.exchangerate import InvalidDateRangeException
+from transactions.models import CURRENCY_CHOICES
+
+
+def today():
+    return timezone.now().date()
+
+
+class GetTransactionsSummaryRequestSerializer(serializers.Serializer):
+    start = serializers.DateField()
+    end = serializers.DateField(default=today)
+    source_currency = serializers.ChoiceField(choices=CURRENCY_CHOICES, required=False)
+    target_currency = serializers.ChoiceField(choices=CURRENCY_CHOICES, required=False)
+
+    def validate(self, attrs):
+        if attrs["start"] > attrs["end"]:
+            raise InvalidDateRangeException()
+        return attrs
+
+
+class PairTotalSerializer(serializers.Serializer):
+    source_currency = serializers.CharField()
+    target_currency = serializers.CharField()
+    count = serializers.IntegerField()
+    source_amount = serializers.DecimalField(max_digits=20, decimal_places=2)
+    converted_amount = serializers.DecimalField(max_digits=20, decimal_places=2)
+
+
+class DailyTotalSerializer(PairTotalSerializer):
+    day = serializers.DateField()
+
+
+class GetTransactionsSummaryResponseSerializer(BaseResponseSerializer):
+    data = inline_serializer(
+        name="GetTransactionsSummaryDataResponseSerializer",
+        fields={
+            "start": serializers.DateField(),
+            "end": serializers.DateField(),
+            "totals": PairTotalSerializer(many=True),
+            "days": DailyTotalSerializer(many=True),
+        },
+    )
@@ -0,0 +1,122 @@
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from freezegun import freeze_time
+from rest_framework import status
+
+from transactions.enums.messages import TransactionMessages
+from transactions.models import Transaction
+from transactions.services.bookkeeping import bulk_create_transactions
+
+
+def get_transactions_summary(client, access_token, params):
+    """
+    Make a request to the transactions summary endpoint
+    Args:
+        client: HTTP Client
+        access_token: The access token of the user
+        params: The query parameters
+    Returns: Transactions summary endpoint response
+    """
+    return client.get(
+        path=reverse("transactions:get-transactions-summary"),
+        data=params,
+        HTTP_AUTHORIZATION=f"Bearer {access_token}",
+    )
+
+
+@pytest.fixture
+def transactions(user_1, user_factory):
+    user_2 = user_factory()
+    for day, pairs in (
+        ("2024-03-01", [("USD", "BRL", "10.00"), ("USD", "BRL", "5.00")]),
+        ("2024-03-02", [("USD", "BRL", "1.00"), ("EUR", "JPY", "2.00")]),
+        ("2024-04-01", [("USD", "BRL", "100.00")]),
+    ):
+        with freeze_time(day):
+            bulk_create_transactions(
+                Transaction(
+                    user=user,
+                    source_currency=source_currency,
+                    target_currency=target_currency,
+                    source_amount=Decimal(amount),
+                    converted_amount=Decimal(amount) * 5,
+                    exchange_rate=Decimal(5),
+                )
+                for source_currency, target_currency, amount in pairs
+                for user in (user_1, user_2)
+            )
+
+
+def test_get_transactions_summary_successfully(client, user_1_token, transactions):
+    """Check if the totals of the user are summed by pair and by day over the range"""
+    response = get_transactions_summary(
+        client, user_1_token, {"start": "2024-03-01", "end": "2024-03-31"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert (
+        body["message"] == TransactionMessages.GET_TRANSACTIONS_SUMMARY_SUCCESSFULLY.value
+    )
+    assert body["data"]["totals"] == [
+        {
+            "source_currency": "EUR",
+            "target_currency": "JPY",
+            "count": 1,
+            "source_amount": "2.00",
+            "converted_amount": "10.00",
+        },
+        {
+            "source_currency": "USD",
+            "target_currency": "BRL",
+            "count": 3,
+            "source_amount": "16.00",
+            "converted_amount": "80.00",
+        },
+    ]
+    assert [(day["day"], day["count"]) for day in body["data"]["days"]] == [
+        ("2024-03-01", 2),
+        ("2024-03-02", 1),
+        ("2024-03-02", 1),
+    ]
+
+
+def test_get_transactions_summary_of_a_pair(client, user_1_token, transactions):
+    """Check if the summary of a pair is read with a single query on the summaries"""
+    with CaptureQueriesContext(connection) as queries:
+        response = get_transactions_summary(
+            client,
+            user_1_token,
+            {
+                "start": "2024-03-01",
+                "end": "2024-03-31",
+                "source_currency": "USD",
+                "target_currency": "BRL",
+            },
+        )
+
+    totals = response.json()["data"]["totals"]
+    assert [total["converted_amount"] for total in totals] == ["80.00"]
+    assert not any(Transaction._meta.db_table + '"' in query["sql"] for query in queries)
+
+
+def test_get_transactions_summary_with_an_invalid_date_range(client, user_1_token):
+    """Check if a range ending before it starts is rejected"""
+    response = get_transactions_summary(
+        client, user_1_token, {"start": "2024-03-31", "end": "2024-03-01"}
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_get_transactions_summary_unauthenticated(client):
+    """Check if the summary requires an authenticated user"""
+    response = client.get(
+        reverse("transactions:get-transactions-summary"), {"start": "2024-03-01"}
+    )
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,52 @@
+from datetime import date
+
+from core.models import User
+from core.utils.use_cases.base import BaseUseCase
+from transactions.models import DailyTransactionSummary
+
+TOTAL_FIELDS = ("count", "source_amount", "converted_amount")
+
+
+class GetTransactionsSummaryUseCase(BaseUseCase):
+    def execute(
+        self,
+        user: User,
+        start: date,
+        end: date,
+        source_currency: str | None = None,
+        target_currency: str | None = None,
+    ) -> dict:
+        """
+        Get the totals of the transactions of a user from the daily summaries
+        Params:
+            user: The user the transactions belong to
+            start: The first UTC day of the range
+            end: The last UTC day of the range
+            source_currency: Only summarize the transactions from this currency
+            target_currency: Only summarize the transactions to this currency
+        Returns: The totals of each currency pair over the range and of each day
+        """
+        days = list(
+            DailyTransactionSummary.objects.get_range(
+                user.id, start, end, source_currency, target_currency
+            ).values("day", "source_currency", "target_currency", *TOTAL_FIELDS)
+        )
+
+        totals: dict[tuple[str, str], dict] = {}
+        for day in days:
+            pair = (day["source_currency"], day["target_currency"])
+            if pair not in totals:
+                totals[pair] = {
+                    "source_currency": day["source_currency"],
+                    "target_currency": day["target_currency"],
+                    **{field: 0 for field in TOTAL_FIELDS},
+                }
+            for field in TOTAL_FIELDS:
+                totals[pair][field] += day[field]
+
+        return {
+            "start": start,
+            "end": end,
+            "totals": [totals[pair] for pair in sorted(totals)],
+            "days": days,
+        }
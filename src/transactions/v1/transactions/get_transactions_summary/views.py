@@ -0,0 +1,38 @@
+from drf_spectacular.utils import extend_schema
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from transactions.enums.messages import TransactionMessages
+
+from .docs import docs
+from .serializers import (
+    GetTransactionsSummaryRequestSerializer,
+    GetTransactionsSummaryResponseSerializer,
+)
+from .use_case import GetTransactionsSummaryUseCase
+
+
+class GetTransactionsSummaryView(APIView):
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(**docs)
+    def get(self, request: Request) -> Response:
+        """
+        Get the totals of the user transactions by currency pair and UTC day
+        """
+        serializer = GetTransactionsSummaryRequestSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        summary = GetTransactionsSummaryUseCase().execute(
+            user=request.user, **serializer.validated_data
+        )
+        response_body = GetTransactionsSummaryResponseSerializer(
+            {
+                "message": TransactionMessages.GET_TRANSACTIONS_SUMMARY_SUCCESSFULLY.value,
+                "data": summary,
+            }
+        ).data
+        return Response(response_body, status=status.HTTP_200_OK)
@@ -1,13 +1,67 @@
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, OpenApiResponse
 from rest_framework import status
 
 from core.utils.docs.typing import Docs
 from transactions.enums.docs import Tags
+from transactions.models import CURRENCY_CHOICES
 
 from .serializers import GetUserTransactionsResponseSerializer
 
 docs: Docs = {
+    "parameters": [
+        OpenApiParameter("page", OpenApiTypes.INT, description="Page number"),
+        OpenApiParameter("page_size", OpenApiTypes.INT, description="Rows per page"),
+        OpenApiParameter(
+            "count",
+            OpenApiTypes.BOOL,
+            description="Set to false to skip the total of the page number pagination",
+        ),
+        OpenApiParameter(
+            "pagination",
+            OpenApiTypes.STR,
+            enum=["page", "cursor"],
+            description="Use cursor to paginate with next and previous cursors, "
+            "which costs the same on every page",
+        ),
+        OpenApiParameter(
+            "cursor", OpenApiTypes.STR, description="Cursor of a next or previous link"
+        ),
+        OpenApiParameter(
+            "start", OpenApiTypes.DATETIME, description="Created at or after this time"
+        ),
+        OpenApiParameter(
+            "end", OpenApiTypes.DATETIME, description="Created at or before this time"
+        ),
+        OpenApiParameter(
+            "source_currency",
+            OpenApiTypes.STR,
+            enum=[code for code, _ in CURRENCY_CHOICES],
+        ),
+        OpenApiParameter(
+            "target_currency",
+            OpenApiTypes.STR,
+            enum=[code for code, _ in CURRENCY_CHOICES],
+        ),
+        OpenApiParameter(
+            "min_source_amount",
+            OpenApiTypes.DECIMAL,
+            description="Smallest source amount",
+        ),
+        OpenApiParameter(
+            "max_source_amount", OpenApiTypes.DECIMAL, description="Largest source amount"
+        ),
+        OpenApiParameter(
+            "fields",
+            OpenApiTypes.STR,
+            description="Comma separated transaction fields to return, all by default",
+        ),
+    ],
     "responses": {
         status.HTTP_200_OK: GetUserTransactionsResponseSerializer,
+        status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+            description="Invalid filter or unknown field"
+        ),
     },
     "summary": "Get User Transactions",
     "tags": [Tags.TRANSACTION.value],
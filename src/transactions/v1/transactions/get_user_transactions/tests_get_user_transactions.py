@@ -0,0 +1,406 @@
+import gzip
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import msgpack
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+from core.utils.metrics.registry import metrics
+from transactions.enums.messages import TransactionMessages
+from transactions.models import Transaction, UserTransactionCounter
+from transactions.services.bookkeeping import create_transaction, delete_transactions
+
+
+def get_user_transactions(client, access_token, params=None):
+    """
+    Make a request to the get user transactions endpoint
+    Args:
+        client: HTTP Client
+        access_token: The access token of the user
+        params: The query parameters
+    Returns: Get user transactions endpoint response
+    """
+    return client.get(
+        path=reverse("transactions:get-user-transactions"),
+        data=params or {},
+        HTTP_AUTHORIZATION=f"Bearer {access_token}",
+    )
+
+
+def follow(client, access_token, link):
+    return client.get(link, HTTP_AUTHORIZATION=f"Bearer {access_token}")
+
+
+@pytest.fixture
+def transactions(user_1):
+    rows = Transaction.objects.bulk_create(
+        Transaction(
+            user=user_1,
+            source_currency="EUR",
+            target_currency="USD",
+            source_amount=Decimal(index + 1),
+            converted_amount=Decimal(index + 1),
+            exchange_rate=Decimal(1),
+        )
+        for index in range(7)
+    )
+    # Rows created at the same time are ordered by id
+    for index, row in enumerate(rows):
+        row.created = datetime(2024, 1, 1 + index // 2, tzinfo=timezone.utc)
+    Transaction.objects.bulk_update(rows, ["created"])
+    return sorted(rows, key=lambda row: (row.created, row.id), reverse=True)
+
+
+def test_get_user_transactions_by_page(client, user_1_token, transactions):
+    """Check if the transactions are paginated by page number by default"""
+    response = get_user_transactions(client, user_1_token, {"page_size": 5})
+
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert body["total"] == 7
+    assert body["current_page"] == 1
+    assert len(body["data"]) == 5
+
+
+def test_get_user_transactions_by_cursor(client, user_1_token, transactions):
+    """Check if the cursors walk every row once in both directions"""
+    response = get_user_transactions(
+        client, user_1_token, {"pagination": "cursor", "page_size": 3}
+    )
+    first_page = response.json()
+    assert first_page["total"] is None
+    assert first_page["current_page"] is None
+    assert first_page["previous"] is None
+
+    pages = [first_page]
+    while pages[-1]["next"]:
+        pages.append(follow(client, user_1_token, pages[-1]["next"]).json())
+
+    ids = [row["id"] for page in pages for row in page["data"]]
+    assert ids == [str(row.id) for row in transactions]
+    assert [len(page["data"]) for page in pages] == [3, 3, 1]
+
+    previous = follow(client, user_1_token, pages[-1]["previous"]).json()
+    assert previous["data"] == pages[1]["data"]
+    previous = follow(client, user_1_token, previous["previous"]).json()
+    assert previous["data"] == pages[0]["data"]
+    assert previous["previous"] is None
+
+
+def test_get_user_transactions_with_an_invalid_cursor(client, user_1_token):
+    """Check if a tampered cursor is rejected"""
+    response = get_user_transactions(client, user_1_token, {"cursor": "not-a-cursor"})
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_get_user_transactions_reads_the_counter(
+    client, user_1, user_1_token, transactions
+):
+    """Check if the total comes from the user counter instead of a COUNT(*)"""
+    UserTransactionCounter.objects.create(user=user_1, count=len(transactions))
+
+    with CaptureQueriesContext(connection) as queries:
+        response = get_user_transactions(client, user_1_token, {"page_size": 5})
+
+    assert response.json()["total"] == 7
+    assert not any("COUNT(" in query["sql"] for query in queries)
+
+
+def test_get_user_transactions_without_total(client, user_1_token, transactions):
+    """Check if the total can be skipped"""
+    response = get_user_transactions(
+        client, user_1_token, {"count": "false", "page": 2, "page_size": 5}
+    )
+
+    body = response.json()
+    assert body["total"] is None
+    assert body["current_page"] == 2
+    assert len(body["data"]) == 2
+
+
+@pytest.mark.parametrize("params", [{"page_size": 5}, {"pagination": "cursor"}])
+def test_get_user_transactions_fast_serializer(
+    client, settings, user_1_token, transactions, params
+):
+    """Check if the fast serializer gives the same pages as the model serializer"""
+    settings.TRANSACTIONS_LIST_CACHE_PAGES = 0
+    expected = get_user_transactions(client, user_1_token, params)
+
+    settings.TRANSACTIONS_FAST_SERIALIZER = True
+    response = get_user_transactions(client, user_1_token, params)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.content == expected.content
+
+
+@pytest.fixture
+def mixed_transactions(user_1, user_factory):
+    rows = Transaction.objects.bulk_create(
+        Transaction(
+            user=user,
+            source_currency=source_currency,
+            target_currency=target_currency,
+            source_amount=Decimal(amount),
+            converted_amount=Decimal(amount),
+            exchange_rate=Decimal(1),
+        )
+        for user in (user_1, user_factory())
+        for source_currency, target_currency, amount in (
+            ("EUR", "USD", 5),
+            ("EUR", "BRL", 50),
+            ("USD", "BRL", 500),
+            ("JPY", "EUR", 5000),
+        )
+    )
+    for index, row in enumerate(rows):
+        row.created = datetime(2024, 1, 1 + index % 4, tzinfo=timezone.utc)
+    Transaction.objects.bulk_update(rows, ["created"])
+    return [row for row in rows if row.user_id == user_1.id]
+
+
+@pytest.mark.parametrize(
+    "filters,expected",
+    [
+        ({"start": "2024-01-02T00:00:00Z"}, [3, 2, 1]),
+        ({"start": "2024-01-02T00:00:00Z", "end": "2024-01-03T00:00:00Z"}, [2, 1]),
+        ({"source_currency": "EUR"}, [1, 0]),
+        ({"target_currency": "BRL"}, [2, 1]),
+        ({"source_currency": "EUR", "target_currency": "BRL"}, [1]),
+        ({"min_source_amount": "50", "max_source_amount": "500"}, [2, 1]),
+        ({"target_currency": "BRL", "end": "2024-01-02T00:00:00Z"}, [1]),
+    ],
+)
+@pytest.mark.parametrize("pagination", ["page", "cursor"])
+def test_get_user_transactions_filtered(
+    client, user_1_token, mixed_transactions, filters, expected, pagination
+):
+    """Check if the filters select the rows with one query on the transactions"""
+    with CaptureQueriesContext(connection) as queries:
+        response = get_user_transactions(
+            client, user_1_token, {**filters, "pagination": pagination}
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert [row["id"] for row in body["data"]] == [
+        str(mixed_transactions[index].id) for index in expected
+    ]
+    transaction_queries = [
+        query["sql"]
+        for query in queries
+        if f'FROM "{Transaction._meta.db_table}"' in query["sql"]
+    ]
+    if pagination == "page":
+        # The counter is not the total of the filtered rows
+        assert body["total"] == len(expected)
+        assert len(transaction_queries) == 2
+        assert "COUNT(" in transaction_queries[0]
+    else:
+        assert len(transaction_queries) == 1
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {"source_currency": "XXX"},
+        {"start": "yesterday"},
+        {"min_source_amount": "a lot"},
+    ],
+)
+def test_get_user_transactions_with_an_invalid_filter(client, user_1_token, filters):
+    """Check if an invalid filter is rejected"""
+    response = get_user_transactions(client, user_1_token, filters)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert list(response.json()) == list(filters)
+
+
+def count_transaction_queries(queries) -> int:
+    return sum(
+        f'FROM "{Transaction._meta.db_table}"' in query["sql"] for query in queries
+    )
+
+
+@pytest.mark.parametrize(
+    "params", [{"page": 2, "page_size": 3}, {"pagination": "cursor"}]
+)
+def test_get_user_transactions_cached(client, user_1_token, transactions, params):
+    """Check if the first pages are served from the cache until the user writes"""
+    first = get_user_transactions(client, user_1_token, params)
+
+    with CaptureQueriesContext(connection) as queries:
+        cached = get_user_transactions(client, user_1_token, params)
+
+    assert cached.json() == first.json()
+    assert count_transaction_queries(queries) == 0
+    assert metrics.get_counter("transactions.list_cache.hit") == 1
+    assert metrics.get_gauge("transactions.list_cache.hit_ratio") == 0.5
+
+
+def test_get_user_transactions_cache_is_invalidated_by_writes(
+    client, user_1, user_1_token, transactions, django_capture_on_commit_callbacks
+):
+    """Check if a created or deleted transaction is listed right after the write"""
+    get_user_transactions(client, user_1_token)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        created = create_transaction(
+            user=user_1,
+            source_currency="EUR",
+            target_currency="USD",
+            source_amount=Decimal(1),
+            converted_amount=Decimal(1),
+            exchange_rate=Decimal(1),
+        )
+    data = get_user_transactions(client, user_1_token).json()["data"]
+    assert data[0]["id"] == str(created.id)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        delete_transactions(Transaction.objects.filter(id=created.id))
+    data = get_user_transactions(client, user_1_token).json()["data"]
+    assert data[0]["id"] == str(transactions[0].id)
+
+
+def test_get_user_transactions_later_pages_are_not_cached(
+    client, settings, user_1_token, transactions
+):
+    """Check if the pages after TRANSACTIONS_LIST_CACHE_PAGES are always read"""
+    settings.TRANSACTIONS_LIST_CACHE_PAGES = 1
+    with CaptureQueriesContext(connection) as first_queries:
+        get_user_transactions(client, user_1_token, {"page": 2, "page_size": 3})
+
+    with CaptureQueriesContext(connection) as queries:
+        get_user_transactions(client, user_1_token, {"page": 2, "page_size": 3})
+
+    assert count_transaction_queries(queries) == count_transaction_queries(first_queries)
+    assert count_transaction_queries(queries) > 0
+
+
+def test_get_user_transactions_not_modified(client, user_1_token, transactions):
+    """Check if a poll with the current ETag gets a 304 without reading the rows"""
+    first = get_user_transactions(client, user_1_token)
+    assert "no-cache" in first["Cache-Control"]
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(
+            path=reverse("transactions:get-user-transactions"),
+            HTTP_AUTHORIZATION=f"Bearer {user_1_token}",
+            HTTP_IF_NONE_MATCH=first["ETag"],
+        )
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+    assert count_transaction_queries(queries) == 0
+    assert metrics.get_counter("transactions.list_cache.hit") == 0
+
+
+def test_get_user_transactions_etag_changes_with_writes(
+    client, user_1, user_1_token, transactions, django_capture_on_commit_callbacks
+):
+    """Check if a write of the user makes the ETag of the previous poll stale"""
+    etag = get_user_transactions(client, user_1_token)["ETag"]
+    assert get_user_transactions(client, user_1_token, {"page_size": 3})["ETag"] != etag
+
+    with django_capture_on_commit_callbacks(execute=True):
+        delete_transactions(Transaction.objects.filter(id=transactions[0].id))
+    response = client.get(
+        path=reverse("transactions:get-user-transactions"),
+        HTTP_AUTHORIZATION=f"Bearer {user_1_token}",
+        HTTP_IF_NONE_MATCH=etag,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["ETag"] != etag
+
+
+@pytest.mark.parametrize("fast_serializer", [False, True])
+@pytest.mark.parametrize("pagination", ["page", "cursor"])
+def test_get_user_transactions_sparse_fields(
+    client, settings, user_1_token, transactions, fast_serializer, pagination
+):
+    """Check if only the requested fields are serialized and selected"""
+    settings.TRANSACTIONS_FAST_SERIALIZER = fast_serializer
+    with CaptureQueriesContext(connection) as queries:
+        response = get_user_transactions(
+            client,
+            user_1_token,
+            {"fields": "source_amount, id", "pagination": pagination, "page_size": 3},
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert body["data"][0] == {
+        "id": str(transactions[0].id),
+        "source_amount": f"{transactions[0].source_amount:.2f}",
+    }
+    (select,) = [
+        query["sql"]
+        for query in queries
+        if f'FROM "{Transaction._meta.db_table}"' in query["sql"]
+        and "COUNT(" not in query["sql"]
+    ]
+    columns = select.split(" FROM ")[0]
+    assert '"converted_amount"' not in columns
+    assert '"modified"' not in columns
+    if pagination == "cursor":
+        next_page = follow(client, user_1_token, body["next"]).json()
+        assert next_page["data"][0]["id"] == str(transactions[3].id)
+
+
+def test_get_user_transactions_unknown_fields(client, user_1_token):
+    """Check if unknown fields are rejected"""
+    response = get_user_transactions(
+        client, user_1_token, {"fields": "id,password,secret"}
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {
+        "fields": [
+            TransactionMessages.UNKNOWN_FIELDS.value.format(fields="password, secret")
+        ]
+    }
+
+
+def test_get_user_transactions_as_msgpack(client, user_1_token, transactions):
+    """Check if MessagePack is rendered when asked, with the same data as JSON"""
+    expected = get_user_transactions(client, user_1_token).json()
+
+    response = client.get(
+        path=reverse("transactions:get-user-transactions"),
+        HTTP_AUTHORIZATION=f"Bearer {user_1_token}",
+        HTTP_ACCEPT="application/msgpack",
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "application/msgpack"
+    assert msgpack.unpackb(response.content) == expected
+
+
+def test_get_user_transactions_compressed(client, user_1_token, transactions, settings):
+    """Check if the list is gzip encoded and its weak ETag still answers polls"""
+    settings.COMPRESSION_MIN_SIZE = 0
+    expected = get_user_transactions(client, user_1_token).json()
+
+    response = client.get(
+        path=reverse("transactions:get-user-transactions"),
+        HTTP_AUTHORIZATION=f"Bearer {user_1_token}",
+        HTTP_ACCEPT_ENCODING="gzip",
+    )
+    assert response["Content-Encoding"] == "gzip"
+    assert response["ETag"].startswith("W/")
+    assert json.loads(gzip.decompress(response.content)) == expected
+
+    response = client.get(
+        path=reverse("transactions:get-user-transactions"),
+        HTTP_AUTHORIZATION=f"Bearer {user_1_token}",
+        HTTP_ACCEPT_ENCODING="gzip",
+        HTTP_IF_NONE_MATCH=response["ETag"],
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
@@ -1,3 +1,5 @@
+from typing import Mapping
+
 from core.models import User
 from core.utils.use_cases.base import BaseUseCase
 from transactions.models import Transaction
@@ -5,11 +7,12 @@ from transactions.utils import get_transactions_for_user
 
 
 class GetUserTransactionsUseCase(BaseUseCase):
-    def execute(self, user: User) -> Transaction:
+    def execute(self, user: User, filters: Mapping | None = None) -> Transaction:
         """
         Get transactions for user
         Params:
             transaction_data: The user transaction info
+            filters: The TransactionFilter parameters
         Returns: The transactions of a user or empty list if user has not transactions yet
         """
-        return get_transactions_for_user(user)
+        return get_transactions_for_user(user, filters)
@@ -1,3 +1,7 @@
+from django.conf import settings
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from drf_spectacular.utils import extend_schema
 from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.permissions import IsAuthenticated
@@ -5,10 +9,19 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.utils.http.etag import make_etag
+from core.utils.pagination.cursor_mixin import KeysetCursorPagination
 from core.utils.pagination.get_paginated_response import get_paginated_response
 from core.utils.pagination.page_number_mixin import PageNumberPagination
 from transactions.enums.messages import TransactionMessages
-from transactions.v1.transactions.base_serializer import TransactionSerializer
+from transactions.filters import TransactionFilter
+from transactions.services.bookkeeping import get_transaction_count
+from transactions.services.list_cache import TransactionListCache
+from transactions.v1.transactions.base_serializer import (
+    FastTransactionSerializer,
+    TransactionSerializer,
+    get_requested_fields,
+)
 from transactions.v1.transactions.get_user_transactions.use_case import (
     GetUserTransactionsUseCase,
 )
@@ -16,6 +29,16 @@ from transactions.v1.transactions.get_user_transactions.use_case import (
 from .docs import docs
 
 
+def get_transactions_etag(request: Request, *args, **kwargs) -> str:
+    # The generation of the user changes with every write, like the cached pages
+    return make_etag(
+        request.user.id,
+        TransactionListCache.get_generation(request.user.id),
+        request.build_absolute_uri(),
+        request.META.get("HTTP_ACCEPT", ""),
+    )
+
+
 class GetUserTransactionsView(APIView):
     class Pagination(LimitOffsetPagination):
         default_limit = 1
@@ -23,16 +46,84 @@ class GetUserTransactionsView(APIView):
     permission_classes = (IsAuthenticated,)
 
     @extend_schema(**docs)
+    @method_decorator(condition(etag_func=get_transactions_etag))
     def get(self, request: Request) -> Response:
         """
-        Get user transactions data
+        Get user transactions data, by page number or by cursor when pagination=cursor
+        or a cursor is given, answering 304 when the If-None-Match ETag is current
         """
-        transactions = GetUserTransactionsUseCase().execute(user=request.user)
+        response = self.get_transactions(request)
+        # Clients revalidate their copy with the ETag on every poll
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ("Authorization", "Accept"))
+        return response
+
+    def get_transactions(self, request: Request) -> Response:
+        pagination_class = self.get_pagination_class(request)
+        if not self.is_cached_page(request, pagination_class):
+            return self.get_page(request, pagination_class)
+
+        # Read before the page, a write in between leaves the page in a past generation
+        user_id = request.user.id
+        generation = TransactionListCache.get_generation(user_id)
+        request_key = request.build_absolute_uri()
+        page = TransactionListCache.get_page(user_id, generation, request_key)
+        if page is not None:
+            return Response(page)
+
+        response = self.get_page(request, pagination_class)
+        TransactionListCache.set_page(user_id, generation, request_key, response.data)
+        return response
+
+    def get_page(self, request: Request, pagination_class) -> Response:
+        fields = get_requested_fields(request.query_params)
+        transactions = GetUserTransactionsUseCase().execute(
+            user=request.user, filters=request.query_params
+        )
+        serializer_class = TransactionSerializer
+        if settings.TRANSACTIONS_FAST_SERIALIZER:
+            serializer_class = FastTransactionSerializer
+        transactions = serializer_class.get_queryset(transactions, fields)
         return get_paginated_response(
-            pagination_class=PageNumberPagination,
-            serializer_class=TransactionSerializer,
+            pagination_class=pagination_class,
+            serializer_class=serializer_class,
+            serializer_kwargs={"fields": fields},
             queryset=transactions,
             request=request,
             view=self,
             message=TransactionMessages.GET_USER_TRANSACTION_SUCCESFULLY.value,
+            # The counter only knows the total of the unfiltered rows
+            count=(
+                get_transaction_count(request.user.id)
+                if pagination_class is PageNumberPagination
+                and not TransactionFilter.is_filtering(request.query_params)
+                else None
+            ),
         )
+
+    @staticmethod
+    def is_cached_page(request: Request, pagination_class) -> bool:
+        """
+        Whether the page is one of the first TRANSACTIONS_LIST_CACHE_PAGES pages
+        """
+        if pagination_class is KeysetCursorPagination:
+            return (
+                settings.TRANSACTIONS_LIST_CACHE_PAGES > 0
+                and KeysetCursorPagination.cursor_query_param not in request.query_params
+            )
+        try:
+            page_number = int(
+                request.query_params.get(PageNumberPagination.page_query_param, 1)
+            )
+        except ValueError:
+            return False
+        return 1 <= page_number <= settings.TRANSACTIONS_LIST_CACHE_PAGES
+
+    @staticmethod
+    def get_pagination_class(request: Request):
+        if (
+            request.query_params.get("pagination") == "cursor"
+            or KeysetCursorPagination.cursor_query_param in request.query_params
+        ):
+            return KeysetCursorPagination
+        return PageNumberPagination
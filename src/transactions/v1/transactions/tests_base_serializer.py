@@ -0,0 +1,149 @@
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from django.utils import timezone as django_timezone
+from rest_framework.renderers import JSONRenderer
+
+from core.utils.renderers.fast_json import FastJSONRenderer
+from transactions.models import Transaction
+from transactions.v1.transactions.base_serializer import (
+    FastTransactionSerializer,
+    TransactionSerializer,
+)
+
+
+def create_transactions(user, count):
+    rows = Transaction.objects.bulk_create(
+        Transaction(
+            user=user,
+            source_currency="EUR",
+            target_currency="JPY",
+            source_amount=Decimal(index) / 100,
+            converted_amount=Decimal(index * 1705) / 10,
+            exchange_rate=Decimal("170.5") + Decimal(index) / 10**6,
+        )
+        for index in range(count)
+    )
+    # Whole seconds are rendered without the microseconds
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for index, row in enumerate(rows):
+        row.created = start + timedelta(seconds=index, microseconds=index % 2 * 7)
+    Transaction.objects.bulk_update(rows, ["created"])
+    return rows
+
+
+def serialize(serializer_class, queryset):
+    """
+    Render the rows of a queryset as JSON
+    Args:
+        serializer_class: The serializer rendering the rows
+        queryset: The rows to serialize
+    Returns: The rendered JSON
+    """
+    if serializer_class is FastTransactionSerializer:
+        queryset = FastTransactionSerializer.get_queryset(queryset)
+    return JSONRenderer().render(serializer_class(queryset, many=True).data)
+
+
+@pytest.mark.django_db
+def test_fast_serializer_matches_the_model_serializer(user_1):
+    """Check if the fast serializer renders the same JSON as TransactionSerializer"""
+    create_transactions(user_1, 50)
+    queryset = Transaction.objects.filter(user=user_1)
+
+    assert serialize(FastTransactionSerializer, queryset) == serialize(
+        TransactionSerializer, queryset
+    )
+
+
+@pytest.mark.django_db
+def test_fast_serializer_uses_the_current_timezone(user_1):
+    """Check if the datetimes are rendered in the active timezone like DRF"""
+    create_transactions(user_1, 3)
+    queryset = Transaction.objects.filter(user=user_1)
+
+    with django_timezone.override("America/Sao_Paulo"):
+        fast = serialize(FastTransactionSerializer, queryset)
+        expected = serialize(TransactionSerializer, queryset)
+
+    assert fast == expected
+    assert b"-03:00" in fast
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db
+def test_fast_serializer_is_faster(user_1):
+    """
+    Check if the fast serializer reads and renders rows faster, the gap is wider on
+    PostgreSQL where the driver returns the column types without Django converters
+    """
+    create_transactions(user_1, 5000)
+    queryset = Transaction.objects.filter(user=user_1)
+
+    def best_time(serializer_class):
+        timings = []
+        for _ in range(7):
+            start = time.perf_counter()
+            serialize(serializer_class, queryset)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    model_time = best_time(TransactionSerializer)
+    fast_time = best_time(FastTransactionSerializer)
+
+    assert fast_time < model_time * 0.8, (
+        f"TransactionSerializer: {model_time:.4f}s, "
+        f"FastTransactionSerializer: {fast_time:.4f}s"
+    )
+
+
+@pytest.mark.django_db
+def test_fast_serializer_matches_the_model_serializer_with_fields(user_1):
+    """Check if both serializers render the same subset of fields"""
+    create_transactions(user_1, 5)
+    queryset = Transaction.objects.filter(user=user_1)
+    fields = ("user", "exchange_rate", "modified")
+
+    fast = FastTransactionSerializer(
+        FastTransactionSerializer.get_queryset(queryset, fields), fields=fields
+    ).data
+    expected = TransactionSerializer(
+        TransactionSerializer.get_queryset(queryset, fields), many=True, fields=fields
+    ).data
+
+    assert JSONRenderer().render(fast) == JSONRenderer().render(expected)
+    assert list(fast[0]) == list(fields)
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db
+def test_fast_renderer_is_faster(user_1):
+    """Check if a 50 row page is rendered faster and to the same bytes by orjson"""
+    create_transactions(user_1, 50)
+    data = {
+        "total": 50,
+        "current_page": 1,
+        "data": TransactionSerializer(
+            Transaction.objects.filter(user=user_1), many=True
+        ).data,
+    }
+
+    def best_time(renderer_class):
+        timings = []
+        for _ in range(7):
+            start = time.perf_counter()
+            for _ in range(100):
+                body = renderer_class().render(data)
+            timings.append(time.perf_counter() - start)
+        return min(timings), body
+
+    drf_time, drf_body = best_time(JSONRenderer)
+    fast_time, fast_body = best_time(FastJSONRenderer)
+
+    assert fast_body == drf_body
+    assert fast_time < drf_time * 0.5, (
+        f"JSONRenderer: {drf_time / 100 * 1000:.3f}ms, "
+        f"FastJSONRenderer: {fast_time / 100 * 1000:.3f}ms, {len(fast_body)} bytes"
+    )
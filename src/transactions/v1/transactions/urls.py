@@ -1,8 +1,17 @@
 from django.urls import path
 
+from transactions.v1.transactions.bulk_create_user_transactions.views import (
+    BulkCreateUserTransactionsView,
+)
 from transactions.v1.transactions.create_user_transaction.views import (
     CreateUserTransactionView,
 )
+from transactions.v1.transactions.export_user_transactions.views import (
+    ExportUserTransactionsView,
+)
+from transactions.v1.transactions.get_transactions_summary.views import (
+    GetTransactionsSummaryView,
+)
 from transactions.v1.transactions.get_user_transactions.views import (
     GetUserTransactionsView,
 )
@@ -18,4 +27,19 @@ urls = [
         CreateUserTransactionView.as_view(),
         name="create-transaction",
     ),
+    path(
+        "bulk-create-transactions",
+        BulkCreateUserTransactionsView.as_view(),
+        name="bulk-create-transactions",
+    ),
+    path(
+        "export-transactions",
+        ExportUserTransactionsView.as_view(),
+        name="export-transactions",
+    ),
+    path(
+        "get-transactions-summary",
+        GetTransactionsSummaryView.as_view(),
+        name="get-transactions-summary",
+    ),
 ]
@@ -1,7 +1,9 @@
 from django.urls import include, path
 
+from .exchange_rates.urls import urls as exchange_rates_urls
 from .transactions.urls import urls as transactions_urls
 
 urls = [
     path("", include(transactions_urls)),
+    path("", include(exchange_rates_urls)),
 ]